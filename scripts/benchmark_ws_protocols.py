@@ -0,0 +1,151 @@
+"""Compare JSON and MessagePack WebSocket frames for typical table messages.
+
+Reports encode time and frame size for a mid-hand ``table_state`` (the
+public ``to_payload`` shape at a 6-max table) and a ``hand_ended`` event.
+``transcode`` is the path broadcasts take for binary clients: the JSON frame
+that went through the fan-out is converted once per worker.
+
+Usage: python scripts/benchmark_ws_protocols.py [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from telegram_poker_bot.game_core.ws_codec import (  # noqa: E402
+    pack_message,
+    transcode,
+)
+from telegram_poker_bot.game_core.ws_sender import encode_message  # noqa: E402
+
+
+def table_state_message() -> dict:
+    """A public table state on the turn with four players still in."""
+    players = []
+    for seat in range(6):
+        players.append(
+            {
+                "user_id": 1000 + seat,
+                "seat": seat,
+                "stack": 9850 - seat * 375,
+                "bet": 400 if seat in (1, 3) else 0,
+                "in_hand": seat not in (2, 5),
+                "is_button": seat == 0,
+                "is_small_blind": seat == 1,
+                "is_big_blind": seat == 2,
+                "acted": seat != 4,
+                "display_name": f"player_{seat}",
+                "is_sitting_out_next_hand": False,
+                "hole_cards": [],
+                "is_ready": False,
+            }
+        )
+    return {
+        "type": "table_state",
+        "table_id": 42,
+        "hand_id": 317,
+        "status": "turn",
+        "street": "turn",
+        "board": ["Ah", "Td", "7c", "2s"],
+        "pot": 3650,
+        "pots": [
+            {"pot_index": 0, "amount": 2400, "eligible_user_ids": [1000, 1001, 1003, 1004]},
+            {"pot_index": 1, "amount": 1250, "eligible_user_ids": [1001, 1003]},
+        ],
+        "current_bet": 400,
+        "big_blind": 100,
+        "min_raise": 100,
+        "current_actor": 1004,
+        "current_actor_user_id": 1004,
+        "action_deadline": "2024-05-01T12:00:25.000000+00:00",
+        "turn_timeout_seconds": 25,
+        "players": players,
+        "hero": None,
+        "last_action": None,
+        "allowed_actions": [],
+        "allowed_actions_legacy": {},
+        "ready_players": [],
+        "hand_complete": False,
+        "phase": "playing",
+        "currency_type": "PLAY",
+        "template": {
+            "id": 7,
+            "table_type": "PERSISTENT",
+            "config": {"small_blind": 50, "big_blind": 100, "max_players": 6},
+            "has_waitlist": False,
+            "is_active": True,
+        },
+        "seq": 1289,
+    }
+
+
+def hand_ended_message() -> dict:
+    """A ``hand_ended`` event with a split pot."""
+    return {
+        "type": "hand_ended",
+        "table_id": 42,
+        "hand_no": 317,
+        "winners": [
+            {
+                "user_id": 1001,
+                "amount": 1825,
+                "pot_index": 0,
+                "hand_score": 3521,
+                "hand_rank": "two_pair",
+                "best_hand_cards": ["Ah", "As", "Td", "Tc", "7c"],
+                "rake_deducted": 0,
+            },
+            {
+                "user_id": 1003,
+                "amount": 1825,
+                "pot_index": 0,
+                "hand_score": 3521,
+                "hand_rank": "two_pair",
+                "best_hand_cards": ["Ad", "Ac", "Th", "Ts", "7c"],
+                "rake_deducted": 0,
+            },
+        ],
+        "rake_amount": 0,
+        "total_pot": 3650,
+        "next_hand_in": 5,
+        "status": "INTER_HAND_WAIT",
+        "inter_hand_wait_deadline": "2024-05-01T12:00:30.000000+00:00",
+        "allowed_actions": [],
+    }
+
+
+def benchmark(name: str, message: dict, iterations: int) -> None:
+    json_frame = encode_message(message)
+    msgpack_frame = pack_message(message)
+    timings = {
+        "json": timeit.timeit(lambda: encode_message(message), number=iterations),
+        "msgpack": timeit.timeit(lambda: pack_message(message), number=iterations),
+        "transcode": timeit.timeit(lambda: transcode(json_frame), number=iterations),
+    }
+    json_bytes = len(json_frame.encode())
+    print(f"{name}:")
+    print(f"  json       {json_bytes:6d} bytes  {timings['json'] / iterations * 1e6:8.2f} us")
+    print(
+        f"  msgpack    {len(msgpack_frame):6d} bytes  "
+        f"{timings['msgpack'] / iterations * 1e6:8.2f} us  "
+        f"({len(msgpack_frame) / json_bytes:.0%} of json)"
+    )
+    print(f"  transcode                {timings['transcode'] / iterations * 1e6:8.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    benchmark("table_state", table_state_message(), args.iterations)
+    benchmark("hand_ended", hand_ended_message(), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
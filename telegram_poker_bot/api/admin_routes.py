@@ -23,6 +23,7 @@ from telegram_poker_bot.shared.models import (
     CurrencyType,
     TransactionType,
 )
+from telegram_poker_bot.shared.services.analytics_service import hourly_counters
 from telegram_poker_bot.shared.services.insights_engine import get_insights_engine
 from telegram_poker_bot.shared.services.insights_delivery import (
     InsightsDeliveryService,
@@ -171,6 +172,7 @@ async def get_hourly_aggregates(
                 "total_hands": s.total_hands,
                 "activity_minutes": s.activity_minutes,
                 "metadata": s.metadata_json or {},
+                **hourly_counters(s),
             }
             for s in stats
         ],
@@ -251,6 +253,7 @@ async def get_historical_range(
                     "total_hands": s.total_hands,
                     "activity_minutes": s.activity_minutes,
                     "metadata": s.metadata_json or {},
+                    **hourly_counters(s),
                 }
                 for s in stats
             ],
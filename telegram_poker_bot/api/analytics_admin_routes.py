@@ -35,6 +35,7 @@ from telegram_poker_bot.shared.models import (
 )
 from telegram_poker_bot.game_core.manager import get_redis_client
 from telegram_poker_bot.shared.services.redis_analytics import get_redis_analytics
+from telegram_poker_bot.shared.services.analytics_service import hourly_counters
 from telegram_poker_bot.shared.services.outlier_detector import OutlierDetector
 from telegram_poker_bot.shared.services.rbac_middleware import require_admin, CurrentUser
 from telegram_poker_bot.shared.services.jwt_auth_service import get_jwt_auth_service, JWTAuthService
@@ -271,14 +272,18 @@ async def get_all_tables_live_metrics(
     )
     tables = tables_result.all()
     
-    tables_metrics = []
-    for table_id, status in tables:
-        metrics = await redis_analytics.get_all_table_metrics(table_id)
-        tables_metrics.append({
+    # One pipelined Redis round-trip for every table
+    all_metrics = await redis_analytics.get_tables_metrics(
+        table_id for table_id, _ in tables
+    )
+    tables_metrics = [
+        {
             "table_id": table_id,
             "status": status,
-            "metrics": metrics,
-        })
+            "metrics": all_metrics[table_id],
+        }
+        for table_id, status in tables
+    ]
     
     # Log admin query
     jwt_service = get_jwt_auth_service()
@@ -307,8 +312,9 @@ async def get_table_hourly_stats(
 ):
     """Get hourly aggregated statistics for a table.
     
-    Admin-only endpoint. Merges historical Postgres data with live Redis counters
-    for the current hour.
+    Admin-only endpoint. Hand counters of the current hour are live; player
+    averages are filled in when the hour is sealed. Live Redis metrics are
+    returned alongside.
     """
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
     
@@ -356,6 +362,7 @@ async def get_table_hourly_stats(
                 "total_hands": s.total_hands,
                 "activity_minutes": s.activity_minutes,
                 "metadata": s.metadata_json or {},
+                **hourly_counters(s),
             }
             for s in hourly_stats
         ],
@@ -563,24 +570,11 @@ async def get_table_stats(
     )
     hourly_stats = list(hourly_result.scalars().all())
     
-    # Get hand analytics summary
-    hands_result = await db.execute(
-        select(
-            func.count(HandAnalytics.id).label("total_hands"),
-            func.avg(HandAnalytics.total_pot).label("avg_pot"),
-            func.max(HandAnalytics.total_pot).label("max_pot"),
-            func.sum(HandAnalytics.rake).label("total_rake"),
-            func.avg(func.cast(HandAnalytics.multiway, Integer)).label("multiway_freq"),
-            func.avg(func.cast(HandAnalytics.went_to_showdown, Integer)).label("showdown_freq"),
-        )
-        .where(
-            and_(
-                HandAnalytics.table_id == table_id,
-                HandAnalytics.created_at >= cutoff_time,
-            )
-        )
-    )
-    hands_summary = hands_result.one_or_none()
+    # Summary from the live hourly hand counters
+    total_hands = sum(s.total_hands for s in hourly_stats)
+    
+    def per_hand(total: int) -> float:
+        return total / total_hands if total_hands else 0.0
     
     return {
         "table_id": table_id,
@@ -597,16 +591,17 @@ async def get_table_stats(
                 "total_hands": s.total_hands,
                 "activity_minutes": s.activity_minutes,
                 "metadata": s.metadata_json or {},
+                **hourly_counters(s),
             }
             for s in hourly_stats
         ],
         "summary": {
-            "total_hands": int(hands_summary[0]) if hands_summary and hands_summary[0] else 0,
-            "avg_pot": float(hands_summary[1]) if hands_summary and hands_summary[1] else 0.0,
-            "max_pot": int(hands_summary[2]) if hands_summary and hands_summary[2] else 0,
-            "total_rake": int(hands_summary[3]) if hands_summary and hands_summary[3] else 0,
-            "multiway_freq": float(hands_summary[4]) if hands_summary and hands_summary[4] else 0.0,
-            "showdown_freq": float(hands_summary[5]) if hands_summary and hands_summary[5] else 0.0,
+            "total_hands": total_hands,
+            "avg_pot": per_hand(sum(s.pot_sum for s in hourly_stats)),
+            "max_pot": max((s.max_pot for s in hourly_stats), default=0),
+            "total_rake": sum(s.rake_sum for s in hourly_stats),
+            "multiway_freq": per_hand(sum(s.multiway_hands for s in hourly_stats)),
+            "showdown_freq": per_hand(sum(s.showdown_hands for s in hourly_stats)),
         },
     }
 
@@ -865,8 +860,13 @@ async def get_leaderboards(
     
     if variant:
         query = query.where(LeaderboardSnapshot.variant == variant)
+    else:
+        # All-games board; per-variant boards share its snapshot_time
+        query = query.where(LeaderboardSnapshot.variant.is_(None))
     
-    query = query.order_by(LeaderboardSnapshot.snapshot_time.desc()).limit(1)
+    query = query.order_by(
+        LeaderboardSnapshot.snapshot_time.desc(), LeaderboardSnapshot.id.desc()
+    ).limit(1)
     
     result = await db.execute(query)
     snapshot = result.scalar_one_or_none()
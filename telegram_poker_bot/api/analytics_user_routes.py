@@ -13,6 +13,7 @@ from pydantic import BaseModel
 from sqlalchemy import select, and_, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from telegram_poker_bot.game_core.manager import get_redis_client
 from telegram_poker_bot.shared.database import get_db
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.models import (
@@ -22,6 +23,10 @@ from telegram_poker_bot.shared.models import (
     LeaderboardSnapshot,
     User,
 )
+from telegram_poker_bot.shared.services.leaderboard_service import (
+    LEADERBOARD_TYPES,
+    get_leaderboard_service,
+)
 
 logger = get_logger(__name__)
 
@@ -286,8 +291,13 @@ async def get_public_leaderboards(
     
     if variant:
         query = query.where(LeaderboardSnapshot.variant == variant)
+    else:
+        # All-games board; per-variant boards share its snapshot_time
+        query = query.where(LeaderboardSnapshot.variant.is_(None))
     
-    query = query.order_by(LeaderboardSnapshot.snapshot_time.desc()).limit(1)
+    query = query.order_by(
+        LeaderboardSnapshot.snapshot_time.desc(), LeaderboardSnapshot.id.desc()
+    ).limit(1)
     
     result = await db.execute(query)
     snapshot = result.scalar_one_or_none()
@@ -334,69 +344,44 @@ async def get_my_leaderboard_rank(
 ):
     """Get authenticated user's rank on leaderboard.
     
-    Returns user's current position and nearby players.
+    Returns user's current position and nearby players, read live from the
+    leaderboard sorted sets.
     """
-    # Get latest snapshot
-    query = select(LeaderboardSnapshot).where(
-        LeaderboardSnapshot.leaderboard_type == leaderboard_type
-    )
-    
-    if variant:
-        query = query.where(LeaderboardSnapshot.variant == variant)
-    
-    query = query.order_by(LeaderboardSnapshot.snapshot_time.desc()).limit(1)
-    
-    result = await db.execute(query)
-    snapshot = result.scalar_one_or_none()
-    
-    if not snapshot:
-        return {
-            "leaderboard_type": leaderboard_type,
-            "variant": variant,
-            "my_rank": None,
-            "nearby": [],
-        }
-    
-    # Find user's rank
-    my_ranking = None
-    for ranking in (snapshot.rankings or []):
-        if ranking.get("user_id") == user_id:
-            my_ranking = ranking
-            break
-    
-    if not my_ranking:
-        return {
-            "leaderboard_type": leaderboard_type,
-            "variant": variant,
-            "my_rank": None,
-            "nearby": [],
-        }
+    empty = {
+        "leaderboard_type": leaderboard_type,
+        "variant": variant,
+        "my_rank": None,
+        "nearby": [],
+    }
+    if leaderboard_type not in LEADERBOARD_TYPES:
+        return empty
     
-    # Get nearby players (±5 ranks)
-    my_rank = my_ranking.get("rank")
-    nearby = []
+    redis_client = await get_redis_client()
+    standing = await get_leaderboard_service(redis_client).get_rank(
+        leaderboard_type, user_id, variant=variant, radius=5
+    )
+    if not standing:
+        return empty
     
-    for ranking in (snapshot.rankings or []):
-        rank = ranking.get("rank")
-        if abs(rank - my_rank) <= 5:
-            # Get username
-            user_result = await db.execute(
-                select(User.username).where(User.id == ranking.get("user_id"))
-            )
-            user_row = user_result.one_or_none()
-            username = user_row[0] if user_row else "Anonymous"
-            
-            nearby.append({
-                "rank": rank,
-                "username": username,
-                "score": ranking.get("score"),
-                "is_me": ranking.get("user_id") == user_id,
-            })
+    # Usernames for the nearby players in one query
+    user_ids = [row["user_id"] for row in standing["nearby"]]
+    result = await db.execute(
+        select(User.id, User.username).where(User.id.in_(user_ids))
+    )
+    usernames = dict(result.all())
     
     return {
         "leaderboard_type": leaderboard_type,
         "variant": variant,
-        "my_rank": my_rank,
-        "my_score": my_ranking.get("score"),
-        "nearby": sorted(nearby, key=lambda x: x["rank"]),
+        "my_rank": standing["rank"],
+        "my_score": standing["score"],
+        "nearby": [
+            {
+                "rank": row["rank"],
+                "username": usernames.get(row["user_id"], "Anonymous"),
+                "score": row["score"],
+                "is_me": row["user_id"] == user_id,
+            }
+            for row in standing["nearby"]
+        ],
     }
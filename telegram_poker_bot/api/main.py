@@ -7,6 +7,7 @@ from uuid import UUID
 import asyncio
 import json
 import hmac
+import time
 import hashlib
 from urllib.parse import parse_qsl, urlparse
 
@@ -69,15 +70,69 @@ from telegram_poker_bot.shared.services import (
     table_service,
     table_lifecycle,
 )
+from telegram_poker_bot.shared.services.analytics_service import hourly_counters
 from telegram_poker_bot.shared.services.avatar_service import generate_avatar
 from telegram_poker_bot.shared.services.scheduler import get_analytics_scheduler
+from telegram_poker_bot.shared.services.admin_analytics_ws import (
+    get_admin_analytics_ws_manager,
+)
+from telegram_poker_bot.shared.services.analytics_event_bus import (
+    EVENT_SEAT_JOIN,
+    EVENT_SEAT_LEAVE,
+    EVENT_TIMEOUT,
+    AnalyticsEvent,
+    get_analytics_event_consumer,
+    queue_analytics_events,
+)
 from telegram_poker_bot.bot.i18n import get_translation
 from telegram_poker_bot.game_core import get_matchmaking_pool, get_redis_client
+from telegram_poker_bot.game_core.deadline_scheduler import (
+    TableTimerKind,
+    schedule_table_timer,
+)
+from telegram_poker_bot.game_core.ws_fanout import (
+    FRAME_DELTA,
+    FRAME_FULL,
+    KIND_CLOSE,
+    LOBBY_CHANNEL,
+    WebSocketFanout,
+    get_ws_fanout,
+    private_frame_label,
+    table_channel,
+)
+from telegram_poker_bot.game_core.state_stream import get_table_state_stream
+from telegram_poker_bot.game_core.ws_heartbeat import get_heartbeat_manager
+from telegram_poker_bot.game_core.lobby_stream import (
+    EVENT_REMOVED,
+    FRAME_BATCH,
+    LobbyChange,
+    LobbyCoalescer,
+    LobbyFilter,
+    LobbySubscription,
+    batch_message,
+    messages_for,
+    parse_batch_message,
+)
+from telegram_poker_bot.game_core.ws_codec import (
+    PROTOCOL_JSON,
+    FrameSet,
+    decode_frame,
+    encode_frame,
+    negotiate_protocol,
+    receive_frame,
+    send_message,
+)
+from telegram_poker_bot.game_core.ws_sender import (
+    WebSocketSender,
+    broadcast_metrics,
+    encode_message,
+)
 from telegram_poker_bot.game_core.pokerkit_runtime import (
     HandCompleteError,
     IllegalActionError,
     NoActorToActError,
     NotYourTurnError,
+    build_template_block,
     get_pokerkit_runtime_manager,
 )
 from telegram_poker_bot.api.admin_routes import admin_router
@@ -267,49 +322,117 @@ class SitOutRequest(BaseModel):
 
 # WebSocket connection manager
 class ConnectionManager:
-    """Manages WebSocket connections."""
+    """Manages WebSocket connections.
+
+    Sockets are local to this worker; broadcasts are also published through
+    the Redis fan-out so workers holding other sockets for the table relay
+    them (see ``game_core.ws_fanout``). Every socket is written through its
+    own bounded ``WebSocketSender`` queue, so one slow client never stalls
+    the table.
+    """
 
     def __init__(self):
-        self.active_connections: Dict[int, List[WebSocket]] = (
+        self.active_connections: Dict[int, Dict[WebSocket, WebSocketSender]] = (
             {}
-        )  # table_id -> [websockets]
+        )  # table_id -> {websocket: sender}
+        self.fanout: Optional[WebSocketFanout] = None
+
+    async def attach_fanout(self, fanout: WebSocketFanout) -> None:
+        """Enable cross-worker delivery for tables with local sockets."""
+        self.fanout = fanout
+        for table_id in list(self.active_connections):
+            await self._sync_subscription(table_id)
+
+    async def _sync_subscription(self, table_id: int) -> None:
+        """Subscribe to a table channel only while local sockets exist."""
+        if self.fanout is None:
+            return
+        channel = table_channel(table_id)
+        try:
+            if self.active_connections.get(table_id):
+                await self.fanout.subscribe(
+                    channel, lambda kind, frames: self._relay(table_id, kind, frames)
+                )
+            else:
+                await self.fanout.unsubscribe(channel)
+        except Exception as exc:
+            logger.warning(
+                "Failed to update table fan-out subscription",
+                table_id=table_id,
+                error=str(exc),
+            )
 
-    async def connect(self, websocket: WebSocket, table_id: int):
-        """Connect a WebSocket to a table."""
-        await websocket.accept()
-        if table_id not in self.active_connections:
-            self.active_connections[table_id] = []
-        self.active_connections[table_id].append(websocket)
-        logger.info("WebSocket connected", table_id=table_id)
+    async def _relay(self, table_id: int, kind: str, frames: Dict[str, str]):
+        """Deliver a message published by another worker."""
+        if kind == KIND_CLOSE:
+            await self._close_local_connections(table_id)
+        else:
+            self._broadcast_local(table_id, frames)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        table_id: int,
+        deltas: bool = False,
+        user_id: Optional[int] = None,
+        protocol: str = PROTOCOL_JSON,
+        subprotocol: Optional[str] = None,
+        hold: bool = False,
+    ) -> WebSocketSender:
+        """Connect a WebSocket to a table.
+
+        Sockets bound to a ``user_id`` also receive that player's
+        ``private_state`` messages. ``protocol`` selects JSON or MessagePack
+        frames; ``subprotocol`` is echoed back when the client negotiated one.
+        With ``hold`` the sender parks broadcasts until ``release`` so a
+        replay can be sent ahead of them.
+        """
+        await websocket.accept(subprotocol=subprotocol)
+        sender = WebSocketSender(
+            websocket,
+            on_closed=lambda s: self.disconnect(s.websocket, table_id),
+            deltas=deltas,
+            user_id=user_id,
+            protocol=protocol,
+        ).start()
+        if hold:
+            sender.hold()
+        self.active_connections.setdefault(table_id, {})[websocket] = sender
+        await self._sync_subscription(table_id)
+        logger.info(
+            "WebSocket connected",
+            table_id=table_id,
+            deltas=deltas,
+            user_id=user_id,
+            protocol=protocol,
+        )
+        return sender
 
     def disconnect(self, websocket: WebSocket, table_id: int):
         """Disconnect a WebSocket from a table."""
-        if table_id in self.active_connections:
-            self.active_connections[table_id].remove(websocket)
-            if not self.active_connections[table_id]:
+        connections = self.active_connections.get(table_id)
+        if connections is not None:
+            sender = connections.pop(websocket, None)
+            if sender is not None:
+                sender.stop()
+            if not connections:
                 del self.active_connections[table_id]
+                if self.fanout is not None:
+                    asyncio.create_task(self._sync_subscription(table_id))
         logger.info("WebSocket disconnected", table_id=table_id)
 
     async def broadcast(self, table_id: int, message: Dict[str, Any]):
-        """Broadcast message to all connections for a table."""
+        """Broadcast message to all connections for a table on every worker."""
+        started = time.perf_counter()
         message_type = message.get("type", "unknown")
-
-        if table_id not in self.active_connections:
-            logger.warning(
-                "Broadcast attempted but no connections exist",
-                table_id=table_id,
-                message_type=message_type,
-            )
-            return
-
-        connection_count = len(self.active_connections[table_id])
+        connections = self.active_connections.get(table_id, {})
 
         # Log broadcast details before sending
         logger.info(
             "Broadcasting WebSocket message",
             table_id=table_id,
             message_type=message_type,
-            recipient_count=connection_count,
+            recipient_count=len(connections),
             current_actor=message.get("current_actor"),
             allowed_actions_present=bool(message.get("allowed_actions")),
             status=message.get("status"),
@@ -321,7 +444,7 @@ class ConnectionManager:
             logger.info(
                 "Broadcasting hand_ended event to all clients",
                 table_id=table_id,
-                recipient_count=connection_count,
+                recipient_count=len(connections),
                 winners=message.get("winners", []),
                 pot_total=message.get("pot_total"),
                 allowed_actions=message.get("allowed_actions"),
@@ -331,37 +454,105 @@ class ConnectionManager:
                 ),
             )
 
-        disconnected = []
-        for connection in self.active_connections[table_id]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error("Error broadcasting", table_id=table_id, error=str(e))
-                disconnected.append(connection)
-
-        # Remove disconnected connections
-        for conn in disconnected:
-            self.disconnect(conn, table_id)
+        # Serialized once for every local socket and every other worker.
+        # Every message is sequenced and kept for resuming clients; table
+        # states are also encoded as a delta and come with one small private
+        # frame per seated player.
+        stream = await get_table_state_stream()
+        if message_type == "table_state":
+            state_frames = await stream.encode_update(table_id, message)
+            frames = {FRAME_FULL: state_frames.full}
+            if state_frames.delta is not None:
+                frames[FRAME_DELTA] = state_frames.delta
+            frames.update(
+                self._encode_private_frames(table_id, message, state_frames.seq)
+            )
+        else:
+            frames = {FRAME_FULL: await stream.encode_event(table_id, message)}
+        delivered, dropped = self._broadcast_local(table_id, frames)
+        broadcast_metrics.fanout.record(time.perf_counter() - started)
 
-        # Log successful broadcast completion
-        successful_count = connection_count - len(disconnected)
         logger.info(
             "Broadcast completed",
             table_id=table_id,
             message_type=message_type,
-            successful_recipients=successful_count,
-            failed_recipients=len(disconnected),
+            successful_recipients=delivered,
+            failed_recipients=dropped,
+            payload_bytes=len(frames[FRAME_FULL]),
+            delta_bytes=len(frames[FRAME_DELTA]) if FRAME_DELTA in frames else None,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
         )
 
+        if self.fanout is not None:
+            await self.fanout.publish(table_channel(table_id), frames)
+
+    @staticmethod
+    def _encode_private_frames(
+        table_id: int, message: Dict[str, Any], seq: Optional[int]
+    ) -> Dict[str, str]:
+        """Encode each seated player's private view of a public table state."""
+        try:
+            views = get_pokerkit_runtime_manager().render_private_views(
+                table_id, message
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to render private views", table_id=table_id, error=str(exc)
+            )
+            return {}
+        return {
+            private_frame_label(user_id): encode_message(
+                {
+                    "type": "private_state",
+                    "table_id": table_id,
+                    "seq": seq,
+                    "user_id": user_id,
+                    **view,
+                }
+            )
+            for user_id, view in views.items()
+        }
+
+    def _broadcast_local(
+        self, table_id: int, frames: Dict[str, str]
+    ) -> Tuple[int, int]:
+        """Queue encoded frames for this worker's connections for a table.
+
+        Binary clients share one MessagePack transcode of each frame.
+        """
+        delivered = dropped = 0
+        frame_set = FrameSet(frames)
+        has_delta = FRAME_DELTA in frames
+        for sender in list(self.active_connections.get(table_id, {}).values()):
+            label = FRAME_DELTA if sender.deltas and has_delta else FRAME_FULL
+            if sender.send(frame_set.get(label, sender.protocol)):
+                delivered += 1
+            else:
+                dropped += 1
+                continue
+            if sender.user_id is not None:
+                private_payload = frame_set.get(
+                    private_frame_label(sender.user_id), sender.protocol
+                )
+                if private_payload is not None:
+                    sender.send(private_payload)
+        return delivered, dropped
+
     async def close_all_connections(self, table_id: int):
         """Close all WebSocket connections for a table (e.g., when table is deleted)."""
-        if table_id not in self.active_connections:
+        await self._close_local_connections(table_id)
+        if self.fanout is not None:
+            await self.fanout.publish(table_channel(table_id), kind=KIND_CLOSE)
+
+    async def _close_local_connections(self, table_id: int):
+        """Close this worker's connections for a table."""
+        connections = self.active_connections.pop(table_id, None)
+        if not connections:
             return
 
-        connections = self.active_connections[table_id].copy()
-        for connection in connections:
+        for sender in list(connections.values()):
             try:
-                await connection.close()
+                await sender.close()
             except Exception as e:
                 logger.warning(
                     "Error closing WebSocket connection",
@@ -369,9 +560,9 @@ class ConnectionManager:
                     error=str(e),
                 )
 
-        # Clear all connections for this table
-        if table_id in self.active_connections:
-            del self.active_connections[table_id]
+        if self.fanout is not None:
+            # Scheduled separately: this may run inside the channel's relay task
+            asyncio.create_task(self._sync_subscription(table_id))
 
         logger.info(
             "Closed all WebSocket connections",
@@ -381,67 +572,156 @@ class ConnectionManager:
 
 
 class LobbyConnectionManager:
-    """Manage WebSocket connections for lobby-wide updates."""
+    """Manage WebSocket connections for lobby-wide updates.
+
+    Table changes are queued with ``queue_change`` and coalesced per table
+    for a short window (see ``game_core.lobby_stream``); each flush is
+    published once and every worker renders it per distinct subscription
+    (format and filter) of its sockets.
+    """
 
     def __init__(self) -> None:
-        self.connections: List[WebSocket] = []
+        self.connections: Dict[WebSocket, WebSocketSender] = {}
+        self.subscriptions: Dict[WebSocket, LobbySubscription] = {}
+        self.fanout: Optional[WebSocketFanout] = None
+        self.coalescer = LobbyCoalescer(self._publish_changes)
+
+    async def attach_fanout(self, fanout: WebSocketFanout) -> None:
+        """Relay lobby messages published by other workers."""
+        self.fanout = fanout
+
+        async def relay(kind: str, frames: Dict[str, str]) -> None:
+            if FRAME_BATCH in frames:
+                changes = parse_batch_message(json.loads(frames[FRAME_BATCH]))
+                self._deliver_changes(changes)
+            else:
+                self._broadcast_local(frames[FRAME_FULL])
+
+        # Lobby batches are unsequenced diffs: a dropped one is never repaired
+        await fanout.subscribe(LOBBY_CHANNEL, relay, lossless=True)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        protocol: str = PROTOCOL_JSON,
+        subprotocol: Optional[str] = None,
+        subscription: Optional[LobbySubscription] = None,
+    ) -> WebSocketSender:
+        await websocket.accept(subprotocol=subprotocol)
+        sender = WebSocketSender(
+            websocket,
+            on_closed=lambda s: self.disconnect(s.websocket),
+            protocol=protocol,
+        ).start()
+        self.connections[websocket] = sender
+        self.subscriptions[websocket] = subscription or LobbySubscription()
+        logger.info(
+            "Lobby WebSocket connected",
+            active=len(self.connections),
+            protocol=protocol,
+        )
+        return sender
 
-    async def connect(self, websocket: WebSocket) -> None:
-        await websocket.accept()
-        self.connections.append(websocket)
-        logger.info("Lobby WebSocket connected", active=len(self.connections))
+    def subscribe(self, websocket: WebSocket, subscription: LobbySubscription) -> None:
+        """Change the format and filter of a connected lobby socket."""
+        if websocket in self.connections:
+            self.subscriptions[websocket] = subscription
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.connections:
-            self.connections.remove(websocket)
+        sender = self.connections.pop(websocket, None)
+        self.subscriptions.pop(websocket, None)
+        if sender is not None:
+            sender.stop()
         logger.info("Lobby WebSocket disconnected", active=len(self.connections))
 
-    async def broadcast(self, message: Dict[str, Any]) -> None:
-        if not self.connections:
-            logger.debug(
-                "No lobby connections to broadcast", message_type=message.get("type")
-            )
-            return
+    def queue_change(self, table_id: int, change: LobbyChange) -> None:
+        """Queue a table change for the next coalesced lobby batch."""
+        self.coalescer.add(table_id, change)
 
-        payload_type = message.get("type", "unknown")
-        active_connections = list(self.connections)
+    async def _publish_changes(self, changes: Dict[int, LobbyChange]) -> None:
+        started = time.perf_counter()
+        delivered, failures = self._deliver_changes(changes)
+        broadcast_metrics.fanout.record(time.perf_counter() - started)
         logger.info(
-            "Broadcasting lobby message",
-            message_type=payload_type,
-            recipient_count=len(active_connections),
+            "Lobby batch sent",
+            tables=len(changes),
+            successful=delivered,
+            failed=failures,
         )
+        if self.fanout is not None:
+            await self.fanout.publish(
+                LOBBY_CHANNEL, {FRAME_BATCH: encode_message(batch_message(changes))}
+            )
 
-        failures = 0
-        for connection in active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as exc:  # pragma: no cover - defensive logging
+    def _deliver_changes(self, changes: Dict[int, LobbyChange]) -> Tuple[int, int]:
+        """Queue a batch for local sockets, rendered once per distinct view."""
+        delivered = failures = 0
+        rendered: Dict[Tuple[LobbySubscription, str], List[Any]] = {}
+        for websocket, sender in list(self.connections.items()):
+            subscription = self.subscriptions.get(websocket, LobbySubscription())
+            key = (subscription, sender.protocol)
+            frames = rendered.get(key)
+            if frames is None:
+                frames = rendered[key] = [
+                    encode_frame(message, sender.protocol)
+                    for message in messages_for(changes, subscription)
+                ]
+            if not frames:
+                continue
+            if all(sender.send(frame) for frame in frames):
+                delivered += 1
+            else:
                 failures += 1
-                logger.warning(
-                    "Lobby broadcast failed",
-                    message_type=payload_type,
-                    error=str(exc),
-                )
-        logger.info(
-            "Lobby broadcast complete",
-            message_type=payload_type,
-            successful=len(active_connections) - failures,
-            failed=failures,
-        )
+        return delivered, failures
+
+    async def broadcast(self, message: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        payload_type = message.get("type", "unknown")
+        payload = encode_message(message)
+
+        if self.connections:
+            logger.info(
+                "Broadcasting lobby message",
+                message_type=payload_type,
+                recipient_count=len(self.connections),
+            )
+            delivered, failures = self._broadcast_local(payload)
+            broadcast_metrics.fanout.record(time.perf_counter() - started)
+            logger.info(
+                "Lobby broadcast complete",
+                message_type=payload_type,
+                successful=delivered,
+                failed=failures,
+            )
+        else:
+            logger.debug("No lobby connections to broadcast", message_type=payload_type)
+
+        if self.fanout is not None:
+            await self.fanout.publish(LOBBY_CHANNEL, {FRAME_FULL: payload})
+
+    def _broadcast_local(self, payload: str) -> Tuple[int, int]:
+        delivered = failures = 0
+        frame_set = FrameSet({FRAME_FULL: payload})
+        for sender in list(self.connections.values()):
+            if sender.send(frame_set.get(FRAME_FULL, sender.protocol)):
+                delivered += 1
+            else:
+                failures += 1
+        return delivered, failures
 
     async def close_all(self) -> None:
         if not self.connections:
             return
 
-        connections = list(self.connections)
+        senders = list(self.connections.values())
         self.connections.clear()
-        for connection in connections:
+        self.subscriptions.clear()
+        for sender in senders:
             try:
-                await connection.close()
+                await sender.close()
             except Exception as exc:
                 logger.warning("Failed to close lobby socket", error=str(exc))
 
-
 manager = ConnectionManager()
 lobby_manager = LobbyConnectionManager()
 
@@ -486,27 +766,21 @@ async def _attach_template_to_payload(
 
     sanitized = _prune_legacy_rule_fields(payload)
 
-    result = await db.execute(
-        select(Table).options(joinedload(Table.template)).where(Table.id == table_id)
-    )
-    table = result.scalar_one_or_none()
+    template_block = get_pokerkit_runtime_manager().get_template_block(table_id)
+    if template_block is None:
+        result = await db.execute(
+            select(Table).options(joinedload(Table.template)).where(Table.id == table_id)
+        )
+        table = result.scalar_one_or_none()
 
-    if not table or not table.template:
-        return sanitized
-
-    config_json = table.template.config_json or {}
-    backend_config = config_json.get("backend", config_json)
-    template_block = {
-        "id": str(table.template.id),
-        "table_type": table.template.table_type.value,
-        "config": backend_config,
-        "config_json": config_json,
-        "has_waitlist": table.template.has_waitlist,
-        "is_active": getattr(table.template, "is_active", True),
-    }
+        if not table or not table.template:
+            return sanitized
+
+        template_block = build_template_block(table.template)
 
+    backend_config = template_block["config"]
     sanitized["template"] = template_block
-    sanitized.setdefault("table_id", table.id)
+    sanitized.setdefault("table_id", table_id)
     if sanitized.get("table_name") is None:
         sanitized["table_name"] = backend_config.get("table_name")
 
@@ -514,7 +788,7 @@ async def _attach_template_to_payload(
     if isinstance(nested_state, dict):
         nested_state_clean = _prune_legacy_rule_fields(nested_state)
         nested_state_clean["template"] = template_block
-        nested_state_clean.setdefault("table_id", table.id)
+        nested_state_clean.setdefault("table_id", table_id)
         if nested_state_clean.get("table_name") is None:
             nested_state_clean["table_name"] = backend_config.get("table_name")
         sanitized["state"] = nested_state_clean
@@ -527,13 +801,13 @@ async def _broadcast_lobby_table_update(
 ) -> None:
     """Send lobby-wide notification when a table expires or ends."""
 
-    await lobby_manager.broadcast(
-        {
-            "type": "TABLE_REMOVED",
-            "table_id": table_id,
-            "status": getattr(status, "value", str(status)).lower(),
-            "reason": reason,
-        }
+    lobby_manager.queue_change(
+        table_id,
+        LobbyChange(
+            EVENT_REMOVED,
+            status=getattr(status, "value", str(status)).lower(),
+            reason=reason,
+        ),
     )
 
 
@@ -544,7 +818,10 @@ async def _broadcast_lobby_table_event(
     *,
     table_payload: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Broadcast table updates to the lobby (public tables only)."""
+    """Queue a table update for the lobby (public tables only).
+
+    Updates are coalesced per table and sent in the next lobby batch.
+    """
 
     payload = table_payload
     if payload is None:
@@ -559,7 +836,7 @@ async def _broadcast_lobby_table_event(
         return
 
     try:
-        await lobby_manager.broadcast({"type": event_type, "table": payload})
+        lobby_manager.queue_change(table_id, LobbyChange(event_type, table=payload))
     except Exception as exc:
         logger.exception(
             "Failed to broadcast lobby table event",
@@ -573,9 +850,12 @@ table_lifecycle.register_table_status_listener(_broadcast_lobby_table_update)
 
 
 _auto_fold_task: Optional[asyncio.Task] = None
-_inactivity_check_task: Optional[asyncio.Task] = None
-_sng_monitor_task: Optional[asyncio.Task] = None
-_inter_hand_monitor_task: Optional[asyncio.Task] = None
+_table_timer_task: Optional[asyncio.Task] = None
+
+# Re-check interval for table timers while an admin pause toggle is active
+TABLE_TIMER_PAUSED_RETRY_SECONDS = 5
+# Backoff before re-running a table timer whose handler failed
+TABLE_TIMER_RETRY_SECONDS = 5
 
 
 async def _handle_inter_hand_result(table_id: int, result: Dict[str, Any]) -> None:
@@ -640,742 +920,737 @@ async def _handle_inter_hand_result(table_id: int, result: Dict[str, Any]) -> No
             await manager.broadcast(table_id, state)
 
 
-async def monitor_inter_hand_timeouts():
+async def _process_inter_hand_timer(
+    db: AsyncSession, table_id: int, now: datetime
+) -> None:
     """
-    Background task that monitors inter-hand timeouts and auto-completes phases.
-
-    This is a stateless, database-driven replacement for the old in-memory task system.
-    - Polls database every 5 seconds for tables in INTER_HAND_WAIT status
-    - Uses distributed lock to prevent duplicate execution in multi-worker environments
-    - Checks Table.last_action_at to determine if timeout has expired
-    - Automatically advances to next hand when timeout expires
-    - Race-safe with proper state checks
-    - Respects system toggle pause_interhand_monitor for emergency brake
-
-    Design Notes:
-    - Survives server restarts and worker process cycles
-    - No in-memory state that can be lost
-    - Multiple workers can run safely (only one processes at a time via Redis lock)
-    - Template relationship is eagerly loaded to avoid greenlet_spawn errors
+    Complete the inter-hand phase once the post-hand delay has elapsed.
+
+    Registered when a hand ends (see ``PokerKitTableRuntimeManager.handle_action``).
+    Table.last_action_at stays the source of truth: an early wake-up is
+    rescheduled and a table no longer in INTER_HAND_WAIT is ignored.
+    Respects system toggle pause_interhand_monitor for emergency brake.
     """
-    from telegram_poker_bot.shared.database import get_db_session
     from telegram_poker_bot.api.admin_routes import is_interhand_monitor_paused
 
-    LOCK_KEY = "lock:monitor_inter_hand"
-    LOCK_TTL = 30  # Lock expires after 30 seconds (sufficient for DB operations)
-    POLL_INTERVAL = 5  # Check every 5 seconds
+    if await is_interhand_monitor_paused():
+        await schedule_table_timer(
+            table_id,
+            TableTimerKind.INTER_HAND,
+            at=now + timedelta(seconds=TABLE_TIMER_PAUSED_RETRY_SECONDS),
+        )
+        return
 
-    logger.info(
-        "Inter-hand timeout monitor started",
-        poll_interval=POLL_INTERVAL,
-        timeout_threshold=settings.post_hand_delay_seconds,
+    # Query scalar columns to avoid async lazy-loads in logging.
+    result = await db.execute(
+        select(
+            Hand.id.label("hand_id"),
+            Hand.hand_no.label("hand_no"),
+            Table.last_action_at.label("last_action_at"),
+        )
+        .join(Table, Hand.table_id == Table.id)
+        .where(
+            Hand.table_id == table_id,
+            Hand.status == HandStatus.INTER_HAND_WAIT,
+            Table.status == TableStatus.ACTIVE,
+        )
     )
+    row = result.first()
+    if row is None:
+        return
 
-    while True:
-        try:
-            await asyncio.sleep(POLL_INTERVAL)
-
-            # Check if monitor is paused via admin toggle (async Redis call)
-            if await is_interhand_monitor_paused():
-                continue
-
-            redis_client = await get_redis_client()
-            lock_acquired = await redis_client.set(LOCK_KEY, "1", nx=True, ex=LOCK_TTL)
-
-            if not lock_acquired:
-                logger.debug("Inter-hand monitor lock held by another worker, skipping")
-                continue
-
-            try:
-                now = datetime.now(timezone.utc)
-
-                async with get_db_session() as db:
-                    # Query scalar columns to avoid async lazy-loads in logging.
-                    result = await db.execute(
-                        select(
-                            Hand.id.label("hand_id"),
-                            Hand.hand_no.label("hand_no"),
-                            Table.id.label("table_id"),
-                            Table.last_action_at.label("last_action_at"),
-                        )
-                        .join(Table, Hand.table_id == Table.id)
-                        .where(
-                            Hand.status == HandStatus.INTER_HAND_WAIT,
-                            Table.status == TableStatus.ACTIVE,
-                        )
-                    )
-                    hands_with_tables = result.all()
+    if not row.last_action_at:
+        logger.warning(
+            "Table in INTER_HAND_WAIT but no last_action_at",
+            table_id=table_id,
+            hand_no=row.hand_no,
+        )
+        return
 
-                    logger.debug(
-                        "Inter-hand monitor tick",
-                        tables_found=len(hands_with_tables),
-                        timestamp=now.isoformat(),
-                    )
+    timeout_threshold = settings.post_hand_delay_seconds
+    due_at = row.last_action_at + timedelta(seconds=timeout_threshold)
+    if now < due_at:
+        await schedule_table_timer(table_id, TableTimerKind.INTER_HAND, at=due_at)
+        return
 
-                    for row in hands_with_tables:
-                        hand_id = row.hand_id
-                        hand_no = row.hand_no
-                        table_id = row.table_id
-                        last_action_at = row.last_action_at
-                        try:
-                            # Check if timeout has expired
-                            if not last_action_at:
-                                logger.warning(
-                                    "Table in INTER_HAND_WAIT but no last_action_at",
-                                    table_id=table_id,
-                                    hand_no=hand_no,
-                                )
-                                continue
-
-                            time_since_last_action = (
-                                now - last_action_at
-                            ).total_seconds()
-
-                            timeout_threshold = settings.post_hand_delay_seconds
-
-                            # Log computed timeout for diagnostics
-                            logger.debug(
-                                "Inter-hand timeout check",
-                                table_id=table_id,
-                                hand_no=hand_no,
-                                time_since_last_action=round(time_since_last_action, 2),
-                                timeout_threshold=timeout_threshold,
-                                will_trigger=time_since_last_action > timeout_threshold,
-                            )
+    logger.info(
+        "Inter-hand timeout expired, auto-completing",
+        table_id=table_id,
+        hand_no=row.hand_no,
+        time_since_last_action=round((now - row.last_action_at).total_seconds(), 2),
+        timeout_threshold=timeout_threshold,
+    )
 
-                            if time_since_last_action > timeout_threshold:
-                                logger.info(
-                                    "Inter-hand timeout expired, auto-completing",
-                                    table_id=table_id,
-                                    hand_no=hand_no,
-                                    time_since_last_action=round(time_since_last_action, 2),
-                                    timeout_threshold=timeout_threshold,
-                                )
-
-                                # Call runtime manager to complete inter-hand phase
-                                runtime_mgr = get_pokerkit_runtime_manager()
-                                inter_hand_result = await runtime_mgr.complete_inter_hand_phase(
-                                    db, table_id
-                                )
-                                await db.commit()
-
-                                # Broadcast the result
-                                await _handle_inter_hand_result(table_id, inter_hand_result)
-
-                                logger.info(
-                                    "Inter-hand phase auto-completed successfully",
-                                    table_id=table_id,
-                                    hand_no=hand_no,
-                                    result_keys=list(inter_hand_result.keys()) if inter_hand_result else [],
-                                )
-
-                        except Exception as e:
-                            # Log full stack trace for debugging (exception() includes traceback)
-                            logger.exception(
-                                "Error processing inter-hand timeout for table",
-                                table_id=table_id,
-                                hand_id=hand_id,
-                                hand_no=hand_no,
-                                error=str(e),
-                            )
-                            # Rollback any partial changes for this table
-                            await db.rollback()
-                            # Continue to next table - don't let one table failure stop others
+    runtime_mgr = get_pokerkit_runtime_manager()
+    inter_hand_result = await runtime_mgr.complete_inter_hand_phase(db, table_id)
+    await db.commit()
 
-            finally:
-                await redis_client.delete(LOCK_KEY)
+    await _handle_inter_hand_result(table_id, inter_hand_result)
 
-        except asyncio.CancelledError:
-            logger.info("Inter-hand timeout monitor cancelled")
-            break
-        except Exception as e:
-            # Log full stack trace for main loop errors and continue (exception() includes traceback)
-            logger.exception(
-                "Error in inter-hand timeout monitor main loop - continuing",
-                error=str(e),
-            )
-            # Continue the loop - don't let transient errors kill the monitor
+    logger.info(
+        "Inter-hand phase auto-completed successfully",
+        table_id=table_id,
+        hand_no=row.hand_no,
+        result_keys=list(inter_hand_result.keys()) if inter_hand_result else [],
+    )
 
 
-async def check_table_inactivity():
+async def _evaluate_table_lifecycle(
+    db: AsyncSession, table: Table, now: datetime
+) -> None:
     """
-    Background task that manages table lifecycle.
+    Apply inactivity/lifecycle rules to a single table.
 
-    CRITICAL LOGIC CHANGES:
+    CRITICAL LOGIC:
     1. PUBLIC DESKS (is_public_desk) NEVER expire or get deleted regardless of emptiness
     2. Persistent tables (Lobby/Cash) NEVER expire when empty - they PAUSE to WAITING
     3. SNG/Tournament tables retain original cleanup logic
-    
+
     PUBLIC DESK RULES:
     - MUST NEVER be marked EXPIRED/ENDED by automation
     - MUST NEVER be deleted/cleaned up automatically
     - If <2 active players: PAUSE to WAITING (not end or expire)
     - Survival condition is based on seated_players (not playing_count)
     """
-    from telegram_poker_bot.shared.database import get_db_session
     from telegram_poker_bot.shared.services import table_lifecycle
 
-    LOCK_KEY = "background:check_table_inactivity"
-    LOCK_TTL = 25
+    # --- STEP 1: IDENTIFY TABLE TYPE ---
+    # Check if this is a public desk first (highest priority immunity)
+    is_public_desk_table = table_lifecycle.is_public_desk(table)
 
-    logger.info("Table inactivity check task started")
+    # Use the canonical is_persistent_table function
+    is_persistent = await table_lifecycle.is_persistent_table(table)
 
-    while True:
-        try:
-            await asyncio.sleep(10)  # Check every 10 seconds for responsiveness
+    # Count active players (seated and not left)
+    seats_result = await db.execute(
+        select(Seat).where(
+            Seat.table_id == table.id,
+            Seat.left_at.is_(None),
+        )
+    )
+    active_seats = list(seats_result.scalars())
+    seated_count = len(active_seats)
 
-            redis_client = await get_redis_client()
-            lock_acquired = await redis_client.set(LOCK_KEY, "1", nx=True, ex=LOCK_TTL)
+    # Count strictly active players (not sitting out next hand)
+    # This determines if a game can logically proceed
+    playing_count = len([s for s in active_seats if not s.is_sitting_out_next_hand])
 
-            if not lock_acquired:
-                continue
+    # Log lifecycle check for debugging
+    logger.debug(
+        "Lifecycle check for table",
+        table_id=table.id,
+        status=table.status.value if table.status else None,
+        is_public_desk=is_public_desk_table,
+        is_persistent=is_persistent,
+        seated_count=seated_count,
+        playing_count=playing_count,
+    )
 
-            try:
-                now = datetime.now(timezone.utc)
+    # --- PUBLIC DESK SPECIAL HANDLING ---
+    # PUBLIC DESKS NEVER expire/delete - only pause to WAITING
+    if is_public_desk_table:
+        if table.status == TableStatus.ACTIVE and playing_count < 2:
+            # FIX: Check if there's an active hand before pausing
+            # We must NOT pause mid-hand because players set is_sitting_out_next_hand
+            # during river/showdown - they should complete the current hand first.
+            active_hand = await db.scalar(
+                select(Hand).where(
+                    Hand.table_id == table.id,
+                    Hand.status.notin_([HandStatus.ENDED])
+                ).order_by(Hand.hand_no.desc()).limit(1)
+            )
+            if active_hand:
+                # Hand still in progress (including INTER_HAND_WAIT)
+                # Don't pause - let the hand complete naturally
+                logger.debug(
+                    "Skipping PUBLIC DESK pause - hand in progress",
+                    table_id=table.id,
+                    hand_no=active_hand.hand_no,
+                    hand_status=active_hand.status.value,
+                    playing_count=playing_count,
+                )
+                return
 
-                async with get_db_session() as db:
-                    # Fetch all tables that are not already dead
-                    result = await db.execute(
-                        select(Table)
-                        .options(joinedload(Table.template))
-                        .where(
-                            Table.status.in_([TableStatus.ACTIVE, TableStatus.WAITING])
-                        )
-                    )
-                    tables = list(result.scalars())
+            # No active hand - safe to PAUSE to WAITING (never delete)
+            logger.info(
+                "Pausing PUBLIC DESK table (insufficient active players)",
+                table_id=table.id,
+                is_public_desk=True,
+                seated_count=seated_count,
+                playing_count=playing_count,
+            )
+            table.status = TableStatus.WAITING
+            table.last_action_at = now
+            await db.commit()
 
-                    for table in tables:
-                        try:
-                            # --- STEP 1: IDENTIFY TABLE TYPE ---
-                            # Check if this is a public desk first (highest priority immunity)
-                            is_public_desk_table = table_lifecycle.is_public_desk(table)
-                            
-                            # Use the canonical is_persistent_table function
-                            is_persistent = await table_lifecycle.is_persistent_table(
-                                table
-                            )
+            await manager.broadcast(table.id, {
+                "type": "table_paused",
+                "status": "waiting",
+                "message": "Waiting for players..."
+            })
+            await schedule_table_timer(table.id, TableTimerKind.AUTOSTART)
+        # Public desks never expire/delete
+        return
 
-                            # Count active players (seated and not left)
-                            seats_result = await db.execute(
-                                select(Seat).where(
-                                    Seat.table_id == table.id,
-                                    Seat.left_at.is_(None),
-                                )
-                            )
-                            active_seats = list(seats_result.scalars())
-                            seated_count = len(active_seats)
-                            
-                            # Count strictly active players (not sitting out next hand)
-                            # This determines if a game can logically proceed
-                            playing_count = len(
-                                [
-                                    s
-                                    for s in active_seats
-                                    if not s.is_sitting_out_next_hand
-                                ]
-                            )
-                            
-                            # Log lifecycle check for debugging
-                            logger.debug(
-                                "Lifecycle check for table",
-                                table_id=table.id,
-                                status=table.status.value if table.status else None,
-                                is_public_desk=is_public_desk_table,
-                                is_persistent=is_persistent,
-                                seated_count=seated_count,
-                                playing_count=playing_count,
-                            )
+    # --- STEP 2: HANDLE "WAITING" TABLES ---
+    if table.status == TableStatus.WAITING:
+        # RULE: Persistent tables NEVER expire due to emptiness
+        if is_persistent:
+            return
 
-                            # --- PUBLIC DESK SPECIAL HANDLING ---
-                            # PUBLIC DESKS NEVER expire/delete - only pause to WAITING
-                            if is_public_desk_table:
-                                if table.status == TableStatus.ACTIVE and playing_count < 2:
-                                    # FIX: Check if there's an active hand before pausing
-                                    # We must NOT pause mid-hand because players set is_sitting_out_next_hand
-                                    # during river/showdown - they should complete the current hand first.
-                                    active_hand = await db.scalar(
-                                        select(Hand).where(
-                                            Hand.table_id == table.id,
-                                            Hand.status.notin_([HandStatus.ENDED])
-                                        ).order_by(Hand.hand_no.desc()).limit(1)
-                                    )
-                                    if active_hand:
-                                        # Hand still in progress (including INTER_HAND_WAIT)
-                                        # Don't pause - let the hand complete naturally
-                                        logger.debug(
-                                            "Skipping PUBLIC DESK pause - hand in progress",
-                                            table_id=table.id,
-                                            hand_no=active_hand.hand_no,
-                                            hand_status=active_hand.status.value,
-                                            playing_count=playing_count,
-                                        )
-                                        continue
-                                    
-                                    # No active hand - safe to PAUSE to WAITING (never delete)
-                                    logger.info(
-                                        "Pausing PUBLIC DESK table (insufficient active players)",
-                                        table_id=table.id,
-                                        is_public_desk=True,
-                                        seated_count=seated_count,
-                                        playing_count=playing_count,
-                                    )
-                                    table.status = TableStatus.WAITING
-                                    table.last_action_at = now
-                                    await db.commit()
-
-                                    await manager.broadcast(table.id, {
-                                        "type": "table_paused",
-                                        "status": "waiting",
-                                        "message": "Waiting for players..."
-                                    })
-                                # Public desks always continue - never expire/delete
-                                continue
-
-                            # --- STEP 2: HANDLE "WAITING" TABLES ---
-                            if table.status == TableStatus.WAITING:
-                                # RULE: Persistent tables NEVER expire due to emptiness
-                                if is_persistent:
-                                    continue
-
-                                # RULE: Regular SNGs expire if empty for too long
-                                if not active_seats:
-                                    reason = "no active players remaining"
-                                    await table_lifecycle.mark_table_expired(
-                                        db, table, reason
-                                    )
-                                    await manager.broadcast(
-                                        table.id,
-                                        {"type": "table_removed", "reason": reason},
-                                    )
-                                    await manager.close_all_connections(table.id)
-                                    continue
-
-                            # --- STEP 3: HANDLE "ACTIVE" TABLES ---
-                            # Logic for ACTIVE Tables
-                            if table.status == TableStatus.ACTIVE:
-                                # 1. Check if hand is running (Don't kill mid-hand)
-                                active_hand = await db.scalar(
-                                    select(Hand).where(
-                                        Hand.table_id == table.id,
-                                        Hand.status.notin_([HandStatus.ENDED, HandStatus.SHOWDOWN])
-                                    )
-                                )
-                                if active_hand:
-                                    continue
-
-                                # 2. Check Player Count
-                                if playing_count < 2:
-                                    # 3. Apply persistence-based lifecycle rules
-                                    if is_persistent:
-                                        # PAUSE instead of END
-                                        logger.info(
-                                            "Pausing persistent table (insufficient players)",
-                                            table_id=table.id,
-                                            is_persistent=True,
-                                            seated_count=seated_count,
-                                            playing_count=playing_count,
-                                        )
-                                        table.status = TableStatus.WAITING
-                                        table.last_action_at = now
-                                        await db.commit()
-
-                                        await manager.broadcast(table.id, {
-                                            "type": "table_paused",
-                                            "status": "waiting",
-                                            "message": "Waiting for players..."
-                                        })
-                                        continue
-                                    
-                                    # DELETE (Only for SNGs)
-                                    await table_lifecycle.mark_table_completed_and_cleanup(
-                                        db, table, "insufficient players"
-                                    )
-                                    await manager.close_all_connections(table.id)
-                                    continue
-
-                            # --- STEP 4: GENERIC LIFECYCLE CHECKS ---
-                            # (Only for non-persistent tables)
-                            if not is_persistent:
-                                was_expired, reason = (
-                                    await table_lifecycle.check_and_enforce_lifecycle(
-                                        db, table
-                                    )
-                                )
-                                if was_expired:
-                                    await manager.close_all_connections(table.id)
-
-                        except Exception as e:
-                            logger.error(
-                                "Error checking inactivity for table",
-                                table_id=table.id,
-                                error=str(e),
-                            )
+        # RULE: Regular SNGs expire if empty for too long
+        if not active_seats:
+            reason = "no active players remaining"
+            await table_lifecycle.mark_table_expired(db, table, reason)
+            await manager.broadcast(
+                table.id,
+                {"type": "table_removed", "reason": reason},
+            )
+            await manager.close_all_connections(table.id)
+            return
 
-                    await db.commit()
-            finally:
-                await redis_client.delete(LOCK_KEY)
+    # --- STEP 3: HANDLE "ACTIVE" TABLES ---
+    # Logic for ACTIVE Tables
+    if table.status == TableStatus.ACTIVE:
+        # 1. Check if hand is running (Don't kill mid-hand)
+        active_hand = await db.scalar(
+            select(Hand).where(
+                Hand.table_id == table.id,
+                Hand.status.notin_([HandStatus.ENDED, HandStatus.SHOWDOWN])
+            )
+        )
+        if active_hand:
+            return
 
-        except asyncio.CancelledError:
-            logger.info("Table inactivity check task cancelled")
-            break
-        except Exception as e:
-            logger.error("Error in table inactivity check task", error=str(e))
+        # 2. Check Player Count
+        if playing_count < 2:
+            # 3. Apply persistence-based lifecycle rules
+            if is_persistent:
+                # PAUSE instead of END
+                logger.info(
+                    "Pausing persistent table (insufficient players)",
+                    table_id=table.id,
+                    is_persistent=True,
+                    seated_count=seated_count,
+                    playing_count=playing_count,
+                )
+                table.status = TableStatus.WAITING
+                table.last_action_at = now
+                await db.commit()
+
+                await manager.broadcast(table.id, {
+                    "type": "table_paused",
+                    "status": "waiting",
+                    "message": "Waiting for players..."
+                })
+                await schedule_table_timer(table.id, TableTimerKind.AUTOSTART)
+                return
+
+            # DELETE (Only for SNGs)
+            await table_lifecycle.mark_table_completed_and_cleanup(
+                db, table, "insufficient players"
+            )
+            await manager.close_all_connections(table.id)
+            return
 
+    # --- STEP 4: GENERIC LIFECYCLE CHECKS ---
+    # (Only for non-persistent tables)
+    if not is_persistent:
+        was_expired, reason = (
+            await table_lifecycle.check_and_enforce_lifecycle(
+                db, table
+            )
+        )
+        if was_expired:
+            await manager.close_all_connections(table.id)
 
-async def auto_fold_expired_actions():
+
+async def _process_lifecycle_timer(
+    db: AsyncSession, table_id: int, now: datetime
+) -> None:
+    """
+    Run lifecycle checks for a table and register its next pre-start expiry.
+
+    Registered on table creation, seat/leave and sit-out changes.
+    """
+    from telegram_poker_bot.shared.services import table_lifecycle
+
+    result = await db.execute(
+        select(Table)
+        .options(joinedload(Table.template))
+        .where(
+            Table.id == table_id,
+            Table.status.in_([TableStatus.ACTIVE, TableStatus.WAITING]),
+        )
+    )
+    table = result.scalar_one_or_none()
+    if not table:
+        return
+
+    await _evaluate_table_lifecycle(db, table, now)
+    await db.commit()
+
+    # Wake up again when the pre-start join window expires
+    if (
+        table.status == TableStatus.WAITING
+        and table.expires_at
+        and table.expires_at > now
+        and not table_lifecycle.is_persistent_table_sync(table)
+    ):
+        await schedule_table_timer(
+            table_id, TableTimerKind.LIFECYCLE, at=table.expires_at
+        )
+
+
+async def _process_autostart_timer(
+    db: AsyncSession, table_id: int, now: datetime
+) -> None:
+    """
+    Start a WAITING table if its auto-start conditions are met.
+
+    Registered when players are seated or a table pauses. While an SNG join
+    window is open the timer re-registers itself for the window's end.
+    Respects system toggle pause_autostart for emergency brake.
+    """
+    from telegram_poker_bot.shared.services import sng_manager, table_service
+    from telegram_poker_bot.api.admin_routes import is_autostart_paused
+
+    if await is_autostart_paused():
+        await schedule_table_timer(
+            table_id,
+            TableTimerKind.AUTOSTART,
+            at=now + timedelta(seconds=TABLE_TIMER_PAUSED_RETRY_SECONDS),
+        )
+        return
+
+    result = await db.execute(
+        select(Table)
+        .options(joinedload(Table.template))
+        .where(Table.id == table_id, Table.status == TableStatus.WAITING)
+    )
+    table = result.scalar_one_or_none()
+    if not table:
+        return
+
+    should_start, reason = await sng_manager.check_auto_start_conditions(db, table)
+
+    if not should_start:
+        if table.sng_join_window_started_at and table.template:
+            config_json = table.template.config_json or {}
+            sng_config = sng_manager.get_sng_config(
+                config_json.get("backend", config_json)
+            )
+            window_end = table.sng_join_window_started_at + timedelta(
+                seconds=sng_config["join_window_seconds"]
+            )
+            if window_end > now:
+                await schedule_table_timer(
+                    table_id, TableTimerKind.AUTOSTART, at=window_end
+                )
+        return
+
+    logger.info(
+        "Auto-starting table",
+        table_id=table.id,
+        type=(table.template.table_type.value if table.template else "unknown"),
+        reason=reason,
+    )
+
+    # 1. Start Table (System Action)
+    # Pass user_id=None to indicate system action
+    await table_service.start_table(db, table.id, user_id=None)
+
+    # 2. Initialize Game Engine
+    runtime_mgr = get_pokerkit_runtime_manager()
+    state = await runtime_mgr.start_game(db, table.id)
+
+    # 3. Commit all changes
+    await db.commit()
+
+    # 4. Broadcast Start Event
+    state = await _attach_template_to_payload(db, table.id, state)
+    await manager.broadcast(table.id, state)
+
+    # 5. Invalidate Cache
+    try:
+        pool = await get_matchmaking_pool()
+        await table_service.invalidate_public_table_cache(pool.redis)
+    except Exception:
+        pass
+
+
+async def _reconcile_table_timers(db: AsyncSession, now: datetime) -> None:
+    """Register timers for live tables in case an event was missed or lost."""
+
+    result = await db.execute(
+        select(Table.id, Table.status).where(
+            Table.status.in_([TableStatus.ACTIVE, TableStatus.WAITING])
+        )
+    )
+    for table_id, table_status in result.all():
+        await schedule_table_timer(table_id, TableTimerKind.LIFECYCLE, at=now)
+        if table_status == TableStatus.WAITING:
+            await schedule_table_timer(table_id, TableTimerKind.AUTOSTART, at=now)
+
+    result = await db.execute(
+        select(Hand.table_id, Table.last_action_at)
+        .join(Table, Hand.table_id == Table.id)
+        .where(
+            Hand.status == HandStatus.INTER_HAND_WAIT,
+            Table.status == TableStatus.ACTIVE,
+        )
+    )
+    for table_id, last_action_at in result.all():
+        due_at = (last_action_at or now) + timedelta(
+            seconds=settings.post_hand_delay_seconds
+        )
+        await schedule_table_timer(table_id, TableTimerKind.INTER_HAND, at=due_at)
+
+
+_TABLE_TIMER_HANDLERS = {
+    TableTimerKind.INTER_HAND: _process_inter_hand_timer,
+    TableTimerKind.AUTOSTART: _process_autostart_timer,
+    TableTimerKind.LIFECYCLE: _process_lifecycle_timer,
+}
+
+
+async def _process_turn_timeout(
+    db: AsyncSession, table_id: int, current_actor_user_id: int, now: datetime
+) -> None:
     """
-    Background task that checks for expired action deadlines and auto-folds.
+    Apply the timeout policy for a claimed turn deadline.
 
     Implements Rule C: Per-turn timeout enforcement
     - Timeout #1: auto-check if legal, otherwise auto-fold
     - Timeout #2 (consecutive): always auto-fold
 
-    Production-hardened implementation:
-    - Uses distributed lock for multi-worker safety
-    - Re-validates all conditions before folding (idempotent)
-    - Excludes sit-out players from auto-fold
-    - Tracks consecutive timeouts per player in hand
-    - Race-safe with proper state checks
-
-    Runs every 2 seconds to check all active tables with pending actions.
+    Re-validates the actor and deadline against the current table state, so
+    stale or early entries are ignored (or rescheduled) rather than acted on.
     """
-    from telegram_poker_bot.shared.database import get_db_session
-    from telegram_poker_bot.shared.services import table_service
+    from telegram_poker_bot.shared.models import Hand
 
-    LOCK_KEY = "background:auto_fold"
-    LOCK_TTL = 5
+    table = await db.get(Table, table_id)
+    if not table or table.status != TableStatus.ACTIVE:
+        return
 
-    logger.info("Auto-fold background task started")
+    runtime_mgr = get_pokerkit_runtime_manager()
+    state = await runtime_mgr.get_state(db, table_id, viewer_user_id=None)
 
-    while True:
-        try:
-            await asyncio.sleep(2)
+    if state.get("current_actor") != current_actor_user_id:
+        logger.debug(
+            "Actor changed before auto-fold, skipping",
+            table_id=table_id,
+            original_actor=current_actor_user_id,
+            current_actor=state.get("current_actor"),
+        )
+        return
 
-            redis_client = await get_redis_client()
-            lock_acquired = await redis_client.set(LOCK_KEY, "1", nx=True, ex=LOCK_TTL)
+    if state.get("status") == "waiting":
+        logger.debug("Table no longer active, skipping", table_id=table_id)
+        return
 
-            if not lock_acquired:
-                logger.debug("Auto-fold lock held by another worker, skipping")
-                continue
+    deadline_str = state.get("action_deadline")
+    if not deadline_str:
+        return
+
+    try:
+        deadline = datetime.fromisoformat(deadline_str.replace("Z", "+00:00"))
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+    except (ValueError, AttributeError) as e:
+        logger.warning(
+            "Failed to parse action_deadline",
+            table_id=table_id,
+            deadline_str=deadline_str,
+            error=str(e),
+        )
+        return
+
+    if now < deadline:
+        # Deadline moved since the entry was scheduled; re-register it from
+        # the current state under the table lock
+        await runtime_mgr.resync_turn_deadline(db, table_id)
+        return
+
+    big_blind_value = state.get("big_blind") or 0
+
+    result_seats = await db.execute(
+        select(Seat).where(
+            Seat.table_id == table_id,
+            Seat.user_id == current_actor_user_id,
+            Seat.left_at.is_(None),
+        )
+    )
+    actor_seat = result_seats.scalar_one_or_none()
+
+    if not actor_seat:
+        logger.warning(
+            "Current actor has no seat",
+            table_id=table_id,
+            user_id=current_actor_user_id,
+        )
+        return
 
+    if actor_seat.is_sitting_out_next_hand:
+        logger.debug(
+            "Skipping auto-fold for sitting out player",
+            table_id=table_id,
+            user_id=current_actor_user_id,
+        )
+        return
+
+    # Get current hand for timeout tracking
+    hand_result = await db.execute(
+        select(Hand)
+        .where(
+            Hand.table_id == table_id,
+            Hand.status != HandStatus.ENDED,
+        )
+        .order_by(Hand.hand_no.desc())
+        .limit(1)
+    )
+    current_hand = hand_result.scalar_one_or_none()
+
+    if not current_hand:
+        logger.debug("No active hand found for timeout", table_id=table_id)
+        return
+
+    # Check consecutive timeout count
+    timeout_tracking = current_hand.timeout_tracking or {}
+    user_key = str(current_actor_user_id)
+    timeout_count = timeout_tracking.get(user_key, {}).get("count", 0)
+
+    # Determine action based on timeout count and allowed actions
+    # Revised Rules:
+    # - If a raise is present in the round: fold immediately and sit out
+    # - Otherwise: first timeout -> auto-call if possible (else check), second -> fold + sit out
+    auto_action = ActionType.FOLD  # Default
+    action_amount = None
+    sit_out_after = False
+    sit_out_reason = "consecutive_timeouts"
+
+    allowed_actions_raw = state.get("allowed_actions", [])
+    allowed_action_types = set()
+    call_amount = None
+    check_allowed = False
+    if isinstance(allowed_actions_raw, list):
+        for entry in allowed_actions_raw:
+            if not isinstance(entry, dict):
+                continue
+            action_value = entry.get("action_type")
+            if action_value:
+                allowed_action_types.add(action_value.lower())
+            if entry.get("action_type") == "call" and entry.get("amount") is not None:
+                try:
+                    call_amount = int(entry.get("amount"))
+                except (TypeError, ValueError):
+                    call_amount = None
+            if entry.get("action_type") == "check":
+                check_allowed = True
+    elif isinstance(allowed_actions_raw, dict):
+        action_value = allowed_actions_raw.get("action_type")
+        if action_value:
+            allowed_action_types.add(action_value.lower())
+        if action_value == "call":
             try:
-                now = datetime.now(timezone.utc)
+                call_amount = int(allowed_actions_raw.get("amount"))
+            except (TypeError, ValueError):
+                call_amount = None
+        if action_value == "check":
+            check_allowed = True
+    elif isinstance(allowed_actions_raw, str):
+        allowed_action_types.add(allowed_actions_raw.lower())
+    if call_amount is not None and call_amount < 0:
+        call_amount = None
+
+    current_bet = state.get("current_bet") or 0
+    street = (state.get("street") or "").lower()
+
+    is_raised_round = False
+    if street == "preflop":
+        is_raised_round = current_bet > big_blind_value
+    elif street in {"flop", "turn", "river"}:
+        is_raised_round = current_bet > 0
+
+    if is_raised_round:
+        # Any raise/bet in the round -> immediate fold and sit out
+        auto_action = ActionType.FOLD
+        sit_out_after = True
+        sit_out_reason = "timeout_vs_raise"
+        logger.info(
+            "Auto-folding player (timeout facing raise/bet)",
+            table_id=table.id,
+            user_id=current_actor_user_id,
+            deadline=deadline_str,
+            current_bet=current_bet,
+        )
+    elif timeout_count == 0:
+        # First timeout without a raise
+        if "call" in allowed_action_types and call_amount is not None:
+            auto_action = ActionType.CALL
+            action_amount = call_amount
+            logger.info(
+                "Auto-calling player (first timeout, no raise in round)",
+                table_id=table.id,
+                user_id=current_actor_user_id,
+                deadline=deadline_str,
+                call_amount=call_amount,
+            )
+        elif "check" in allowed_action_types or check_allowed:
+            auto_action = ActionType.CHECK
+            logger.info(
+                "Auto-checking player (first timeout, check is legal)",
+                table_id=table.id,
+                user_id=current_actor_user_id,
+                deadline=deadline_str,
+            )
+        else:
+            sit_out_after = False
+            logger.info(
+                "Auto-folding player (first timeout, cannot call/check)",
+                table_id=table.id,
+                user_id=current_actor_user_id,
+                deadline=deadline_str,
+            )
+    else:
+        # Consecutive timeout - always fold and sit out
+        sit_out_after = True
+        logger.info(
+            "Auto-folding player (consecutive timeout)",
+            table_id=table.id,
+            user_id=current_actor_user_id,
+            timeout_count=timeout_count + 1,
+            deadline=deadline_str,
+        )
 
-                async with get_db_session() as db:
-                    result = await db.execute(
-                        select(Table).where(Table.status == TableStatus.ACTIVE)
-                    )
-                    active_tables = list(result.scalars())
+    # Execute auto-action
+    public_state = await runtime_mgr.handle_action(
+        db,
+        table_id=table.id,
+        user_id=current_actor_user_id,
+        action=auto_action,
+        amount=action_amount,
+    )
 
-                    for table in active_tables:
-                        try:
-                            runtime_mgr = get_pokerkit_runtime_manager()
-                            state = await runtime_mgr.get_state(
-                                db, table.id, viewer_user_id=None
-                            )
+    # Update timeout tracking
+    if user_key not in timeout_tracking:
+        timeout_tracking[user_key] = {"count": 0, "last_timeout_at": None}
 
-                            if not state.get("current_actor"):
-                                continue
-
-                            deadline_str = state.get("action_deadline")
-                            if not deadline_str:
-                                continue
-
-                            try:
-                                deadline = datetime.fromisoformat(
-                                    deadline_str.replace("Z", "+00:00")
-                                )
-                                if deadline.tzinfo is None:
-                                    deadline = deadline.replace(tzinfo=timezone.utc)
-                            except (ValueError, AttributeError) as e:
-                                logger.warning(
-                                    "Failed to parse action_deadline",
-                                    table_id=table.id,
-                                    deadline_str=deadline_str,
-                                    error=str(e),
-                                )
-                                continue
-
-                            if now < deadline:
-                                continue
-
-                            # Turn timeout configuration (default to 10s if missing)
-                            try:
-                                rules = table_service.parse_template_rules(
-                                    table_service.get_template_config(table)
-                                )
-                                turn_timeout_seconds = rules.turn_timeout_seconds or 10
-                                big_blind_value = rules.big_blind
-                            except Exception:
-                                # Fallbacks if template is not available
-                                turn_timeout_seconds = 10
-                                big_blind_value = state.get("big_blind") or 0
-
-                            # If deadline is missing or stale, recompute from last_action_at
-                            if not table.last_action_at:
-                                continue
-                            last_action_at = table.last_action_at
-                            if last_action_at.tzinfo is None:
-                                last_action_at = last_action_at.replace(
-                                    tzinfo=timezone.utc
-                                )
-                            recomputed_deadline = last_action_at + timedelta(
-                                seconds=turn_timeout_seconds
-                            )
-                            if now < recomputed_deadline:
-                                continue
+    timeout_tracking[user_key]["count"] = timeout_count + 1
+    timeout_tracking[user_key]["last_timeout_at"] = now.isoformat()
+    current_hand.timeout_tracking = timeout_tracking
+
+    queue_analytics_events(
+        db,
+        AnalyticsEvent(
+            EVENT_TIMEOUT,
+            table.id,
+            {
+                "hand_id": current_hand.id,
+                "user_id": current_actor_user_id,
+                "auto_action": auto_action.value,
+                "timeout_count": timeout_count + 1,
+            },
+        ),
+    )
 
-                            current_actor_user_id = state["current_actor"]
+    # Rule 2: Set player to sit out based on policy
+    if sit_out_after or timeout_count + 1 >= 2:
+        actor_seat.is_sitting_out_next_hand = True
+        logger.info(
+            "Player set to sit out after consecutive timeouts",
+            table_id=table.id,
+            user_id=current_actor_user_id,
+            timeout_count=timeout_count + 1,
+        )
+        # Broadcast seat update to all clients
+        await manager.broadcast(
+            table.id,
+            {
+                "type": "player_sitout_changed",
+                "user_id": current_actor_user_id,
+                "is_sitting_out": True,
+                "reason": sit_out_reason,
+            },
+        )
 
-                            result_seats = await db.execute(
-                                select(Seat).where(
-                                    Seat.table_id == table.id,
-                                    Seat.user_id == current_actor_user_id,
-                                    Seat.left_at.is_(None),
-                                )
-                            )
-                            actor_seat = result_seats.scalar_one_or_none()
-
-                            if not actor_seat:
-                                logger.warning(
-                                    "Current actor has no seat",
-                                    table_id=table.id,
-                                    user_id=current_actor_user_id,
-                                )
-                                continue
-
-                            if actor_seat.is_sitting_out_next_hand:
-                                logger.debug(
-                                    "Skipping auto-fold for sitting out player",
-                                    table_id=table.id,
-                                    user_id=current_actor_user_id,
-                                )
-                                continue
-
-                            # Get current hand for timeout tracking
-                            from telegram_poker_bot.shared.models import Hand
-
-                            hand_result = await db.execute(
-                                select(Hand)
-                                .where(
-                                    Hand.table_id == table.id,
-                                    Hand.status != HandStatus.ENDED,
-                                )
-                                .order_by(Hand.hand_no.desc())
-                                .limit(1)
-                            )
-                            current_hand = hand_result.scalar_one_or_none()
-
-                            if not current_hand:
-                                logger.debug(
-                                    "No active hand found for timeout",
-                                    table_id=table.id,
-                                )
-                                continue
-
-                            # Check consecutive timeout count
-                            timeout_tracking = current_hand.timeout_tracking or {}
-                            user_key = str(current_actor_user_id)
-                            timeout_count = timeout_tracking.get(user_key, {}).get(
-                                "count", 0
-                            )
+    table.last_action_at = now
+    await db.flush()
 
-                            # Re-validate current state
-                            fresh_state = await runtime_mgr.get_state(
-                                db, table.id, viewer_user_id=None
-                            )
+    await db.commit()
+    await manager.broadcast(table.id, public_state)
 
-                            if (
-                                fresh_state.get("current_actor")
-                                != current_actor_user_id
-                            ):
-                                logger.debug(
-                                    "Actor changed before auto-fold, skipping",
-                                    table_id=table.id,
-                                    original_actor=current_actor_user_id,
-                                    current_actor=fresh_state.get("current_actor"),
-                                )
-                                continue
-
-                            if fresh_state.get(
-                                "status"
-                            ) == "waiting" or not fresh_state.get("current_actor"):
-                                logger.debug(
-                                    "Table no longer active or no actor, skipping",
-                                    table_id=table.id,
-                                )
-                                continue
-
-                            # Determine action based on timeout count and allowed actions
-                            # Revised Rules:
-                            # - If a raise is present in the round: fold immediately and sit out
-                            # - Otherwise: first timeout -> auto-call if possible (else check), second -> fold + sit out
-                            auto_action = ActionType.FOLD  # Default
-                            action_amount = None
-                            sit_out_after = False
-                            sit_out_reason = "consecutive_timeouts"
-
-                            allowed_actions_raw = fresh_state.get("allowed_actions", [])
-                            allowed_action_types = set()
-                            call_amount = None
-                            check_allowed = False
-                            if isinstance(allowed_actions_raw, list):
-                                for entry in allowed_actions_raw:
-                                    if not isinstance(entry, dict):
-                                        continue
-                                    action_value = entry.get("action_type")
-                                    if action_value:
-                                        allowed_action_types.add(action_value.lower())
-                                    if (
-                                        entry.get("action_type") == "call"
-                                        and entry.get("amount") is not None
-                                    ):
-                                        try:
-                                            call_amount = int(entry.get("amount"))
-                                        except (TypeError, ValueError):
-                                            call_amount = None
-                                    if entry.get("action_type") == "check":
-                                        check_allowed = True
-                            elif isinstance(allowed_actions_raw, dict):
-                                action_value = allowed_actions_raw.get("action_type")
-                                if action_value:
-                                    allowed_action_types.add(action_value.lower())
-                                if action_value == "call":
-                                    try:
-                                        call_amount = int(allowed_actions_raw.get("amount"))
-                                    except (TypeError, ValueError):
-                                        call_amount = None
-                                if action_value == "check":
-                                    check_allowed = True
-                            elif isinstance(allowed_actions_raw, str):
-                                allowed_action_types.add(allowed_actions_raw.lower())
-                            if call_amount is not None and call_amount < 0:
-                                call_amount = None
-
-                            current_bet = fresh_state.get("current_bet") or 0
-                            street = (fresh_state.get("street") or "").lower()
-
-                            is_raised_round = False
-                            if street == "preflop":
-                                is_raised_round = current_bet > big_blind_value
-                            elif street in {"flop", "turn", "river"}:
-                                is_raised_round = current_bet > 0
-
-                            if is_raised_round:
-                                # Any raise/bet in the round -> immediate fold and sit out
-                                auto_action = ActionType.FOLD
-                                sit_out_after = True
-                                sit_out_reason = "timeout_vs_raise"
-                                logger.info(
-                                    "Auto-folding player (timeout facing raise/bet)",
-                                    table_id=table.id,
-                                    user_id=current_actor_user_id,
-                                    deadline=deadline_str,
-                                    current_bet=current_bet,
-                                )
-                            elif timeout_count == 0:
-                                # First timeout without a raise
-                                if "call" in allowed_action_types and call_amount is not None:
-                                    auto_action = ActionType.CALL
-                                    action_amount = call_amount
-                                    logger.info(
-                                        "Auto-calling player (first timeout, no raise in round)",
-                                        table_id=table.id,
-                                        user_id=current_actor_user_id,
-                                        deadline=deadline_str,
-                                        call_amount=call_amount,
-                                    )
-                                elif "check" in allowed_action_types or check_allowed:
-                                    auto_action = ActionType.CHECK
-                                    logger.info(
-                                        "Auto-checking player (first timeout, check is legal)",
-                                        table_id=table.id,
-                                        user_id=current_actor_user_id,
-                                        deadline=deadline_str,
-                                    )
-                                else:
-                                    sit_out_after = False
-                                    logger.info(
-                                        "Auto-folding player (first timeout, cannot call/check)",
-                                        table_id=table.id,
-                                        user_id=current_actor_user_id,
-                                        deadline=deadline_str,
-                                    )
-                            else:
-                                # Consecutive timeout - always fold and sit out
-                                sit_out_after = True
-                                logger.info(
-                                    "Auto-folding player (consecutive timeout)",
-                                    table_id=table.id,
-                                    user_id=current_actor_user_id,
-                                    timeout_count=timeout_count + 1,
-                                    deadline=deadline_str,
-                                )
-
-                            # Execute auto-action
-                            public_state = await runtime_mgr.handle_action(
-                                db,
-                                table_id=table.id,
-                                user_id=current_actor_user_id,
-                                action=auto_action,
-                                amount=action_amount,
-                            )
+    if public_state.get("inter_hand_wait"):
+        hand_ended_event = public_state.get("hand_ended_event")
+        if hand_ended_event:
+            await manager.broadcast(table.id, hand_ended_event)
+        # Note: Inter-hand timeout is handled by the INTER_HAND table timer
+        # No need to schedule in-memory task
 
-                            # Update timeout tracking
-                            if user_key not in timeout_tracking:
-                                timeout_tracking[user_key] = {
-                                    "count": 0,
-                                    "last_timeout_at": None,
-                                }
-
-                            timeout_tracking[user_key]["count"] = timeout_count + 1
-                            timeout_tracking[user_key][
-                                "last_timeout_at"
-                            ] = now.isoformat()
-                            current_hand.timeout_tracking = timeout_tracking
-
-                            # Rule 2: Set player to sit out based on policy
-                            if sit_out_after or timeout_count + 1 >= 2:
-                                actor_seat.is_sitting_out_next_hand = True
-                                logger.info(
-                                    "Player set to sit out after consecutive timeouts",
-                                    table_id=table.id,
-                                    user_id=current_actor_user_id,
-                                    timeout_count=timeout_count + 1,
-                                )
-                                # Broadcast seat update to all clients
-                                await manager.broadcast(
-                                    table.id,
-                                    {
-                                        "type": "player_sitout_changed",
-                                        "user_id": current_actor_user_id,
-                                        "is_sitting_out": True,
-                                        "reason": sit_out_reason,
-                                    },
-                                )
-
-                            table.last_action_at = now
-                            await db.flush()
-
-                            await db.commit()
-                            await manager.broadcast(table.id, public_state)
-
-                            if public_state.get("inter_hand_wait"):
-                                hand_ended_event = public_state.get("hand_ended_event")
-                                if hand_ended_event:
-                                    await manager.broadcast(table.id, hand_ended_event)
-                                # Note: Inter-hand timeout is now handled by monitor_inter_hand_timeouts()
-                                # No need to schedule in-memory task
-
-                        except Exception as e:
-                            logger.error(
-                                "Error auto-folding for table",
-                                table_id=table.id,
-                                error=str(e),
-                            )
-                            await db.rollback()
-            finally:
-                await redis_client.delete(LOCK_KEY)
+
+async def auto_fold_expired_actions():
+    """
+    Background task that fires expired turn deadlines.
+
+    Turn deadlines are scheduled in a Redis sorted set whenever a turn starts
+    and replaced when the actor acts (see ``TurnDeadlineScheduler``). This
+    loop sleeps until the earliest deadline, atomically claims the expired
+    entries, and applies the timeout policy in ``_process_turn_timeout``.
+    Idle tables cost nothing, and each deadline is claimed by exactly one
+    worker, so no global lock is needed.
+    """
+    from telegram_poker_bot.game_core.deadline_scheduler import (
+        get_turn_deadline_scheduler,
+    )
+    from telegram_poker_bot.shared.database import get_db_session
+
+    # Upper bound on sleep so deadlines scheduled by other workers are noticed
+    MAX_SLEEP_SECONDS = 1.0
+    RETRY_DELAY_SECONDS = 2
+
+    logger.info("Auto-fold background task started")
+
+    # Rebuild deadlines for hands already in progress (e.g. after a Redis flush)
+    try:
+        runtime_mgr = get_pokerkit_runtime_manager()
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Table.id).where(Table.status == TableStatus.ACTIVE)
+            )
+            for table_id in result.scalars().all():
+                await runtime_mgr.resync_turn_deadline(db, table_id)
+            await db.commit()
+    except Exception as e:
+        logger.error("Failed to seed turn deadlines", error=str(e))
+
+    while True:
+        try:
+            scheduler = await get_turn_deadline_scheduler()
+            wait_seconds = await scheduler.seconds_until_next()
+            if wait_seconds is None or wait_seconds > MAX_SLEEP_SECONDS:
+                wait_seconds = MAX_SLEEP_SECONDS
+            await asyncio.sleep(wait_seconds)
+
+            now = datetime.now(timezone.utc)
+            for member in await scheduler.claim_due(now):
+                table_id, actor_user_id = scheduler.parse_member(member)
+                async with get_db_session() as db:
+                    try:
+                        await _process_turn_timeout(db, table_id, actor_user_id, now)
+                    except Exception as e:
+                        logger.error(
+                            "Error auto-folding for table",
+                            table_id=table_id,
+                            error=str(e),
+                        )
+                        await db.rollback()
+                        # Retry shortly so the turn cannot stall, unless the
+                        # turn moved on meanwhile
+                        await scheduler.retry_turn(
+                            table_id,
+                            actor_user_id,
+                            now + timedelta(seconds=RETRY_DELAY_SECONDS),
+                        )
 
         except asyncio.CancelledError:
             logger.info("Auto-fold background task cancelled")
@@ -1384,93 +1659,74 @@ async def auto_fold_expired_actions():
             logger.error("Error in auto-fold background task", error=str(e))
 
 
-async def monitor_table_autostart():
-    """Background task to monitor tables and trigger auto-starts.
+async def run_table_timers():
+    """
+    Background task that fires table lifecycle timers.
+
+    Replaces the inter-hand, inactivity and auto-start polling loops. Table
+    events register wake-ups in a Redis sorted set (``TableTimerScheduler``);
+    this loop sleeps until the earliest one, atomically claims the expired
+    entries and dispatches each to its handler, so every timer is processed
+    exactly once across workers and idle tables cost nothing.
 
-    Checks ALL waiting tables (SNG and Persistent) for start conditions.
-    Respects system toggle pause_autostart for emergency brake.
+    A slow reconciliation pass (one worker per interval, guarded by a Redis
+    key) re-registers timers for all live tables as a safety net.
     """
+    from telegram_poker_bot.game_core.deadline_scheduler import (
+        get_table_timer_scheduler,
+    )
     from telegram_poker_bot.shared.database import get_db_session
-    from telegram_poker_bot.shared.services import sng_manager, table_service
-    from telegram_poker_bot.api.admin_routes import is_autostart_paused
-    from sqlalchemy.orm import joinedload
 
-    logger.info("Table auto-start monitor started")
+    RECONCILE_LOCK_KEY = "background:table_timer_reconcile"
+    RECONCILE_INTERVAL = 300
+    # Upper bound on sleep so timers registered by other workers are noticed
+    MAX_SLEEP_SECONDS = 1.0
+
+    logger.info("Table timer loop started", reconcile_interval=RECONCILE_INTERVAL)
 
     while True:
         try:
-            await asyncio.sleep(1)  # Check every second
-
-            # Check if autostart is paused via admin toggle (async Redis call)
-            if await is_autostart_paused():
-                continue
+            redis_client = await get_redis_client()
+            if await redis_client.set(
+                RECONCILE_LOCK_KEY, "1", nx=True, ex=RECONCILE_INTERVAL
+            ):
+                async with get_db_session() as db:
+                    await _reconcile_table_timers(db, datetime.now(timezone.utc))
 
-            async with get_db_session() as db:
-                # Find ALL tables in WAITING state (includes both Persistent and SNG tables)
-                result = await db.execute(
-                    select(Table)
-                    .options(joinedload(Table.template))
-                    .where(Table.status == TableStatus.WAITING)
-                )
-                tables = list(result.scalars())
+            scheduler = await get_table_timer_scheduler()
+            wait_seconds = await scheduler.seconds_until_next()
+            if wait_seconds is None or wait_seconds > MAX_SLEEP_SECONDS:
+                wait_seconds = MAX_SLEEP_SECONDS
+            await asyncio.sleep(wait_seconds)
 
-                for table in tables:
+            now = datetime.now(timezone.utc)
+            for member in await scheduler.claim_due(now):
+                table_id, kind = scheduler.parse_member(member)
+                async with get_db_session() as db:
                     try:
-                        # Check start conditions
-                        should_start, reason = (
-                            await sng_manager.check_auto_start_conditions(db, table)
+                        await _TABLE_TIMER_HANDLERS[kind](db, table_id, now)
+                    except Exception as e:
+                        # exception() includes the traceback
+                        logger.exception(
+                            "Error processing table timer",
+                            table_id=table_id,
+                            kind=kind.value,
+                            error=str(e),
                         )
-
-                        if should_start:
-                            logger.info(
-                                "Auto-starting table",
-                                table_id=table.id,
-                                type=(
-                                    table.template.table_type.value
-                                    if table.template
-                                    else "unknown"
-                                ),
-                                reason=reason,
-                            )
-
-                            # 1. Start Table (System Action)
-                            # Pass user_id=None to indicate system action
-                            await table_service.start_table(db, table.id, user_id=None)
-
-                            # 2. Initialize Game Engine
-                            runtime_mgr = get_pokerkit_runtime_manager()
-                            state = await runtime_mgr.start_game(db, table.id)
-
-                            # 3. Commit all changes
-                            await db.commit()
-
-                            # 4. Broadcast Start Event
-                            state = await _attach_template_to_payload(
-                                db, table.id, state
-                            )
-                            await manager.broadcast(table.id, state)
-
-                            # 5. Invalidate Cache
-                            try:
-                                pool = await get_matchmaking_pool()
-                                await table_service.invalidate_public_table_cache(
-                                    pool.redis
-                                )
-                            except Exception:
-                                pass
-
-                    except Exception as exc:
-                        logger.error(
-                            "Error processing auto-start for table",
-                            table_id=table.id,
-                            error=str(exc),
+                        await db.rollback()
+                        # Retry shortly so the table cannot stall until the
+                        # next reconciliation pass
+                        await schedule_table_timer(
+                            table_id,
+                            kind,
+                            at=now + timedelta(seconds=TABLE_TIMER_RETRY_SECONDS),
                         )
 
         except asyncio.CancelledError:
-            logger.info("Table auto-start monitor cancelled")
+            logger.info("Table timer loop cancelled")
             break
-        except Exception as exc:
-            logger.error("Error in table auto-start monitor", error=str(exc))
+        except Exception as e:
+            logger.exception("Error in table timer loop - continuing", error=str(e))
             await asyncio.sleep(5)
 
 
@@ -1667,30 +1923,48 @@ async def startup_auto_create_tables():
 @api_app.on_event("startup")
 async def startup_event():
     """Start background tasks on application startup."""
-    global _auto_fold_task, _inactivity_check_task, _sng_monitor_task, _inter_hand_monitor_task
+    global _auto_fold_task, _table_timer_task
 
     # Run auto-create BEFORE starting background tasks
     # This is the zero-touch system that ensures tables exist on startup
     await startup_auto_create_tables()
 
+    # Relay table and lobby broadcasts between API workers
+    try:
+        fanout = await get_ws_fanout()
+        await fanout.start()
+        await manager.attach_fanout(fanout)
+        await lobby_manager.attach_fanout(fanout)
+    except Exception as exc:
+        logger.error(
+            "WebSocket fan-out unavailable, broadcasting to local sockets only",
+            error=str(exc),
+        )
+
     _auto_fold_task = asyncio.create_task(auto_fold_expired_actions())
-    _inactivity_check_task = asyncio.create_task(check_table_inactivity())
-    _sng_monitor_task = asyncio.create_task(monitor_table_autostart())
-    _inter_hand_monitor_task = asyncio.create_task(monitor_inter_hand_timeouts())
+    _table_timer_task = asyncio.create_task(run_table_timers())
 
     # Start analytics scheduler
     scheduler = get_analytics_scheduler()
     await scheduler.start()
 
+    # Apply analytics events from the event bus in this worker
+    if settings.analytics_event_consumer:
+        try:
+            consumer = await get_analytics_event_consumer()
+            await consumer.start()
+        except Exception as exc:
+            logger.error("Analytics event consumer unavailable", error=str(exc))
+
     logger.info(
-        "Started background tasks: auto-fold, inactivity check, table auto-start monitor, inter-hand monitor, and analytics scheduler"
+        "Started background tasks: auto-fold, table timers, and analytics scheduler"
     )
 
 
 @api_app.on_event("shutdown")
 async def shutdown_event():
     """Clean up background tasks on application shutdown."""
-    global _auto_fold_task, _inactivity_check_task, _sng_monitor_task, _inter_hand_monitor_task
+    global _auto_fold_task, _table_timer_task
 
     if _auto_fold_task:
         _auto_fold_task.cancel()
@@ -1699,24 +1973,10 @@ async def shutdown_event():
         except asyncio.CancelledError:
             pass
 
-    if _inactivity_check_task:
-        _inactivity_check_task.cancel()
-        try:
-            await _inactivity_check_task
-        except asyncio.CancelledError:
-            pass
-
-    if _sng_monitor_task:
-        _sng_monitor_task.cancel()
-        try:
-            await _sng_monitor_task
-        except asyncio.CancelledError:
-            pass
-
-    if _inter_hand_monitor_task:
-        _inter_hand_monitor_task.cancel()
+    if _table_timer_task:
+        _table_timer_task.cancel()
         try:
-            await _inter_hand_monitor_task
+            await _table_timer_task
         except asyncio.CancelledError:
             pass
 
@@ -1724,6 +1984,19 @@ async def shutdown_event():
     scheduler = get_analytics_scheduler()
     await scheduler.stop()
 
+    if settings.analytics_event_consumer:
+        consumer = await get_analytics_event_consumer()
+        await consumer.stop()
+
+    await lobby_manager.coalescer.stop()
+    await get_heartbeat_manager().stop()
+    await get_admin_analytics_ws_manager().stop_metrics_publisher()
+
+    if manager.fanout is not None:
+        manager.fanout = None
+        lobby_manager.fanout = None
+        await (await get_ws_fanout()).stop()
+
     logger.info("Stopped background tasks")
 
 
@@ -1893,6 +2166,32 @@ async def health_check():
     return {"status": "ok", "service": "api"}
 
 
+@game_router.get("/health/websockets")
+async def health_check_websockets():
+    """WebSocket fan-out health for this worker: local sockets and channel metrics."""
+    return {
+        "local_table_connections": sum(
+            len(connections) for connections in manager.active_connections.values()
+        ),
+        "local_tables": len(manager.active_connections),
+        "local_lobby_connections": len(lobby_manager.connections),
+        "lobby_coalescer": lobby_manager.coalescer.get_metrics(),
+        "heartbeat": get_heartbeat_manager().get_metrics(),
+        "admin_metrics_publisher": get_admin_analytics_ws_manager().get_metrics(),
+        "broadcast": broadcast_metrics.as_dict(),
+        "fanout": manager.fanout.get_metrics() if manager.fanout else None,
+    }
+
+
+@game_router.get("/health/analytics-events")
+async def health_check_analytics_events():
+    """Analytics event bus consumer counters, pending entries and group lag."""
+    if not settings.analytics_event_consumer:
+        return {"enabled": False}
+    consumer = await get_analytics_event_consumer()
+    return {"enabled": True, **(await consumer.get_metrics())}
+
+
 @game_router.get("/health/auto-create")
 async def health_check_auto_create(db: AsyncSession = Depends(get_db)):
     """Auto-create system health check endpoint.
@@ -2663,6 +2962,22 @@ async def sit_at_table(
         if table:
             table.last_action_at = datetime.now(timezone.utc)
 
+        queue_analytics_events(
+            db,
+            AnalyticsEvent(
+                EVENT_SEAT_JOIN,
+                table_id,
+                {
+                    "user_id": user.id,
+                    "seat_position": seat.position,
+                    "buy_in": seat.chips,
+                    "template_id": (
+                        str(table.template_id) if table and table.template_id else None
+                    ),
+                },
+            ),
+        )
+
         await db.commit()
 
         try:
@@ -2766,8 +3081,33 @@ async def leave_table(
     user = await ensure_user(db, auth)
 
     try:
+        # Stack before cash-out, for the analytics session record
+        seat_row = (
+            await db.execute(
+                select(Seat.position, Seat.chips).where(
+                    Seat.table_id == table_id,
+                    Seat.user_id == user.id,
+                    Seat.left_at.is_(None),
+                )
+            )
+        ).first()
+
         await table_service.leave_table(db, table_id, user.id)
 
+        if seat_row is not None:
+            queue_analytics_events(
+                db,
+                AnalyticsEvent(
+                    EVENT_SEAT_LEAVE,
+                    table_id,
+                    {
+                        "user_id": user.id,
+                        "seat_position": seat_row.position,
+                        "cash_out": seat_row.chips,
+                    },
+                ),
+            )
+
         result = await db.execute(select(Table).where(Table.id == table_id))
         table = result.scalar_one_or_none()
         if table:
@@ -2878,9 +3218,7 @@ async def join_table_waitlist(
     try:
         # Check if table has waitlist enabled
         result = await db.execute(
-            select(Table)
-            .options(joinedload(Table.template))
-            .where(Table.id == table_id)
+            select(Table).options(joinedload(Table.template)).where(Table.id == table_id)
         )
         table = result.scalar_one_or_none()
         if not table:
@@ -3060,6 +3398,7 @@ async def toggle_sitout(
         table.last_action_at = datetime.now(timezone.utc)
 
     await db.commit()
+    await schedule_table_timer(table_id, TableTimerKind.LIFECYCLE)
 
     await manager.broadcast(
         table_id,
@@ -3368,13 +3707,9 @@ async def delete_table(
 
     await db.commit()
 
-    await lobby_manager.broadcast(
-        {
-            "type": "TABLE_REMOVED",
-            "table_id": table_id,
-            "status": "ended",
-            "reason": "deleted_by_host",
-        }
+    lobby_manager.queue_change(
+        table_id,
+        LobbyChange(EVENT_REMOVED, status="ended", reason="deleted_by_host"),
     )
 
     # Invalidate public table cache
@@ -3580,8 +3915,6 @@ async def submit_action(
 
     user = await ensure_user(db, user_auth)
 
-    runtime_mgr = get_pokerkit_runtime_manager()
-
     try:
         action_type = ActionType(action.action_type.lower())
     except ValueError:
@@ -3589,10 +3922,30 @@ async def submit_action(
             status_code=400, detail=f"Invalid action type: {action.action_type}"
         )
 
+    return await _apply_table_action(
+        db, table_id, user.id, action_type, action.amount
+    )
+
+
+async def _apply_table_action(
+    db: AsyncSession,
+    table_id: int,
+    user_id: int,
+    action_type: ActionType,
+    amount: Optional[int],
+) -> Dict[str, Any]:
+    """Apply a player's action, broadcast the result and return their view.
+
+    Shared by ``POST /tables/{table_id}/actions`` and ``action`` messages on
+    the table WebSocket. Rejections are raised as ``HTTPException``; the
+    caller commits.
+    """
+    runtime_mgr = get_pokerkit_runtime_manager()
+
     try:
         if action_type == ActionType.READY:
             try:
-                ready_info = await runtime_mgr.mark_player_ready(db, table_id, user.id)
+                ready_info = await runtime_mgr.mark_player_ready(db, table_id, user_id)
             except ValueError as exc:
                 message = str(exc)
                 if "Insufficient balance" in message:
@@ -3603,7 +3956,7 @@ async def submit_action(
                 table_id,
                 {
                     "type": "player_ready",
-                    "user_id": user.id,
+                    "user_id": user_id,
                     "ready_players": ready_info.get("ready_players", []),
                 },
             )
@@ -3623,25 +3976,26 @@ async def submit_action(
                         "reason": result.get("reason"),
                     }
 
-                viewer_state = await runtime_mgr.get_state(db, table_id, user.id)
+                viewer_state = await runtime_mgr.get_state(db, table_id, user_id)
                 next_state = result.get("state", {}) if result else {}
                 if next_state.get("hand_result"):
                     viewer_state["hand_result"] = next_state["hand_result"]
 
                 return await _attach_template_to_payload(db, table_id, viewer_state)
 
-            state = await runtime_mgr.get_state(db, table_id, user.id)
+            state = await runtime_mgr.get_state(db, table_id, user_id)
             return await _attach_template_to_payload(db, table_id, state)
 
-        public_state = await runtime_mgr.handle_action(
+        public_state, viewer_state = await runtime_mgr.handle_action_with_view(
             db,
             table_id=table_id,
-            user_id=user.id,
+            user_id=user_id,
             action=action_type,
-            amount=action.amount,
+            amount=amount,
         )
 
         public_state = await _attach_template_to_payload(db, table_id, public_state)
+        viewer_state = await _attach_template_to_payload(db, table_id, viewer_state)
         await manager.broadcast(table_id, public_state)
 
         if public_state.get("inter_hand_wait"):
@@ -3650,14 +4004,10 @@ async def submit_action(
             hand_ended_event = public_state.get("hand_ended_event")
             if hand_ended_event:
                 await manager.broadcast(table_id, hand_ended_event)
-            # Note: Inter-hand timeout is now handled by monitor_inter_hand_timeouts()
+            # Note: Inter-hand timeout is handled by the INTER_HAND table timer
             # No need to schedule in-memory task
 
-        viewer_state = await runtime_mgr.get_state(db, table_id, user.id)
-        if public_state.get("hand_result"):
-            viewer_state["hand_result"] = public_state["hand_result"]
-
-        return await _attach_template_to_payload(db, table_id, viewer_state)
+        return viewer_state
     except HandCompleteError:
         raise HTTPException(
             status_code=400,
@@ -3695,7 +4045,7 @@ async def submit_action(
         logger.error(
             "Error processing action",
             table_id=table_id,
-            user_id=user.id,
+            user_id=user_id,
             action_type=action_type.value,
             error=str(e),
         )
@@ -3922,6 +4272,7 @@ async def get_table_hourly_stats(
                 "total_hands": s.total_hands,
                 "activity_minutes": s.activity_minutes,
                 "metadata": s.metadata_json,
+                **hourly_counters(s),
             }
             for s in stats
         ],
@@ -3994,6 +4345,7 @@ async def get_recent_hourly_stats(
                 "total_hands": s.total_hands,
                 "activity_minutes": s.activity_minutes,
                 "metadata": s.metadata_json,
+                **hourly_counters(s),
             }
             for s in stats
         ],
@@ -4013,69 +4365,94 @@ api_app.include_router(game_router)
 
 @api_app.websocket("/ws/lobby")
 async def lobby_websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for lobby updates (table removals/refresh)."""
-
-    await lobby_manager.connect(websocket)
-    ping_task = None
+    """WebSocket endpoint for lobby updates (table removals/refresh).
+
+    Send the ``poker.msgpack`` subprotocol (or ``?protocol=msgpack``) to
+    receive MessagePack frames instead of JSON.
+
+    Table changes are coalesced per table over a short window. Clients can
+    pick their view with query params at connect or at any time with
+    ``{"type": "subscribe", "batch": true, "filters": {...}}``:
+    - ``batch=1``: one ``lobby_batch`` message per window, keyed by table_id
+      (otherwise the legacy ``TABLE_*`` messages, one per changed table)
+    - ``mode``, ``variant``, ``min_big_blind``, ``max_big_blind``: only
+      tables matching these are sent (removals are always sent)
+    A subscribe message is answered with a fresh, filtered snapshot.
+    """
 
-    # Send initial snapshot on connect
-    # Frontend expects this to transition from 'syncing_snapshot' to 'live' state
-    async with get_db_session() as db:
-        try:
-            # Fetch public tables using the same logic as GET /api/tables?lobby_persistent=true
-            tables = await table_service.list_available_tables(
-                db,
-                limit=100,  # Reasonable limit for lobby
-                mode=None,
-                viewer_user_id=None,
-                scope="public",
-                redis_client=None,
-            )
+    protocol, subprotocol = negotiate_protocol(websocket)
+    try:
+        subscription = LobbySubscription(
+            batch=websocket.query_params.get("batch", "").lower() in {"1", "true"},
+            filter=LobbyFilter.from_params(websocket.query_params),
+        )
+    except ValueError as exc:
+        logger.warning("Rejected lobby WebSocket", error=str(exc))
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    sender = await lobby_manager.connect(
+        websocket,
+        protocol=protocol,
+        subprotocol=subprotocol,
+        subscription=subscription,
+    )
+    heartbeat = get_heartbeat_manager()
+    heartbeat.register(websocket, sender.send, sender.close, protocol)
 
-            # Send snapshot message matching frontend expectation
-            await websocket.send_json(
-                {
-                    "type": "lobby_snapshot",
-                    "tables": tables,
-                }
-            )
+    async def send_snapshot(lobby_filter: LobbyFilter) -> None:
+        async with get_db_session() as db:
+            try:
+                # Fetch public tables using the same logic as GET /api/tables?lobby_persistent=true
+                tables = await table_service.list_available_tables(
+                    db,
+                    limit=100,  # Reasonable limit for lobby
+                    mode=None,
+                    viewer_user_id=None,
+                    scope="public",
+                    redis_client=None,
+                )
+                tables = [table for table in tables if lobby_filter.matches(table)]
+
+                # Send snapshot message matching frontend expectation
+                await send_message(
+                    websocket,
+                    {
+                        "type": "lobby_snapshot",
+                        "tables": tables,
+                    },
+                    protocol,
+                )
 
-            logger.info(
-                "Sent lobby snapshot on connect",
-                table_count=len(tables),
-            )
-        except Exception as exc:
-            logger.error(
-                "Failed to send lobby snapshot",
-                error=str(exc),
-            )
-            # Send empty snapshot to unblock frontend
-            await websocket.send_json(
-                {
-                    "type": "lobby_snapshot",
-                    "tables": [],
-                }
-            )
+                logger.info(
+                    "Sent lobby snapshot",
+                    table_count=len(tables),
+                )
+            except Exception as exc:
+                logger.error(
+                    "Failed to send lobby snapshot",
+                    error=str(exc),
+                )
+                # Send empty snapshot to unblock frontend
+                await send_message(
+                    websocket,
+                    {
+                        "type": "lobby_snapshot",
+                        "tables": [],
+                    },
+                    protocol,
+                )
 
-    async def send_pings():
-        try:
-            while True:
-                await asyncio.sleep(30)
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception as exc:
-                    logger.debug("Lobby ping failed", error=str(exc))
-                    break
-        except asyncio.CancelledError:
-            pass
+    # Send initial snapshot on connect
+    # Frontend expects this to transition from 'syncing_snapshot' to 'live' state
+    await send_snapshot(subscription.filter)
 
     try:
-        ping_task = asyncio.create_task(send_pings())
         while True:
             try:
-                data = await websocket.receive_text()
+                data = await receive_frame(websocket)
+                heartbeat.touch(websocket)
                 try:
-                    message = json.loads(data) if data else {}
+                    message = decode_frame(data)
                     msg_type = (
                         message.get("type") if isinstance(message, dict) else None
                     )
@@ -4083,12 +4460,26 @@ async def lobby_websocket_endpoint(websocket: WebSocket):
                     if msg_type == "pong":
                         continue
                     if msg_type == "ping":
-                        await websocket.send_json({"type": "pong"})
+                        await send_message(websocket, {"type": "pong"}, protocol)
                         continue
-
-                    await websocket.send_json({"type": "ack", "data": data})
-                except json.JSONDecodeError:
-                    await websocket.send_json({"type": "ack", "data": data})
+                    if msg_type == "subscribe":
+                        try:
+                            subscription = LobbySubscription(
+                                batch=bool(message.get("batch")),
+                                filter=LobbyFilter.from_params(message.get("filters")),
+                            )
+                        except ValueError as exc:
+                            await send_message(
+                                websocket,
+                                {"type": "error", "message": str(exc)},
+                                protocol,
+                            )
+                            continue
+                        lobby_manager.subscribe(websocket, subscription)
+                        await send_snapshot(subscription.filter)
+                        continue
+                except ValueError:
+                    logger.debug("Ignoring undecodable lobby WebSocket message")
             except WebSocketDisconnect:
                 logger.info("Lobby WebSocket client disconnected normally")
                 break
@@ -4100,17 +4491,190 @@ async def lobby_websocket_endpoint(websocket: WebSocket):
                 )
                 await asyncio.sleep(0.1)
     finally:
-        if ping_task:
-            ping_task.cancel()
-            try:
-                await ping_task
-            except asyncio.CancelledError:
-                pass
-
+        heartbeat.unregister(websocket)
         lobby_manager.disconnect(websocket)
         logger.info("Lobby WebSocket connection closed")
 
 
+async def _table_snapshot_frame(table_id: int) -> Tuple[Optional[int], str]:
+    """Return the sequenced public table state and its encoded frame."""
+    stream = await get_table_state_stream()
+    seq, snapshot = await stream.snapshot(table_id)
+    if snapshot is None:
+        # No stream yet (or it expired): render and record the current state
+        async with get_db_session() as db:
+            state = await get_pokerkit_runtime_manager().get_state(
+                db, table_id, viewer_user_id=None
+            )
+            state = await _attach_template_to_payload(db, table_id, state)
+        frames = await stream.encode_update(table_id, state)
+        seq, snapshot = frames.seq, frames.full
+    return seq, snapshot
+
+
+async def _send_table_snapshot(sender: WebSocketSender, table_id: int) -> None:
+    """Send the sequenced public table state to one delta-mode socket."""
+    seq, snapshot = await _table_snapshot_frame(table_id)
+    sender.send(FrameSet({FRAME_FULL: snapshot}).get(FRAME_FULL, sender.protocol))
+    logger.debug("Sent table state snapshot", table_id=table_id, seq=seq)
+
+    if sender.user_id is not None:
+        await _send_private_state(sender, table_id, seq)
+
+
+async def _resume_table_stream(
+    sender: WebSocketSender, table_id: int, last_seq: int
+) -> None:
+    """Release a held socket with what it missed since ``last_seq``.
+
+    Sends one ``table_replay`` frame when the replay buffer still covers
+    the gap, otherwise ``resume_failed`` followed by a fresh snapshot.
+    Broadcasts that arrived while the replay was read follow it; clients
+    skip messages whose ``seq`` they have already seen.
+    """
+    stream = await get_table_state_stream()
+    replay = None
+    try:
+        replay = await stream.replay(table_id, last_seq, sender.deltas)
+    except Exception as exc:
+        logger.warning("Failed to read replay buffer", table_id=table_id, error=str(exc))
+
+    if replay is not None:
+        frames = FrameSet({FRAME_FULL: replay})
+        sender.release([frames.get(FRAME_FULL, sender.protocol)])
+        logger.info("Resumed table stream", table_id=table_id, last_seq=last_seq)
+        seq = None
+    else:
+        seq, snapshot = await _table_snapshot_frame(table_id)
+        frames = FrameSet(
+            {
+                "resume_failed": encode_message(
+                    {"type": "resume_failed", "table_id": table_id, "last_seq": last_seq}
+                ),
+                FRAME_FULL: snapshot,
+            }
+        )
+        sender.release(
+            [
+                frames.get("resume_failed", sender.protocol),
+                frames.get(FRAME_FULL, sender.protocol),
+            ]
+        )
+        logger.info(
+            "Table stream not resumable, sent snapshot",
+            table_id=table_id,
+            last_seq=last_seq,
+        )
+
+    if sender.user_id is not None:
+        await _send_private_state(sender, table_id, seq)
+
+
+async def _send_private_state(
+    sender: WebSocketSender, table_id: int, seq: Optional[int]
+) -> None:
+    """Send a bound socket its player's current private view."""
+    async with get_db_session() as db:
+        view = await get_pokerkit_runtime_manager().get_private_view(
+            db, table_id, sender.user_id
+        )
+    sender.send(
+        encode_frame(
+            {
+                "type": "private_state",
+                "table_id": table_id,
+                "seq": seq,
+                "user_id": sender.user_id,
+                **view,
+            },
+            sender.protocol,
+        )
+    )
+
+
+async def _handle_websocket_action(
+    sender: WebSocketSender, table_id: int, message: Dict[str, Any]
+) -> None:
+    """Run an ``action`` message from a bound table socket.
+
+    Replies with one ``action_result`` carrying the client's ``request_id``:
+    ``ok`` with the player's view as ``result`` (same body as the HTTP
+    endpoint), or ``ok: false`` with ``status`` and ``error``. The player
+    is the one bound at connect time, so no per-action auth is needed.
+    """
+    started = time.perf_counter()
+    response: Dict[str, Any] = {
+        "type": "action_result",
+        "table_id": table_id,
+        "request_id": message.get("request_id"),
+    }
+    try:
+        if sender.user_id is None:
+            raise HTTPException(
+                status_code=401,
+                detail="Socket is not bound to a player; connect with init_data",
+            )
+        try:
+            action_type = ActionType(str(message.get("action_type") or "").lower())
+            amount = message.get("amount")
+            amount = int(amount) if amount is not None else None
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid action: {message.get('action_type')}",
+            )
+
+        async with get_db_session() as db:
+            try:
+                result = await _apply_table_action(
+                    db, table_id, sender.user_id, action_type, amount
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+        response.update(ok=True, result=result)
+    except HTTPException as exc:
+        response.update(ok=False, status=exc.status_code, error=exc.detail)
+    except Exception as exc:
+        logger.error(
+            "WebSocket action failed",
+            table_id=table_id,
+            user_id=sender.user_id,
+            error=str(exc),
+        )
+        response.update(ok=False, status=500, error="Action failed")
+
+    sender.send(encode_frame(response, sender.protocol))
+    logger.info(
+        "WebSocket action handled",
+        table_id=table_id,
+        user_id=sender.user_id,
+        action_type=message.get("action_type"),
+        ok=response["ok"],
+        latency_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+
+
+async def _resolve_websocket_user_id(websocket: WebSocket) -> Optional[int]:
+    """Resolve the player bound to a socket from its ``init_data`` query param.
+
+    Returns None when no init data is given. Raises ValueError when it is
+    present but invalid or unknown.
+    """
+    init_data = websocket.query_params.get("init_data")
+    if not init_data:
+        return None
+    auth = verify_telegram_init_data(init_data)
+    if not auth:
+        raise ValueError("Invalid Telegram init data")
+    async with get_db_session() as db:
+        user = await find_user_by_tg_id(db, auth.user_id)
+    if user is None:
+        raise ValueError("Unknown user")
+    return user.id
+
+
 @api_app.websocket("/ws/{table_id}")
 async def websocket_endpoint(websocket: WebSocket, table_id: int):
     """
@@ -4126,38 +4690,90 @@ async def websocket_endpoint(websocket: WebSocket, table_id: int):
     - Broadcasts state changes to all connected clients
     - Handles disconnections gracefully
     - Connections are automatically closed when table is deleted
-    - Implements ping/pong heartbeat to keep connection alive
+    - Pinged by the shared heartbeat; clients answer ``ping`` with ``pong``
+      and sockets silent for three rounds are closed
+
+    Delta mode (``?deltas=1``):
+    - A sequenced ``table_state`` snapshot (with ``seq``) is sent on connect
+    - Later states arrive as ``table_state_delta`` messages with ``seq``,
+      ``base_seq`` and JSON-patch ``ops`` (or as a full ``table_state`` when a
+      delta would not be smaller)
+    - On a sequence gap the client sends ``{"type": "resync"}`` and receives
+      a fresh snapshot
+
+    Private view (``?init_data=<Telegram initData>``):
+    - Binds the socket to the authenticated player once, at connect
+    - After every table state the player receives a small ``private_state``
+      message (hole cards, allowed actions, ready state) with the same ``seq``
+
+    Actions (bound sockets only):
+    - ``{"type": "action", "request_id": "...", "action_type": "raise",
+      "amount": 200}`` plays like ``POST /tables/{table_id}/actions``
+    - The reply is ``{"type": "action_result", "request_id": "...", "ok": ...}``
+      with the player's view as ``result`` or ``status`` and ``error``
+
+    Resume (``?last_seq=<seq>``):
+    - Every table message carries a ``seq``; a reconnecting client passes the
+      last one it saw and receives a single ``table_replay`` message whose
+      ``messages`` are the ones it missed, in order (deltas for delta
+      clients; events plus the latest full state otherwise)
+    - When the replay buffer no longer covers the gap it receives
+      ``resume_failed`` followed by a full ``table_state`` snapshot
+
+    Binary protocol (``poker.msgpack`` subprotocol or ``?protocol=msgpack``):
+    - Every server message is a MessagePack frame with card lists packed as
+      bytes (see ``game_core.ws_codec``); clients may send either encoding
     """
-    await manager.connect(websocket, table_id)
+    try:
+        user_id = await _resolve_websocket_user_id(websocket)
+    except ValueError as exc:
+        logger.warning("Rejected table WebSocket", table_id=table_id, error=str(exc))
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
 
-    # Task for sending periodic pings to keep connection alive
-    ping_task = None
+    deltas = websocket.query_params.get("deltas", "").lower() in {"1", "true"}
+    try:
+        last_seq = int(websocket.query_params["last_seq"])
+    except (KeyError, ValueError):
+        last_seq = None
+    protocol, subprotocol = negotiate_protocol(websocket)
+    sender = await manager.connect(
+        websocket,
+        table_id,
+        deltas=deltas,
+        user_id=user_id,
+        protocol=protocol,
+        subprotocol=subprotocol,
+        hold=last_seq is not None,
+    )
+    try:
+        if last_seq is not None:
+            await _resume_table_stream(sender, table_id, last_seq)
+        elif deltas:
+            await _send_table_snapshot(sender, table_id)
+        elif user_id is not None:
+            await _send_private_state(sender, table_id, None)
+    except Exception as exc:
+        logger.warning(
+            "Failed to send initial table state", table_id=table_id, error=str(exc)
+        )
+        # Never leave a resuming socket parked
+        sender.release()
 
-    async def send_pings():
-        """Send ping messages every 30 seconds to prevent timeout."""
-        try:
-            while True:
-                await asyncio.sleep(30)
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception as e:
-                    logger.debug("Ping send failed", table_id=table_id, error=str(e))
-                    break
-        except asyncio.CancelledError:
-            pass
+    # Pings and dead-socket reaping are handled by the shared heartbeat
+    heartbeat = get_heartbeat_manager()
+    heartbeat.register(websocket, sender.send, sender.close, protocol)
 
     try:
-        # Start ping task
-        ping_task = asyncio.create_task(send_pings())
-
         while True:
             try:
                 # Keep connection alive and handle incoming messages
-                data = await websocket.receive_text()
+                data = await receive_frame(websocket)
+                heartbeat.touch(websocket)
 
                 # Parse message
                 try:
-                    message = json.loads(data) if data else {}
+                    message = decode_frame(data)
                     msg_type = (
                         message.get("type") if isinstance(message, dict) else None
                     )
@@ -4167,11 +4783,18 @@ async def websocket_endpoint(websocket: WebSocket, table_id: int):
                         logger.debug("Received pong from client", table_id=table_id)
                         continue
 
-                    # Echo back or acknowledge other messages
-                    await websocket.send_json({"type": "ack", "data": data})
-                except json.JSONDecodeError:
-                    # Non-JSON messages - just echo back
-                    await websocket.send_json({"type": "pong", "data": data})
+                    if msg_type == "resync":
+                        await _send_table_snapshot(sender, table_id)
+                        continue
+
+                    if msg_type == "action":
+                        await _handle_websocket_action(sender, table_id, message)
+                        continue
+                except ValueError:
+                    logger.debug(
+                        "Ignoring undecodable table WebSocket message",
+                        table_id=table_id,
+                    )
 
             except WebSocketDisconnect:
                 # Normal disconnect from client
@@ -4194,14 +4817,7 @@ async def websocket_endpoint(websocket: WebSocket, table_id: int):
     except Exception as e:
         logger.error("WebSocket fatal error", table_id=table_id, error=str(e))
     finally:
-        # Cancel ping task
-        if ping_task:
-            ping_task.cancel()
-            try:
-                await ping_task
-            except asyncio.CancelledError:
-                pass
-
+        heartbeat.unregister(websocket)
         # Disconnect from manager
         manager.disconnect(websocket, table_id)
         logger.info("WebSocket connection closed", table_id=table_id)
@@ -4222,6 +4838,10 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
     - Send token in first message: {"type": "auth", "token": "..."}
     - Or send as query param: /api/ws/admin?token=...
 
+    Encoding:
+    - JSON by default; offer the ``poker.msgpack`` subprotocol (or
+      ``?protocol=msgpack``) for MessagePack frames
+
     Message types (client -> server):
     - auth: Authenticate with JWT token
     - subscribe_table: Subscribe to table metrics
@@ -4235,24 +4855,23 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
     - authenticated: Auth successful
     - auth_error: Auth failed
     - subscribed/unsubscribed: Subscription confirmation
-    - table_metrics_update: Live table metrics
+    - table_metrics_update: Live table metrics, pushed every few seconds
+      (full on subscribe, then only changed metrics with "partial": true)
     - anomaly_alert: Anomaly detected
     - pot_spike_alert: Big pot detected
     - timeout_surge_alert: Timeout surge detected
     - player_activity: Player activity indicator
     - pong: Heartbeat response
     """
-    from telegram_poker_bot.shared.services.admin_analytics_ws import (
-        get_admin_analytics_ws_manager,
-    )
     from telegram_poker_bot.shared.services.rbac_middleware import get_admin_ws_auth
     from urllib.parse import parse_qs, urlparse
 
     ws_manager = get_admin_analytics_ws_manager()
     ws_auth = get_admin_ws_auth()
 
-    # Accept connection first
-    await websocket.accept()
+    # Accept connection first, with the negotiated wire protocol
+    protocol, subprotocol = negotiate_protocol(websocket)
+    await websocket.accept(subprotocol=subprotocol)
 
     # Check for token in query params
     token = None
@@ -4270,37 +4889,43 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
     if token:
         authenticated_user = await ws_auth.require_admin_ws(token)
         if authenticated_user:
-            await websocket.send_json(
+            await send_message(
+                websocket,
                 {
                     "type": "authenticated",
                     "user_id": authenticated_user.user_id,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
+                },
+                protocol,
             )
             logger.info(
                 "Admin WS authenticated via query param",
                 user_id=authenticated_user.user_id,
             )
         else:
-            await websocket.send_json(
+            await send_message(
+                websocket,
                 {
                     "type": "auth_error",
                     "message": "Invalid or expired token",
-                }
+                },
+                protocol,
             )
             await websocket.close(code=1008)  # Policy violation
             return
     else:
         # Wait for auth message
-        await websocket.send_json(
+        await send_message(
+            websocket,
             {
                 "type": "auth_required",
                 "message": "Send auth message with token",
-            }
+            },
+            protocol,
         )
 
     # Connect to manager
-    await ws_manager.connect(websocket)
+    await ws_manager.connect(websocket, protocol=protocol)
 
     # Task for sending periodic pings
     ping_task = None
@@ -4311,7 +4936,7 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
             while True:
                 await asyncio.sleep(30)
                 try:
-                    await websocket.send_json({"type": "ping"})
+                    await send_message(websocket, {"type": "ping"}, protocol)
                 except Exception as e:
                     logger.debug("Analytics WS ping send failed", error=str(e))
                     break
@@ -4325,43 +4950,51 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
         while True:
             try:
                 # Receive and handle messages
-                data = await websocket.receive_text()
+                data = await receive_frame(websocket)
 
                 try:
-                    message = json.loads(data) if data else {}
+                    message = decode_frame(data)
+                    if not isinstance(message, dict):
+                        raise ValueError("Expected an object")
                     msg_type = message.get("type")
 
                     # Handle auth message
                     if msg_type == "auth" and not authenticated_user:
                         auth_token = message.get("token")
                         if not auth_token:
-                            await websocket.send_json(
+                            await send_message(
+                                websocket,
                                 {
                                     "type": "auth_error",
                                     "message": "Missing token",
-                                }
+                                },
+                                protocol,
                             )
                             continue
 
                         authenticated_user = await ws_auth.require_admin_ws(auth_token)
                         if authenticated_user:
-                            await websocket.send_json(
+                            await send_message(
+                                websocket,
                                 {
                                     "type": "authenticated",
                                     "user_id": authenticated_user.user_id,
                                     "timestamp": datetime.now(timezone.utc).isoformat(),
-                                }
+                                },
+                                protocol,
                             )
                             logger.info(
                                 "Admin WS authenticated via message",
                                 user_id=authenticated_user.user_id,
                             )
                         else:
-                            await websocket.send_json(
+                            await send_message(
+                                websocket,
                                 {
                                     "type": "auth_error",
                                     "message": "Invalid or expired token",
-                                }
+                                },
+                                protocol,
                             )
                             await websocket.close(code=1008)  # Policy violation
                             break
@@ -4369,24 +5002,28 @@ async def admin_analytics_websocket_endpoint(websocket: WebSocket):
 
                     # Require authentication for all other messages
                     if not authenticated_user:
-                        await websocket.send_json(
+                        await send_message(
+                            websocket,
                             {
                                 "type": "error",
                                 "message": "Not authenticated",
-                            }
+                            },
+                            protocol,
                         )
                         continue
 
                     # Handle message via manager
                     await ws_manager.handle_message(websocket, message)
 
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON in analytics WebSocket message")
-                    await websocket.send_json(
+                except ValueError:
+                    logger.warning("Invalid analytics WebSocket message")
+                    await send_message(
+                        websocket,
                         {
                             "type": "error",
-                            "message": "Invalid JSON",
-                        }
+                            "message": "Invalid message",
+                        },
+                        protocol,
                     )
 
             except WebSocketDisconnect:
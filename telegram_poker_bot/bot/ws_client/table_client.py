@@ -6,26 +6,41 @@ from typing import Optional, Callable, Dict, Any
 from websockets import connect, ConnectionClosed
 from telegram_poker_bot.shared.config import get_settings
 from telegram_poker_bot.shared.logging import get_logger
+from telegram_poker_bot.shared.state_delta import apply_delta
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
 class TableWebSocketClient:
-    """WebSocket client for table real-time updates."""
+    """WebSocket client for table real-time updates.
+
+    With ``deltas`` enabled the server sends ``table_state_delta`` messages
+    which are applied to the last known state here, so ``on_message`` still
+    receives full ``table_state`` dictionaries.
+
+    Reconnects resume the stream: the last ``seq`` seen is passed back as
+    ``last_seq`` and the server replays only the missed messages.
+    """
     
     # Configuration constants
     MAX_RECONNECT_ATTEMPTS = 5
     MAX_RECONNECT_WAIT_SECONDS = 30
     
-    def __init__(self, table_id: int, on_message: Callable):
+    def __init__(self, table_id: int, on_message: Callable, deltas: bool = False):
         self.table_id = table_id
         self.on_message = on_message
-        self.ws_url = self._build_ws_url()
+        self.deltas = deltas
         self.websocket = None
         self.running = False
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = self.MAX_RECONNECT_ATTEMPTS
+        # Last full table state and its sequence number (delta mode)
+        self.state: Optional[Dict[str, Any]] = None
+        self.seq: Optional[int] = None
+        # Highest sequence number of any table message, for resuming
+        self.last_seq: Optional[int] = None
+        self.ws_url = self._build_ws_url()
         
     def _build_ws_url(self) -> str:
         """Build WebSocket URL for table."""
@@ -34,11 +49,18 @@ class TableWebSocketClient:
         ws_url = base_url.replace("http://", "ws://").replace("https://", "wss://")
         # Remove /api suffix if present, we'll add it back with the path
         ws_url = ws_url.rstrip("/api").rstrip("/")
-        return f"{ws_url}/api/ws/{self.table_id}"
+        params = []
+        if self.deltas:
+            params.append("deltas=1")
+        if self.last_seq is not None:
+            params.append(f"last_seq={self.last_seq}")
+        query = f"?{'&'.join(params)}" if params else ""
+        return f"{ws_url}/api/ws/{self.table_id}{query}"
     
     async def connect(self):
         """Connect to WebSocket."""
         try:
+            self.ws_url = self._build_ws_url()
             self.websocket = await connect(self.ws_url)
             self.running = True
             self.reconnect_attempts = 0
@@ -59,7 +81,12 @@ class TableWebSocketClient:
                 
                 try:
                     data = json.loads(message)
-                    await self.on_message(data)
+                    if isinstance(data, dict) and data.get("type") == "table_replay":
+                        messages = data.get("messages", [])
+                    else:
+                        messages = [data]
+                    for item in messages:
+                        await self._handle_message(item)
                 except json.JSONDecodeError:
                     logger.warning("Invalid JSON from WebSocket", message=message[:100])
                     
@@ -87,6 +114,70 @@ class TableWebSocketClient:
                 else:
                     break
     
+    async def _handle_message(self, data: Any):
+        """Skip already-seen messages and deliver the rest.
+
+        Broadcasts that raced a replay can arrive twice. Full states are
+        idempotent and always applied (snapshots carry the state's own,
+        possibly older, ``seq``); deltas and events are skipped when seen.
+        """
+        if isinstance(data, dict):
+            msg_type = data.get("type")
+            seq = data.get("seq")
+            if msg_type == "resume_failed":
+                self.state = None
+                self.seq = None
+                return
+            if msg_type != "private_state" and isinstance(seq, int):
+                if msg_type == "table_state_delta":
+                    if self.seq is not None and seq <= self.seq:
+                        return
+                elif msg_type != "table_state":
+                    if self.last_seq is not None and seq <= self.last_seq:
+                        return
+                self.last_seq = max(seq, self.last_seq or 0)
+        data = await self._apply_state_stream(data)
+        if data is not None:
+            await self.on_message(data)
+
+    async def _apply_state_stream(
+        self, data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Track sequenced table states and expand deltas into full states."""
+        if not isinstance(data, dict):
+            return data
+
+        msg_type = data.get("type")
+        if msg_type == "ping":
+            # Sockets that stop answering are reaped by the server heartbeat
+            await self.send({"type": "pong"})
+            return None
+
+        if msg_type == "table_state":
+            self.state = data
+            self.seq = data.get("seq")
+            return data
+
+        if msg_type != "table_state_delta":
+            return data
+
+        if self.state is None or self.seq != data.get("base_seq"):
+            logger.info(
+                "Table state gap, requesting resync",
+                table_id=self.table_id,
+                seq=self.seq,
+                base_seq=data.get("base_seq"),
+            )
+            self.state = None
+            self.seq = None
+            await self.send({"type": "resync"})
+            return None
+
+        self.state = apply_delta(self.state, data.get("ops", []))
+        self.state["seq"] = data.get("seq")
+        self.seq = data.get("seq")
+        return self.state
+
     async def send(self, data: Dict[str, Any]):
         """Send message to WebSocket."""
         if self.websocket:
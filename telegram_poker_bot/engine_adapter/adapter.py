@@ -58,6 +58,9 @@ class PokerEngineAdapter:
         )
         self.min_bet = min_bet if min_bet is not None else big_blind
         self.bring_in = bring_in
+        # Players who voluntarily put chips in / raised preflop this hand
+        self._vpip_indices: set = set()
+        self._pfr_indices: set = set()
 
         if button_index is None or not (0 <= button_index < player_count):
             if button_index is not None and not (0 <= button_index < player_count):
@@ -330,6 +333,17 @@ class PokerEngineAdapter:
         """
         return self._get_allowed_actions_for_player(player_index)
 
+    def get_hole_cards(self, player_index: int) -> List[str]:
+        """Return a player's hole cards regardless of showdown visibility.
+
+        Used to build a player's private view without re-serializing the
+        full state for that viewer.
+        """
+        hole_cards = getattr(self.state, "hole_cards", None)
+        if not hole_cards or player_index >= len(hole_cards):
+            return []
+        return [repr(card) for card in hole_cards[player_index] or []]
+
     def _auto_advance_streets(self) -> None:
         """Automatically advance the board when no players remain to act."""
 
@@ -393,6 +407,8 @@ class PokerEngineAdapter:
             operation.player_index if hasattr(operation, "player_index") else None
         )
         amount = operation.amount if hasattr(operation, "amount") else 0
+        if amount and actor_idx is not None:
+            self._vpip_indices.add(actor_idx)
         action_name = "checked" if amount == 0 else f"called {amount}"
         logger.info(f"Player {action_name}", player_index=actor_idx, amount=amount)
         # Auto-advance streets if needed
@@ -410,14 +426,42 @@ class PokerEngineAdapter:
                 f"Cannot bet/raise to {amount}. Allowed range: {min_amt} to {max_amt}"
             )
 
+        street_index = self.state.street_index
         operation = self.state.complete_bet_or_raise_to(amount)
         actor_idx = (
             operation.player_index if hasattr(operation, "player_index") else None
         )
+        if actor_idx is not None:
+            self._vpip_indices.add(actor_idx)
+            if street_index == 0:
+                self._pfr_indices.add(actor_idx)
         logger.info("Player bet/raised", player_index=actor_idx, amount=amount)
         self._auto_advance_streets()
         return operation
 
+    def get_voluntary_actions(self) -> Dict[str, List[int]]:
+        """Player indices with VPIP (called, bet or raised) and PFR (raised
+        preflop) in the current hand. Blinds and antes are not voluntary."""
+        return {
+            "vpip": sorted(self._vpip_indices),
+            "pfr": sorted(self._pfr_indices),
+        }
+
+    def get_stack_changes(self) -> Dict[int, int]:
+        """Chips won (positive) or lost (negative) per player index this hand,
+        before rake; measured against the same stacks as ``get_winners``."""
+        stacks_before = (
+            self._true_initial_stacks
+            if self._true_initial_stacks is not None
+            else self._pre_showdown_stacks
+        )
+        if stacks_before is None:
+            return {}
+        return {
+            player_idx: self.state.stacks[player_idx] - stacks_before[player_idx]
+            for player_idx in range(self.player_count)
+        }
+
     def is_hand_complete(self) -> bool:
         return not self.state.status
 
@@ -672,6 +716,9 @@ class PokerEngineAdapter:
             "status": bool(self.state.status),
             # Deck state
             "deck": self._deck,
+            # Voluntary action tracking for VPIP/PFR
+            "vpip_indices": sorted(self._vpip_indices),
+            "pfr_indices": sorted(self._pfr_indices),
         }
 
         return persistence_state
@@ -718,6 +765,8 @@ class PokerEngineAdapter:
 
         # Restore deck state
         adapter._deck = data.get("deck", [])
+        adapter._vpip_indices = set(data.get("vpip_indices") or [])
+        adapter._pfr_indices = set(data.get("pfr_indices") or [])
 
         # Restore pre-showdown stacks if available
         if data.get("pre_showdown_stacks") is not None:
@@ -0,0 +1,226 @@
+"""Redis-backed deadline schedulers for turn timeouts and table timers.
+
+Deadlines live in a sorted set scored by their UNIX timestamp, so finding
+what is due is a single range query regardless of how many tables exist.
+Entries are claimed atomically (range + remove in one Lua script), which
+guarantees each expired deadline is handed to exactly one worker.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+TURN_DEADLINES_KEY = "deadlines:turn"
+# table_id -> member currently scheduled for that table
+TURN_DEADLINE_MEMBERS_KEY = "deadlines:turn:members"
+TABLE_TIMERS_KEY = "timers:table"
+# Delay for event-triggered timers so the triggering transaction has committed
+TABLE_TIMER_SETTLE_SECONDS = 1.0
+
+_CLAIM_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #due > 0 then
+    redis.call('ZREM', KEYS[1], unpack(due))
+end
+return due
+"""
+
+# Re-add a turn deadline only while it is still the table's current member
+_RETRY_TURN_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[2])
+return 1
+"""
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class DeadlineScheduler:
+    """Sorted-set deadline queue with atomic, exactly-once claiming."""
+
+    def __init__(self, redis_client: redis.Redis, key: str):
+        self.redis = redis_client
+        self.key = key
+        self._claim_script = redis_client.register_script(_CLAIM_DUE_SCRIPT)
+
+    async def schedule(
+        self, member: str, deadline: datetime, keep_earliest: bool = False
+    ) -> None:
+        """Add or move a deadline.
+
+        With ``keep_earliest`` an existing earlier deadline is left untouched.
+        """
+        await self.redis.zadd(
+            self.key, {member: deadline.timestamp()}, lt=keep_earliest
+        )
+
+    async def cancel(self, member: str) -> None:
+        """Remove a deadline if present."""
+        await self.redis.zrem(self.key, member)
+
+    async def claim_due(
+        self, now: Optional[datetime] = None, limit: int = 100
+    ) -> List[str]:
+        """Atomically remove and return up to ``limit`` expired members."""
+        now = now or datetime.now(timezone.utc)
+        due = await self._claim_script(keys=[self.key], args=[now.timestamp(), limit])
+        return [_decode(member) for member in due or []]
+
+    async def seconds_until_next(self) -> Optional[float]:
+        """Return seconds until the earliest deadline, or None when empty."""
+        head = await self.redis.zrange(self.key, 0, 0, withscores=True)
+        if not head:
+            return None
+        _, score = head[0]
+        return max(0.0, score - datetime.now(timezone.utc).timestamp())
+
+
+class TurnDeadlineScheduler(DeadlineScheduler):
+    """Turn deadlines keyed by ``"{table_id}:{user_id}"``, one per table."""
+
+    def __init__(self, redis_client: redis.Redis):
+        super().__init__(redis_client, TURN_DEADLINES_KEY)
+        self._retry_turn_script = redis_client.register_script(_RETRY_TURN_SCRIPT)
+
+    @staticmethod
+    def make_member(table_id: int, user_id: int) -> str:
+        return f"{table_id}:{user_id}"
+
+    @staticmethod
+    def parse_member(member: str) -> Tuple[int, int]:
+        table_id, user_id = member.split(":", 1)
+        return int(table_id), int(user_id)
+
+    async def schedule_turn(
+        self, table_id: int, user_id: int, deadline: datetime
+    ) -> None:
+        """Schedule the actor's deadline, replacing any previous one for the table.
+
+        Callers hold the table lock, so the read-replace below is not racy.
+        """
+        member = self.make_member(table_id, user_id)
+        previous = await self.redis.hget(TURN_DEADLINE_MEMBERS_KEY, str(table_id))
+        pipe = self.redis.pipeline(transaction=True)
+        if previous is not None and _decode(previous) != member:
+            pipe.zrem(self.key, _decode(previous))
+        pipe.zadd(self.key, {member: deadline.timestamp()})
+        pipe.hset(TURN_DEADLINE_MEMBERS_KEY, str(table_id), member)
+        await pipe.execute()
+
+    async def retry_turn(
+        self, table_id: int, user_id: int, deadline: datetime
+    ) -> bool:
+        """Re-add a claimed deadline if it is still the table's current turn.
+
+        A compare-and-set against the table's member entry, so it is safe
+        without the table lock: if the actor acted (or the turn moved on)
+        meanwhile, the newer entry is left alone and False is returned.
+        """
+        applied = await self._retry_turn_script(
+            keys=[self.key, TURN_DEADLINE_MEMBERS_KEY],
+            args=[str(table_id), self.make_member(table_id, user_id), deadline.timestamp()],
+        )
+        return bool(applied)
+
+    async def clear_turn(self, table_id: int) -> None:
+        """Remove the table's pending turn deadline (actor acted or hand ended)."""
+        previous = await self.redis.hget(TURN_DEADLINE_MEMBERS_KEY, str(table_id))
+        if previous is None:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.key, _decode(previous))
+        pipe.hdel(TURN_DEADLINE_MEMBERS_KEY, str(table_id))
+        await pipe.execute()
+
+
+class TableTimerKind(str, Enum):
+    """Table lifecycle wake-ups handled by the table timer loop."""
+
+    INTER_HAND = "inter_hand"  # inter-hand wait deadline
+    AUTOSTART = "autostart"  # start conditions (seating, SNG join window end)
+    LIFECYCLE = "lifecycle"  # pre-start expiry, inactivity and pause checks
+
+
+class TableTimerScheduler(DeadlineScheduler):
+    """Table timers keyed by ``"{kind}:{table_id}"``."""
+
+    def __init__(self, redis_client: redis.Redis):
+        super().__init__(redis_client, TABLE_TIMERS_KEY)
+
+    @staticmethod
+    def make_member(table_id: int, kind: TableTimerKind) -> str:
+        return f"{kind.value}:{table_id}"
+
+    @staticmethod
+    def parse_member(member: str) -> Tuple[int, TableTimerKind]:
+        kind, table_id = member.split(":", 1)
+        return int(table_id), TableTimerKind(kind)
+
+    async def schedule_timer(
+        self,
+        table_id: int,
+        kind: TableTimerKind,
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Register a wake-up; repeated registrations keep the earliest time."""
+        if at is None:
+            at = datetime.now(timezone.utc) + timedelta(
+                seconds=TABLE_TIMER_SETTLE_SECONDS
+            )
+        await self.schedule(self.make_member(table_id, kind), at, keep_earliest=True)
+
+
+_turn_deadline_scheduler: Optional[TurnDeadlineScheduler] = None
+_table_timer_scheduler: Optional[TableTimerScheduler] = None
+
+
+async def get_turn_deadline_scheduler() -> TurnDeadlineScheduler:
+    """Get the process-wide turn deadline scheduler."""
+    global _turn_deadline_scheduler
+    if _turn_deadline_scheduler is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _turn_deadline_scheduler = TurnDeadlineScheduler(await get_redis_client())
+    return _turn_deadline_scheduler
+
+
+async def get_table_timer_scheduler() -> TableTimerScheduler:
+    """Get the process-wide table timer scheduler."""
+    global _table_timer_scheduler
+    if _table_timer_scheduler is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _table_timer_scheduler = TableTimerScheduler(await get_redis_client())
+    return _table_timer_scheduler
+
+
+async def schedule_table_timer(
+    table_id: int, kind: TableTimerKind, at: Optional[datetime] = None
+) -> None:
+    """Best-effort timer registration for table lifecycle events.
+
+    Failures are logged; the periodic reconciliation in the timer loop
+    re-registers anything that was missed.
+    """
+    try:
+        scheduler = await get_table_timer_scheduler()
+        await scheduler.schedule_timer(table_id, kind, at)
+    except Exception as exc:
+        logger.warning(
+            "Failed to schedule table timer",
+            table_id=table_id,
+            kind=kind.value,
+            error=str(exc),
+        )
@@ -0,0 +1,107 @@
+"""Deferred, batched persistence for completed hands.
+
+Hand completion is split in two phases. The financial phase (rake, wallet
+credits, hand status) runs inside the table lock in
+``PokerKitTableRuntime._apply_hand_result_and_cleanup`` and is committed
+before the lock is released. Everything else a finished hand produces —
+hand history summary, showdown/hand_ended events and aggregated stats — is
+collected into a ``HandCompletionBatch`` and written afterwards with a few
+bulk statements, so the next hand can start without waiting for it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from telegram_poker_bot.game_core.stats_processor import StatsProcessor
+from telegram_poker_bot.shared.logging import get_logger
+from telegram_poker_bot.shared.models import (
+    Hand,
+    HandHistory,
+    HandHistoryEvent,
+    Seat,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HandCompletionBatch:
+    """Non-financial writes collected for one completed hand."""
+
+    table_id: int
+    hand_no: int
+    hand: Hand
+    seats: List[Seat]
+    hand_result: Dict[str, Any]
+    history_payload: Dict[str, Any]
+    event_rows: List[Dict[str, Any]] = field(default_factory=list)
+    # VPIP/PFR participants, from the engine's record of the hand
+    vpip_user_ids: List[int] = field(default_factory=list)
+    pfr_user_ids: List[int] = field(default_factory=list)
+    # Net chips per user after rake, for the live leaderboards
+    player_deltas: Dict[int, int] = field(default_factory=dict)
+
+
+async def persist_hand_completion(
+    db: AsyncSession, batch: HandCompletionBatch
+) -> bool:
+    """
+    Write hand history, hand events and stats for a completed hand.
+
+    Runs in a savepoint so a failure here never affects the already-committed
+    financial results; the caller is responsible for committing the session.
+
+    Args:
+        db: Database session
+        batch: Collected writes for the hand
+
+    Returns:
+        True if all writes succeeded, False otherwise
+    """
+    try:
+        async with db.begin_nested():
+            # Idempotent insert replaces the previous select-then-insert check
+            await db.execute(
+                pg_insert(HandHistory)
+                .values(
+                    table_id=batch.table_id,
+                    hand_no=batch.hand_no,
+                    payload_json=batch.history_payload,
+                )
+                .on_conflict_do_nothing(index_elements=["table_id", "hand_no"])
+            )
+
+            if batch.event_rows:
+                await db.execute(insert(HandHistoryEvent), batch.event_rows)
+
+            await StatsProcessor.update_stats(
+                db=db,
+                hand=batch.hand,
+                hand_result=batch.hand_result,
+                seats=batch.seats,
+                vpip_user_ids=batch.vpip_user_ids,
+                pfr_user_ids=batch.pfr_user_ids,
+            )
+    except Exception as exc:
+        logger.error(
+            "Failed to persist hand completion batch",
+            table_id=batch.table_id,
+            hand_no=batch.hand_no,
+            error=str(exc),
+        )
+        return False
+
+    logger.info(
+        "Persisted hand completion batch",
+        table_id=batch.table_id,
+        hand_no=batch.hand_no,
+        events=len(batch.event_rows),
+        players=len(batch.seats),
+    )
+    return True
@@ -0,0 +1,247 @@
+"""Coalesced, filterable lobby updates.
+
+Seat, leave, create and status changes used to push one full lobby message
+per event, so a table filling up produced a burst of identical-looking
+updates for every lobby socket. Changes are now collected per table for a
+short window (``LOBBY_COALESCE_WINDOW_SECONDS``); only the latest change of
+each table survives, and the window is flushed as one batch keyed by
+``table_id``.
+
+Each lobby socket has a ``LobbySubscription``:
+
+- ``batch`` clients receive a single ``lobby_batch`` message per window::
+
+      {"type": "lobby_batch",
+       "changes": {"12": {"event": "TABLE_UPDATED", "table": {...}},
+                   "15": {"event": "TABLE_REMOVED", "status": "ended",
+                          "reason": "expired"}}}
+
+- other clients keep the original ``TABLE_CREATED`` / ``TABLE_UPDATED`` /
+  ``TABLE_REMOVED`` messages, at most one per table per window.
+
+A ``LobbyFilter`` (mode, variant, big blind range) drops created/updated
+tables the client is not looking at. Removals are always delivered since
+they carry no table payload to match against.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+LOBBY_COALESCE_WINDOW_SECONDS = 0.25
+
+EVENT_CREATED = "TABLE_CREATED"
+EVENT_UPDATED = "TABLE_UPDATED"
+EVENT_REMOVED = "TABLE_REMOVED"
+
+# Fan-out frame label of an unfiltered lobby batch
+FRAME_BATCH = "batch"
+
+
+def _table_config(table: Dict[str, Any]) -> Dict[str, Any]:
+    template = table.get("template") or {}
+    config = template.get("config") or {}
+    return config if isinstance(config, dict) else {}
+
+
+def _optional_int(value: Any, name: str) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer")
+
+
+@dataclass(frozen=True)
+class LobbyFilter:
+    """Which lobby tables a client wants to hear about."""
+
+    mode: Optional[str] = None
+    variant: Optional[str] = None
+    min_big_blind: Optional[int] = None
+    max_big_blind: Optional[int] = None
+
+    @classmethod
+    def from_params(cls, params: Any) -> LobbyFilter:
+        """Build a filter from a mapping (query params or a subscribe message).
+
+        Raises ValueError on malformed values.
+        """
+        if not params:
+            return cls()
+        if not hasattr(params, "get"):
+            raise ValueError("filters must be an object")
+        return cls(
+            mode=(str(params.get("mode")).lower() if params.get("mode") else None),
+            variant=(str(params.get("variant")) if params.get("variant") else None),
+            min_big_blind=_optional_int(params.get("min_big_blind"), "min_big_blind"),
+            max_big_blind=_optional_int(params.get("max_big_blind"), "max_big_blind"),
+        )
+
+    def matches(self, table: Dict[str, Any]) -> bool:
+        if self.mode is not None and str(table.get("mode") or "").lower() != self.mode:
+            return False
+        config = _table_config(table)
+        if self.variant is not None and config.get("game_variant") != self.variant:
+            return False
+        if self.min_big_blind is not None or self.max_big_blind is not None:
+            try:
+                big_blind = int(config.get("big_blind"))
+            except (TypeError, ValueError):
+                return False
+            if self.min_big_blind is not None and big_blind < self.min_big_blind:
+                return False
+            if self.max_big_blind is not None and big_blind > self.max_big_blind:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class LobbySubscription:
+    """Delivery format and filter of one lobby socket."""
+
+    batch: bool = False
+    filter: LobbyFilter = field(default_factory=LobbyFilter)
+
+
+@dataclass
+class LobbyChange:
+    """Latest pending change of one table."""
+
+    event: str
+    table: Optional[Dict[str, Any]] = None
+    status: Optional[str] = None
+    reason: Optional[str] = None
+
+    def merge(self, newer: LobbyChange) -> LobbyChange:
+        """Combine with a newer change of the same table."""
+        if newer.event == EVENT_UPDATED and self.event == EVENT_CREATED:
+            # Clients have not seen the table yet
+            return LobbyChange(EVENT_CREATED, table=newer.table)
+        return newer
+
+    def as_batch_entry(self) -> Dict[str, Any]:
+        if self.event == EVENT_REMOVED:
+            return {"event": self.event, "status": self.status, "reason": self.reason}
+        return {"event": self.event, "table": self.table}
+
+    def as_message(self, table_id: int) -> Dict[str, Any]:
+        if self.event == EVENT_REMOVED:
+            return {
+                "type": EVENT_REMOVED,
+                "table_id": table_id,
+                "status": self.status,
+                "reason": self.reason,
+            }
+        return {"type": self.event, "table": self.table}
+
+    @classmethod
+    def from_batch_entry(cls, entry: Dict[str, Any]) -> LobbyChange:
+        return cls(
+            event=entry["event"],
+            table=entry.get("table"),
+            status=entry.get("status"),
+            reason=entry.get("reason"),
+        )
+
+
+def batch_message(changes: Dict[int, LobbyChange]) -> Dict[str, Any]:
+    """The ``lobby_batch`` message for a set of table changes."""
+    return {
+        "type": "lobby_batch",
+        "changes": {
+            str(table_id): change.as_batch_entry()
+            for table_id, change in changes.items()
+        },
+    }
+
+
+def parse_batch_message(message: Dict[str, Any]) -> Dict[int, LobbyChange]:
+    """Inverse of ``batch_message``."""
+    return {
+        int(table_id): LobbyChange.from_batch_entry(entry)
+        for table_id, entry in (message.get("changes") or {}).items()
+    }
+
+
+def messages_for(
+    changes: Dict[int, LobbyChange], subscription: LobbySubscription
+) -> List[Dict[str, Any]]:
+    """Messages a client with ``subscription`` receives for a batch."""
+    visible = {
+        table_id: change
+        for table_id, change in changes.items()
+        if change.event == EVENT_REMOVED
+        or subscription.filter.matches(change.table or {})
+    }
+    if not visible:
+        return []
+    if subscription.batch:
+        return [batch_message(visible)]
+    return [change.as_message(table_id) for table_id, change in visible.items()]
+
+
+class LobbyCoalescer:
+    """Collect table changes and flush them once per window."""
+
+    def __init__(
+        self,
+        flush: Callable[[Dict[int, LobbyChange]], Awaitable[None]],
+        window: float = LOBBY_COALESCE_WINDOW_SECONDS,
+    ):
+        self._flush = flush
+        self.window = window
+        self._pending: Dict[int, LobbyChange] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.changes_received = 0
+        self.batches_flushed = 0
+
+    def add(self, table_id: int, change: LobbyChange) -> None:
+        """Queue a change; it is sent at the end of the current window."""
+        self.changes_received += 1
+        previous = self._pending.get(table_id)
+        self._pending[table_id] = previous.merge(change) if previous else change
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send pending changes now."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.batches_flushed += 1
+        try:
+            await self._flush(pending)
+        except Exception as exc:
+            logger.error(
+                "Failed to flush lobby changes", tables=len(pending), error=str(exc)
+            )
+
+    async def stop(self) -> None:
+        """Cancel the pending window and flush what it collected."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            self._task = None
+        await self.flush()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "window_seconds": self.window,
+            "changes_received": self.changes_received,
+            "batches_flushed": self.batches_flushed,
+            "pending_tables": len(self._pending),
+        }
@@ -7,11 +7,12 @@ All game rules, card dealing, and pot calculations are handled by PokerKit.
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy import select, inspect
 from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from pokerkit import Mode
 from pokerkit.games import NoLimitTexasHoldem, NoLimitShortDeckHoldem
@@ -33,7 +34,22 @@ from telegram_poker_bot.shared.models import (
 from telegram_poker_bot.shared.config import get_settings
 from telegram_poker_bot.shared.services import table_lifecycle
 from telegram_poker_bot.shared.services.table_lifecycle import is_persistent_table_sync
+from telegram_poker_bot.shared.services.analytics_event_bus import (
+    EVENT_ACTION,
+    EVENT_HAND_FINISHED,
+    AnalyticsEvent,
+    queue_analytics_events,
+)
 from telegram_poker_bot.engine_adapter import PokerEngineAdapter
+from telegram_poker_bot.game_core.deadline_scheduler import (
+    TableTimerKind,
+    get_turn_deadline_scheduler,
+    schedule_table_timer,
+)
+from telegram_poker_bot.game_core.hand_completion import (
+    HandCompletionBatch,
+    persist_hand_completion,
+)
 
 
 logger = get_logger(__name__)
@@ -67,6 +83,20 @@ def _get_table_game_variant(table: Table) -> str:
     return _get_table_service().get_table_game_variant(table)
 
 
+def build_template_block(template: TableTemplate) -> Dict[str, Any]:
+    """Serialize template metadata embedded in table state payloads."""
+
+    config_json = template.config_json or {}
+    return {
+        "id": str(template.id),
+        "table_type": template.table_type.value,
+        "config": config_json.get("backend", config_json),
+        "config_json": config_json,
+        "has_waitlist": template.has_waitlist,
+        "is_active": getattr(template, "is_active", True),
+    }
+
+
 class NoActorToActError(RuntimeError):
     """Raised when an action is attempted but no player is eligible to act."""
 
@@ -120,7 +150,7 @@ class PokerKitTableRuntime:
 
     Multi-Worker Note:
     - Each worker process maintains its own instance of this class
-    - Table and Seat data are refreshed from DB on each operation
+    - Table and Seat data are refreshed from DB whenever Table.version changes
     - Engine state is loaded from DB on first access, then kept in memory
     - State changes are persisted back to DB after each action
     """
@@ -143,6 +173,24 @@ class PokerKitTableRuntime:
             None  # Track inter-hand wait phase
         )
         self.ready_players: Set[int] = set()
+        # Table.version the cached table/seat snapshot was loaded at
+        self.version: Optional[int] = None
+        # Deferred hand history/stats writes for the last completed hand
+        self.pending_completion: Optional[HandCompletionBatch] = None
+        # Serialized template metadata, rebuilt when the snapshot is reloaded
+        self._template_block: Optional[Dict[str, Any]] = None
+
+    def get_template_block(self) -> Optional[Dict[str, Any]]:
+        """Return cached template metadata, or None if the template is not loaded."""
+
+        if self._template_block is None:
+            if "template" in inspect(self.table).unloaded:
+                return None
+            template = self.table.template
+            if template is None or inspect(template).expired_attributes:
+                return None
+            self._template_block = build_template_block(template)
+        return self._template_block
 
     def _resolve_game_class(self):
         """Return the GameVariant and PokerKit game class for this table."""
@@ -179,6 +227,31 @@ class PokerKitTableRuntime:
         active_seats.sort(key=lambda s: s.position)
         return active_seats
 
+    def current_actor_user_id(self) -> Optional[int]:
+        """Return the user ID of the player whose turn it is, if any."""
+        if not self.engine or self.engine.state.actor_index is None:
+            return None
+        actor_index = self.engine.state.actor_index
+        for user_id, player_index in self.user_id_to_player_index.items():
+            if player_index == actor_index:
+                return user_id
+        return None
+
+    def turn_deadline(self) -> Optional[datetime]:
+        """
+        Return the current actor's action deadline.
+
+        Anchored to table.last_action_at, matching ``action_deadline`` in
+        ``to_payload``.
+        """
+        timeout_seconds = self.rules.turn_timeout_seconds or 10
+        if self.current_actor_user_id() is None or not timeout_seconds:
+            return None
+        base_time = self.table.last_action_at or datetime.now(timezone.utc)
+        if base_time.tzinfo is None:
+            base_time = base_time.replace(tzinfo=timezone.utc)
+        return base_time + timedelta(seconds=timeout_seconds)
+
     def _calculate_and_apply_rake(self, hand_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate rake (commission) and apply it to winner payouts.
@@ -249,25 +322,25 @@ class PokerKitTableRuntime:
 
         return hand_result
 
-    async def _log_hand_event(
+    def _build_hand_event_row(
         self,
-        db: AsyncSession,
         action_type: str,
         actor_user_id: Optional[int] = None,
         amount: Optional[int] = None,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
-        Log a hand history event to the database.
+        Build HandHistoryEvent column values for the current engine state.
+
+        Consumes the next event sequence number.
 
         Args:
-            db: Database session
             action_type: Type of action (e.g., "hand_started", "deal_flop", "bet", "fold")
             actor_user_id: User ID of the player performing the action (None for system events)
             amount: Amount for bet/raise/call actions
-        """
-        if not self.current_hand or not self.engine:
-            return
 
+        Returns:
+            Dictionary of HandHistoryEvent column values
+        """
         # Determine current street
         street_index = (
             self.engine.state.street_index
@@ -293,17 +366,41 @@ class PokerKitTableRuntime:
                 if card_list and len(card_list) > 0:
                     board_cards.append(repr(card_list[0]))
 
-        # Create event
+        row = {
+            "hand_id": self.current_hand.id,
+            "table_id": self.table.id,
+            "sequence": self.event_sequence,
+            "street": street,
+            "action_type": action_type,
+            "actor_user_id": actor_user_id,
+            "amount": amount,
+            "pot_size": pot_size,
+            "board_cards": board_cards if board_cards else None,
+        }
+        self.event_sequence += 1
+        return row
+
+    async def _log_hand_event(
+        self,
+        db: AsyncSession,
+        action_type: str,
+        actor_user_id: Optional[int] = None,
+        amount: Optional[int] = None,
+    ) -> None:
+        """
+        Log a hand history event to the database.
+
+        Args:
+            db: Database session
+            action_type: Type of action (e.g., "hand_started", "deal_flop", "bet", "fold")
+            actor_user_id: User ID of the player performing the action (None for system events)
+            amount: Amount for bet/raise/call actions
+        """
+        if not self.current_hand or not self.engine:
+            return
+
         event = HandHistoryEvent(
-            hand_id=self.current_hand.id,
-            table_id=self.table.id,
-            sequence=self.event_sequence,
-            street=street,
-            action_type=action_type,
-            actor_user_id=actor_user_id,
-            amount=amount,
-            pot_size=pot_size,
-            board_cards=board_cards if board_cards else None,
+            **self._build_hand_event_row(action_type, actor_user_id, amount)
         )
         try:
             async with db.begin_nested():
@@ -335,8 +432,6 @@ class PokerKitTableRuntime:
                 actor_index=self.engine.state.actor_index,
                 error=str(e),
             )
-        finally:
-            self.event_sequence += 1
 
     async def _apply_hand_result_and_cleanup(
         self, db: AsyncSession, hand_result: Dict[str, Any]
@@ -347,7 +442,9 @@ class PokerKitTableRuntime:
         This is the ONLY method that handles hand ending logic.
         Implements a strictly linear flow:
         1. Calculate and apply rake to winner payouts
-        2. Persist data (winners, pot, hand history, rake)
+        2. Persist financial data (winners, pot, rake) and collect hand history,
+           events and stats into ``self.pending_completion`` for the caller to
+           persist after committing and releasing the table lock
         3. Set state to INTER_HAND_WAIT
         4. Reset all players to sitting out (forcing them to vote "Ready")
         5. Broadcast ONE unified hand_ended event
@@ -427,9 +524,8 @@ class PokerKitTableRuntime:
                     hand_no=self.hand_no,
                 )
 
-                # 1b. Save hand history
-                from telegram_poker_bot.shared.models import HandHistory
-
+                # 1b. Collect hand history and stats writes; these are persisted
+                # in bulk after the financial commit (see hand_completion.py)
                 board_cards = self.engine.state.board_cards if self.engine else []
                 formatted_board = []
                 if board_cards:
@@ -453,41 +549,38 @@ class PokerKitTableRuntime:
                     "pot_total": hand_result.get("total_pot", 0),
                     "rake_amount": hand_result.get("rake_amount", 0),
                 }
-
-                existing_history = await db.execute(
-                    select(HandHistory).where(
-                        HandHistory.table_id == self.table.id,
-                        HandHistory.hand_no == self.hand_no,
-                    )
-                )
-                if not existing_history.scalar_one_or_none():
-                    history = HandHistory(
-                        table_id=self.table.id,
-                        hand_no=self.hand_no,
-                        payload_json=hand_history_payload,
-                    )
-                    db.add(history)
-                    logger.info(
-                        "Saved hand history",
-                        table_id=self.table.id,
-                        hand_no=self.hand_no,
-                    )
-
-                # 1c. Update aggregated poker statistics (async background task)
-                from telegram_poker_bot.game_core.stats_processor import (
-                    StatsProcessor,
-                )
-
-                await StatsProcessor.update_stats(
-                    db=db,
-                    hand=self.current_hand,
-                    hand_result=hand_result,
-                    seats=self.seats,
-                )
-                logger.info(
-                    "Updated aggregated poker stats",
+                voluntary = self.engine.get_voluntary_actions()
+                user_id_by_index = {
+                    idx: uid for uid, idx in self.user_id_to_player_index.items()
+                }
+                rake_by_user = {
+                    w["user_id"]: w.get("rake_deducted", 0)
+                    for w in hand_result["winners"]
+                }
+                player_deltas = {
+                    user_id_by_index[idx]: change
+                    - rake_by_user.get(user_id_by_index[idx], 0)
+                    for idx, change in self.engine.get_stack_changes().items()
+                    if idx in user_id_by_index
+                }
+                completion_batch = HandCompletionBatch(
                     table_id=self.table.id,
                     hand_no=self.hand_no,
+                    hand=self.current_hand,
+                    seats=list(self.seats),
+                    hand_result=hand_result,
+                    history_payload=hand_history_payload,
+                    vpip_user_ids=[
+                        user_id_by_index[idx]
+                        for idx in voluntary["vpip"]
+                        if idx in user_id_by_index
+                    ],
+                    pfr_user_ids=[
+                        user_id_by_index[idx]
+                        for idx in voluntary["pfr"]
+                        if idx in user_id_by_index
+                    ],
+                    player_deltas=player_deltas,
                 )
 
                 # Step 2: Set State to INTER_HAND_WAIT
@@ -512,9 +605,13 @@ class PokerKitTableRuntime:
                     hand_no=self.hand_no,
                 )
 
-                # Log showdown/hand_ended events
-                await self._log_hand_event(db, "showdown")
-                await self._log_hand_event(db, "hand_ended")
+                # Queue showdown/hand_ended events with the deferred batch
+                completion_batch.event_rows.append(
+                    self._build_hand_event_row("showdown")
+                )
+                completion_batch.event_rows.append(
+                    self._build_hand_event_row("hand_ended")
+                )
 
                 # Step 3: Build hand_ended event
                 # 5 second delay for showdown animation
@@ -535,6 +632,7 @@ class PokerKitTableRuntime:
                 }
 
                 await db.flush()
+                self.pending_completion = completion_batch
 
                 logger.info(
                     "Hand completion finished - returning hand_ended event",
@@ -557,6 +655,9 @@ class PokerKitTableRuntime:
                 )
             self.ready_players = set()
             self.inter_hand_wait_start = None
+            # Rolled-back objects are expired; force a full reload next time
+            self.version = None
+            self.pending_completion = None
             logger.exception(
                 "Failed to finalize hand",
                 table_id=self.table.id,
@@ -1139,8 +1240,8 @@ class PokerKitTableRuntime:
         # Auto-advance streets and handle showdown
         self._auto_advance_street_and_showdown()
 
-        # Build response
-        result = {"state": self.to_payload()}
+        # The state payload is rendered by the manager once the action is persisted
+        result: Dict[str, Any] = {}
 
         # Check if hand is complete
         if self.engine.is_hand_complete():
@@ -1260,6 +1361,107 @@ class PokerKitTableRuntime:
 
         return actions, allowed_map
 
+    def private_view(
+        self, viewer_user_id: int, public_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the viewer-specific part of an already rendered public payload.
+
+        Only hole cards and allowed actions differ between viewers, so this
+        avoids serializing the full engine state again for each viewer.
+
+        Args:
+            viewer_user_id: User ID of viewer
+            public_payload: Result of ``to_payload()`` without a viewer
+
+        Returns:
+            Dictionary with ``hero`` (None when no hand is running),
+            ``allowed_actions``, ``allowed_actions_legacy`` and, during the
+            inter-hand wait, ``can_ready``
+        """
+        view: Dict[str, Any] = {
+            "hero": None,
+            "allowed_actions": [],
+            "allowed_actions_legacy": {},
+        }
+        if not self.engine:
+            return view
+
+        player_index = self.user_id_to_player_index.get(viewer_user_id)
+        view["hero"] = {
+            "user_id": viewer_user_id,
+            "cards": (
+                self.engine.get_hole_cards(player_index)
+                if player_index is not None
+                else []
+            ),
+        }
+
+        if public_payload.get("inter_hand_wait"):
+            can_ready = viewer_user_id not in self.ready_players and any(
+                seat.user_id == viewer_user_id and seat.left_at is None
+                for seat in self.seats
+            )
+            view["can_ready"] = can_ready
+            view["allowed_actions"] = [
+                {"action_type": "ready"} for _ in range(1 if can_ready else 0)
+            ]
+            view["allowed_actions_legacy"] = {"ready": can_ready}
+        elif public_payload.get("current_actor_user_id") == viewer_user_id:
+            view["allowed_actions"] = public_payload.get("allowed_actions", [])
+            view["allowed_actions_legacy"] = public_payload.get(
+                "allowed_actions_legacy", {}
+            )
+        return view
+
+    @staticmethod
+    def apply_private_view(
+        public_payload: Dict[str, Any], view: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge a ``private_view`` into a copy of the public payload."""
+
+        payload = dict(public_payload)
+        hero = view.get("hero")
+        if hero is None:
+            return payload
+
+        payload["hero"] = hero
+        payload["allowed_actions"] = view["allowed_actions"]
+        payload["allowed_actions_legacy"] = view["allowed_actions_legacy"]
+        if hero["cards"]:
+            payload["players"] = [
+                (
+                    dict(player, hole_cards=hero["cards"])
+                    if player.get("user_id") == hero["user_id"]
+                    else player
+                )
+                for player in payload.get("players", [])
+            ]
+        if "can_ready" in view and isinstance(payload.get("inter_hand"), dict):
+            payload["inter_hand"] = dict(
+                payload["inter_hand"], can_ready=view["can_ready"]
+            )
+        return payload
+
+    def to_payloads(
+        self, viewer_user_id: Optional[int]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Render the public state and one viewer's state from a single engine pass.
+
+        Args:
+            viewer_user_id: User ID of viewer (for card visibility)
+
+        Returns:
+            Tuple of (public payload, viewer payload)
+        """
+        public_payload = self.to_payload()
+        if viewer_user_id is None:
+            return public_payload, dict(public_payload)
+        return public_payload, self.apply_private_view(
+            public_payload, self.private_view(viewer_user_id, public_payload)
+        )
+
     def to_payload(self, viewer_user_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Serialize table state for frontend consumption.
@@ -1652,15 +1854,39 @@ class PokerKitTableRuntimeManager:
         # Set a safe timeout (e.g., 10s) and blocking timeout
         return redis.lock(f"lock:table:{table_id}", timeout=10, blocking_timeout=5)
 
+    async def _sync_turn_deadline(self, runtime: PokerKitTableRuntime) -> None:
+        """
+        Schedule the current actor's turn deadline, or clear it if nobody acts.
+
+        Must be called while holding the table lock. Scheduling failures are
+        logged and never fail the game operation itself.
+        """
+        table_id = runtime.table.id
+        try:
+            scheduler = await get_turn_deadline_scheduler()
+            actor_user_id = runtime.current_actor_user_id()
+            deadline = runtime.turn_deadline()
+            if actor_user_id is None or deadline is None:
+                await scheduler.clear_turn(table_id)
+            else:
+                await scheduler.schedule_turn(table_id, actor_user_id, deadline)
+        except Exception as exc:
+            logger.warning(
+                "Failed to sync turn deadline",
+                table_id=table_id,
+                error=str(exc),
+            )
+
     async def ensure_table(
-        self, db: AsyncSession, table_id: int
+        self, db: AsyncSession, table_id: int, force_refresh: bool = False
     ) -> PokerKitTableRuntime:
         """
-        Get or create runtime instance, always refreshing table/seat data from DB.
+        Get or create runtime instance, refreshing table/seat data when it changed.
 
         This method ensures multi-worker safety by:
-        1. ALWAYS fetching fresh Table and Seats from DB
-        2. Reusing cached runtime if it exists, or creating new if not
+        1. ALWAYS locking the Table row and reading its version counter
+        2. Reloading template and seats only if the version differs from the
+           cached runtime (or force_refresh is set)
         3. Loading engine state from DB only if runtime.engine is None
 
         The engine is loaded from DB on first access per worker. Subsequent calls
@@ -1669,22 +1895,86 @@ class PokerKitTableRuntimeManager:
         Args:
             db: Database session
             table_id: The table ID to load
+            force_refresh: Reload template and seats even if the version matches.
+                Required when the caller mutates the returned seats.
 
         Returns:
             PokerKitTableRuntime instance with current table/seat data from DB
         """
-        # Always fetch fresh table and seat data from database
         # Use with_for_update() to lock the table row during updates
         # NOTE: We cannot use joinedload with with_for_update() because asyncpg
         # doesn't support FOR UPDATE on the nullable side of OUTER JOINs.
         # Solution: Lock table first, load template via separate query without lock.
+        # The version column is selected explicitly so it is read from the row
+        # even when the Table instance is already in the session identity map.
         result = await db.execute(
-            select(Table).where(Table.id == table_id).with_for_update()
+            select(Table, Table.version).where(Table.id == table_id).with_for_update()
         )
-        table = result.scalars().one_or_none()
-        if not table:
+        row = result.one_or_none()
+        if not row:
             raise ValueError("Table not found")
+        table, version = row
 
+        runtime = self._tables.get(table_id)
+        if (
+            runtime
+            and not force_refresh
+            and runtime.version == version
+            and self._can_reuse_snapshot(db, runtime, table)
+        ):
+            # Seats and template are unchanged since the last load: rebind the
+            # locked table row and keep the cached seats, rules and currency.
+            if "template" in inspect(table).unloaded:
+                set_committed_value(
+                    table,
+                    "template",
+                    await db.merge(runtime.table.template, load=False),
+                )
+            runtime.table = table
+        else:
+            runtime = await self._refresh_table_snapshot(db, table, runtime)
+            runtime.version = version
+
+        await self._rebind_hand_state(db, runtime, table_id)
+        return runtime
+
+    @staticmethod
+    def _can_reuse_snapshot(
+        db: AsyncSession, runtime: PokerKitTableRuntime, table: Table
+    ) -> bool:
+        """Return True when the cached template and seats are still readable."""
+
+        # Pending seat changes in this session are not flushed (and versioned) yet
+        for obj in list(db.new) + list(db.dirty):
+            if isinstance(obj, Seat) and obj.table_id == table.id:
+                return False
+
+        cached_table = runtime.table
+        if cached_table is None or cached_table.template_id != table.template_id:
+            return False
+        cached_state = inspect(cached_table)
+        if cached_state.expired_attributes or "template" in cached_state.unloaded:
+            return False
+        template = cached_table.template
+        if template is None or inspect(template).expired_attributes:
+            return False
+
+        # A rollback in the session that loaded the seats expires them
+        for seat in runtime.seats:
+            seat_state = inspect(seat)
+            if seat_state.expired_attributes or "user" in seat_state.unloaded:
+                return False
+        return True
+
+    async def _refresh_table_snapshot(
+        self,
+        db: AsyncSession,
+        table: Table,
+        runtime: Optional[PokerKitTableRuntime],
+    ) -> PokerKitTableRuntime:
+        """Reload template and seats for a locked table into the runtime cache."""
+
+        table_id = table.id
         # Load the template relationship in a separate query (without FOR UPDATE)
         # This avoids the FOR UPDATE + OUTER JOIN compatibility issue with asyncpg
         if table.template_id:
@@ -1711,10 +2001,17 @@ class PokerKitTableRuntimeManager:
             runtime.rules = _get_table_rules(table)
             # Refresh cached currency_type to avoid lazy loading in async context
             runtime.currency_type = _get_table_currency_type(table)
+            runtime._template_block = None
         else:
             # Create new runtime
             runtime = PokerKitTableRuntime(table, seats)
             self._tables[table_id] = runtime
+        return runtime
+
+    async def _rebind_hand_state(
+        self, db: AsyncSession, runtime: PokerKitTableRuntime, table_id: int
+    ) -> None:
+        """Bind current_hand to the session and restore the engine if needed."""
 
         # Ensure current_hand is bound to the active session to avoid detached
         # instances when cached runtimes are reused across requests. Without
@@ -1796,8 +2093,6 @@ class PokerKitTableRuntimeManager:
                     )
                     # Keep engine as None, will be created on next start_game
 
-        return runtime
-
     async def mark_player_ready(
         self, db: AsyncSession, table_id: int, user_id: int
     ) -> Dict[str, Any]:
@@ -1805,7 +2100,7 @@ class PokerKitTableRuntimeManager:
 
         lock = await self._get_distributed_lock(table_id)
         async with lock:
-            runtime = await self.ensure_table(db, table_id)
+            runtime = await self.ensure_table(db, table_id, force_refresh=True)
 
             if (
                 not runtime.current_hand
@@ -1998,6 +2293,7 @@ class PokerKitTableRuntimeManager:
                     runtime.table.updated_at = datetime.now(timezone.utc)
                     runtime.ready_players = set()
                     await db.flush()
+                    await schedule_table_timer(table_id, TableTimerKind.AUTOSTART)
                     
                     result = {
                         "table_paused": True,
@@ -2037,6 +2333,7 @@ class PokerKitTableRuntimeManager:
 
             # Auto-start the next hand
             state = await runtime.start_new_hand(db)
+            await self._sync_turn_deadline(runtime)
 
             runtime.ready_players = set()
 
@@ -2056,7 +2353,9 @@ class PokerKitTableRuntimeManager:
             runtime.table.expires_at = None  # No fixed expiry after game starts
             await db.flush()
 
-            return await runtime.start_new_hand(db)
+            state = await runtime.start_new_hand(db)
+            await self._sync_turn_deadline(runtime)
+            return state
 
     async def handle_action(
         self,
@@ -2066,12 +2365,43 @@ class PokerKitTableRuntimeManager:
         action: ActionType,
         amount: Optional[int],
     ) -> Dict:
+        public_state, _ = await self.handle_action_with_view(
+            db, table_id, user_id, action, amount
+        )
+        return public_state
+
+    async def handle_action_with_view(
+        self,
+        db: AsyncSession,
+        table_id: int,
+        user_id: int,
+        action: ActionType,
+        amount: Optional[int],
+    ) -> Tuple[Dict, Dict]:
+        """
+        Apply an action and render the resulting state once.
+
+        Returns:
+            Tuple of (public state for broadcasting, acting player's state)
+        """
         lock = await self._get_distributed_lock(table_id)
         async with lock:
-            runtime = await self.ensure_table(db, table_id)
+            # READY mutates the seat, so it needs seats bound to this session
+            runtime = await self.ensure_table(
+                db, table_id, force_refresh=action == ActionType.READY
+            )
+
+            # The actor's turn started at the previous action (see turn_deadline)
+            acted_at = datetime.now(timezone.utc)
+            turn_started_at = runtime.table.last_action_at
+            turn_time_ms = None
+            if turn_started_at is not None:
+                if turn_started_at.tzinfo is None:
+                    turn_started_at = turn_started_at.replace(tzinfo=timezone.utc)
+                turn_time_ms = int((acted_at - turn_started_at).total_seconds() * 1000)
 
             # Update last_action_at to track table activity
-            runtime.table.last_action_at = datetime.now(timezone.utc)
+            runtime.table.last_action_at = acted_at
             await db.flush()
 
             # Get or load current hand with row lock to prevent race conditions
@@ -2133,12 +2463,14 @@ class PokerKitTableRuntimeManager:
                     hand_no=runtime.hand_no,
                 )
 
-                state = runtime.to_payload(user_id)
-                state["ready_players"] = list(runtime.ready_players)
-                state["ready_confirmed"] = True
-                return state
+                state, viewer_state = runtime.to_payloads(user_id)
+                for payload in (state, viewer_state):
+                    payload["ready_players"] = list(runtime.ready_players)
+                    payload["ready_confirmed"] = True
+                return state, viewer_state
 
             # Process normal poker actions
+            hand_id = runtime.current_hand.id
             result = runtime.handle_action(user_id, action, amount)
 
             # Reset timeout counter for player when they act normally (not via timeout)
@@ -2170,6 +2502,19 @@ class PokerKitTableRuntimeManager:
             await runtime._log_hand_event(
                 db, event_action_type, actor_user_id=user_id, amount=amount
             )
+            analytics_events = [
+                AnalyticsEvent(
+                    EVENT_ACTION,
+                    table_id,
+                    {
+                        "hand_id": hand_id,
+                        "user_id": user_id,
+                        "action_type": event_action_type,
+                        "amount": amount,
+                        "turn_time_ms": turn_time_ms,
+                    },
+                )
+            ]
 
             # Persist engine state after action
             if runtime.engine is None:
@@ -2191,6 +2536,33 @@ class PokerKitTableRuntimeManager:
                 hand_ended_event = await runtime._apply_hand_result_and_cleanup(
                     db, result["hand_result"]
                 )
+                # Financial commit: wallets, rake and hand status are durable
+                # before the lock is released; history/stats follow below.
+                await db.commit()
+                await schedule_table_timer(
+                    table_id,
+                    TableTimerKind.INTER_HAND,
+                    at=runtime.inter_hand_wait_start
+                    + timedelta(seconds=settings.post_hand_delay_seconds),
+                )
+
+                analytics_events.append(
+                    AnalyticsEvent(
+                        EVENT_HAND_FINISHED,
+                        table_id,
+                        {
+                            "hand_id": hand_id,
+                            "hand_no": hand_ended_event.get("hand_no"),
+                            "total_pot": hand_ended_event.get("total_pot"),
+                            "variant": _get_table_game_variant(runtime.table),
+                            "ended_at": runtime.inter_hand_wait_start.isoformat(),
+                            # Pairs, since JSON object keys would be strings
+                            "player_deltas": list(
+                                runtime.pending_completion.player_deltas.items()
+                            ),
+                        },
+                    )
+                )
 
                 # Store the hand_ended event for broadcasting
                 result["hand_ended_event"] = hand_ended_event
@@ -2213,6 +2585,8 @@ class PokerKitTableRuntimeManager:
                         runtime.current_hand.status = street_names[street]
 
             await db.flush()
+            # Replaces the acting player's deadline with the next actor's
+            await self._sync_turn_deadline(runtime)
 
             logger.info(
                 "Action persisted to DB",
@@ -2223,34 +2597,56 @@ class PokerKitTableRuntimeManager:
                 hand_status=runtime.current_hand.status.value,
             )
 
-            state = result.get("state", runtime.to_payload(user_id))
+            # Single render for both the broadcast and the acting player
+            state, viewer_state = runtime.to_payloads(user_id)
+            extras: Dict[str, Any] = {}
 
             # Add hand_result if present
             if "hand_result" in result:
-                state["hand_result"] = result["hand_result"]
+                extras["hand_result"] = result["hand_result"]
 
             # Propagate hand_ended_event if present (from _apply_hand_result_and_cleanup)
             if "hand_ended_event" in result:
-                state["hand_ended_event"] = result["hand_ended_event"]
+                extras["hand_ended_event"] = result["hand_ended_event"]
 
             # Propagate inter-hand wait status if present
             if "inter_hand_wait" in result:
-                state["inter_hand_wait"] = result["inter_hand_wait"]
-                state["inter_hand_wait_seconds"] = result.get(
+                extras["inter_hand_wait"] = result["inter_hand_wait"]
+                extras["inter_hand_wait_seconds"] = result.get(
                     "inter_hand_wait_seconds", settings.post_hand_delay_seconds
                 )
                 # THE FIX: Include the deadline for frontend countdown timer
-                state["inter_hand_wait_deadline"] = result.get(
+                extras["inter_hand_wait_deadline"] = result.get(
                     "inter_hand_wait_deadline"
                 )
 
             # Propagate table_ended status if present
             if "table_ended" in result:
-                state["table_ended"] = result["table_ended"]
-                state["table_status"] = result.get("table_status", "ended")
-                state["end_reason"] = result.get("end_reason", "completed")
+                extras["table_ended"] = result["table_ended"]
+                extras["table_status"] = result.get("table_status", "ended")
+                extras["end_reason"] = result.get("end_reason", "completed")
 
-            return state
+            state.update(extras)
+            viewer_state.update(extras)
+
+            completion_batch = runtime.pending_completion
+            runtime.pending_completion = None
+
+        # Outside the table lock: bulk-write hand history, events and stats
+        if completion_batch is not None:
+            await persist_hand_completion(db, completion_batch)
+
+        # Published to the analytics event bus when the caller commits
+        queue_analytics_events(db, *analytics_events)
+
+        return state, viewer_state
+
+    async def resync_turn_deadline(self, db: AsyncSession, table_id: int) -> None:
+        """Rebuild the turn deadline entry for a table from its current state."""
+        lock = await self._get_distributed_lock(table_id)
+        async with lock:
+            runtime = await self.ensure_table(db, table_id)
+            await self._sync_turn_deadline(runtime)
 
     async def get_state(
         self, db: AsyncSession, table_id: int, viewer_user_id: Optional[int]
@@ -2260,6 +2656,50 @@ class PokerKitTableRuntimeManager:
             runtime = await self.ensure_table(db, table_id)
             return runtime.to_payload(viewer_user_id)
 
+    def render_private_views(
+        self, table_id: int, public_state: Dict[str, Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Render the private view of every seated player for a public state.
+
+        Reads the runtime cached in this worker without taking the table lock;
+        callers broadcast right after the operation that produced
+        ``public_state``, so the cached engine matches it.
+
+        Returns:
+            Mapping of user_id to ``PokerKitTableRuntime.private_view`` output
+        """
+        runtime = self._tables.get(table_id)
+        if runtime is None:
+            return {}
+        return {
+            seat.user_id: runtime.private_view(seat.user_id, public_state)
+            for seat in runtime.seats
+            if seat.left_at is None
+        }
+
+    async def get_private_view(
+        self, db: AsyncSession, table_id: int, user_id: int
+    ) -> Dict[str, Any]:
+        """Render one player's private view from the current table state."""
+        lock = await self._get_distributed_lock(table_id)
+        async with lock:
+            runtime = await self.ensure_table(db, table_id)
+            return runtime.private_view(user_id, runtime.to_payload())
+
+    def get_template_block(self, table_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Return template metadata from this worker's runtime cache.
+
+        The cached runtime is refreshed whenever Table.version changes (which
+        template edits bump), so callers that just went through ensure_table
+        can use this instead of querying the template again.
+        """
+        runtime = self._tables.get(table_id)
+        if runtime is None:
+            return None
+        return runtime.get_template_block()
+
 
 _pokerkit_runtime_manager = PokerKitTableRuntimeManager()
 
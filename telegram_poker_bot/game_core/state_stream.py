@@ -0,0 +1,239 @@
+"""Sequenced table state stream for delta-encoded WebSocket updates.
+
+The last public ``table_state`` broadcast for each table is kept in Redis
+together with a sequence number. Each new broadcast atomically bumps the
+sequence and swaps the stored state, so every worker agrees on ordering.
+Clients that opted into deltas receive a full snapshot (with ``seq``) when
+they subscribe, then ``table_state_delta`` messages carrying JSON-patch
+operations against ``base_seq``; on a gap they ask for a resync.
+
+Every other table broadcast (``hand_ended``, ``player_joined``, ...) draws
+from the same sequence, so ``seq`` orders all messages of a table and
+``base_seq`` of a delta is the ``seq`` of the previous table state (not
+necessarily ``seq - 1``). The last ``REPLAY_BUFFER_SIZE`` messages are kept
+in a Redis list, so a client that reconnects with the last ``seq`` it saw
+gets only what it missed (see ``replay``) instead of refetching state.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+
+from telegram_poker_bot.game_core.ws_sender import encode_message
+from telegram_poker_bot.shared.logging import get_logger
+from telegram_poker_bot.shared.state_delta import diff_state
+
+logger = get_logger(__name__)
+
+STATE_STREAM_KEY = "ws:state:{table_id}"
+REPLAY_BUFFER_KEY = "ws:replay:{table_id}"
+# Idle tables drop their stream; the next broadcast starts a new one
+STATE_STREAM_TTL_SECONDS = 3600
+# Messages kept per table for resuming clients
+REPLAY_BUFFER_SIZE = 256
+
+ENTRY_STATE = "state"
+ENTRY_EVENT = "event"
+
+# Returns {new_seq, previous_state_or_nil, previous_state_seq_or_nil}
+_RECORD_SCRIPT = """
+local previous = redis.call('HGET', KEYS[1], 'state')
+local previous_seq = redis.call('HGET', KEYS[1], 'state_seq')
+local seq = redis.call('HINCRBY', KEYS[1], 'seq', 1)
+redis.call('HSET', KEYS[1], 'state', ARGV[1], 'state_seq', seq)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return {seq, previous, previous_seq}
+"""
+
+# Sequences an encoded event, buffers it and returns the new seq
+_RECORD_EVENT_SCRIPT = """
+local seq = redis.call('HINCRBY', KEYS[1], 'seq', 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+local frame = string.sub(ARGV[1], 1, -2) .. ',"seq":' .. seq .. '}'
+redis.call('RPUSH', KEYS[2], seq .. '\\n' .. ARGV[4] .. '\\n' .. frame)
+redis.call('LTRIM', KEYS[2], -tonumber(ARGV[3]), -1)
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return seq
+"""
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def with_seq(payload: str, seq: int) -> str:
+    """Append ``seq`` to an encoded JSON object without re-encoding it."""
+    if payload == "{}":
+        return f'{{"seq":{seq}}}'
+    return f'{payload[:-1]},"seq":{seq}}}'
+
+
+@dataclass
+class StateFrames:
+    """Encoded frames for one table state broadcast."""
+
+    full: str
+    # None when there is no base state or the delta is not smaller
+    delta: Optional[str] = None
+    seq: Optional[int] = None
+
+
+class TableStateStream:
+    """Redis-backed sequence and last state per table."""
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._record_script = redis_client.register_script(_RECORD_SCRIPT)
+        self._record_event_script = redis_client.register_script(
+            _RECORD_EVENT_SCRIPT
+        )
+
+    @staticmethod
+    def _key(table_id: int) -> str:
+        return STATE_STREAM_KEY.format(table_id=table_id)
+
+    @staticmethod
+    def _replay_key(table_id: int) -> str:
+        return REPLAY_BUFFER_KEY.format(table_id=table_id)
+
+    async def _buffer(self, table_id: int, seq: int, kind: str, frame: str) -> None:
+        key = self._replay_key(table_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.rpush(key, f"{seq}\n{kind}\n{frame}")
+        pipe.ltrim(key, -REPLAY_BUFFER_SIZE, -1)
+        pipe.expire(key, STATE_STREAM_TTL_SECONDS)
+        await pipe.execute()
+
+    async def encode_update(
+        self, table_id: int, message: Dict[str, Any]
+    ) -> StateFrames:
+        """Record a table state and build its full and delta frames."""
+        payload = encode_message(message)
+        try:
+            seq, previous, previous_seq = await self._record_script(
+                keys=[self._key(table_id)],
+                args=[payload, STATE_STREAM_TTL_SECONDS],
+            )
+        except Exception as exc:
+            # Without a sequence, delta clients treat this as a fresh snapshot
+            logger.warning(
+                "Failed to record table state stream",
+                table_id=table_id,
+                error=str(exc),
+            )
+            return StateFrames(full=payload)
+
+        seq = int(seq)
+        frames = StateFrames(full=with_seq(payload, seq), seq=seq)
+        if previous is not None and previous_seq is not None:
+            ops = diff_state(json.loads(_decode(previous)), json.loads(payload))
+            delta = encode_message(
+                {
+                    "type": "table_state_delta",
+                    "table_id": table_id,
+                    "seq": seq,
+                    "base_seq": int(previous_seq),
+                    "ops": ops,
+                }
+            )
+            if len(delta) < len(frames.full):
+                frames.delta = delta
+
+        try:
+            await self._buffer(
+                table_id, seq, ENTRY_STATE, frames.delta or frames.full
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to buffer table state", table_id=table_id, error=str(exc)
+            )
+        return frames
+
+    async def encode_event(self, table_id: int, message: Dict[str, Any]) -> str:
+        """Sequence and buffer a non-state table message; returns its frame."""
+        payload = encode_message(message)
+        try:
+            seq = await self._record_event_script(
+                keys=[self._key(table_id), self._replay_key(table_id)],
+                args=[
+                    payload,
+                    STATE_STREAM_TTL_SECONDS,
+                    REPLAY_BUFFER_SIZE,
+                    ENTRY_EVENT,
+                ],
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to record table event", table_id=table_id, error=str(exc)
+            )
+            return payload
+        return with_seq(payload, int(seq))
+
+    async def snapshot(self, table_id: int) -> Tuple[Optional[int], Optional[str]]:
+        """Return the latest state's sequence and encoded snapshot frame, if any."""
+        seq, state = await self.redis.hmget(self._key(table_id), "state_seq", "state")
+        if seq is None or state is None:
+            return None, None
+        seq = int(seq)
+        return seq, with_seq(_decode(state), seq)
+
+    async def replay(
+        self, table_id: int, last_seq: int, deltas: bool
+    ) -> Optional[str]:
+        """Build a ``table_replay`` frame with the messages after ``last_seq``.
+
+        Delta clients get the buffered messages in order (state changes as
+        deltas where one was sent). Other clients get the missed events
+        followed by the current full state, if it changed. Returns None
+        when the buffer no longer reaches back to ``last_seq``.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(self._key(table_id), "seq", "state_seq", "state")
+        pipe.lrange(self._replay_key(table_id), 0, -1)
+        (current_seq, state_seq, state), raw_entries = await pipe.execute()
+        if current_seq is None:
+            return None
+        current_seq = int(current_seq)
+        if last_seq > current_seq:
+            # The stream expired and restarted since the client's last message
+            return None
+
+        entries = []
+        for raw in raw_entries:
+            seq, kind, frame = _decode(raw).split("\n", 2)
+            entries.append((int(seq), kind, frame))
+        entries.sort(key=lambda entry: entry[0])
+        oldest = entries[0][0] if entries else current_seq + 1
+        if last_seq < current_seq and last_seq + 1 < oldest:
+            return None
+
+        missed = [entry for entry in entries if entry[0] > last_seq]
+        if deltas:
+            messages = [frame for _, _, frame in missed]
+        else:
+            messages = [frame for _, kind, frame in missed if kind == ENTRY_EVENT]
+            if state is not None and any(kind == ENTRY_STATE for _, kind, _ in missed):
+                messages.append(with_seq(_decode(state), int(state_seq)))
+
+        return (
+            f'{{"type":"table_replay","table_id":{table_id},'
+            f'"from_seq":{last_seq},"to_seq":{current_seq},'
+            f'"messages":[{",".join(messages)}]}}'
+        )
+
+
+_table_state_stream: Optional[TableStateStream] = None
+
+
+async def get_table_state_stream() -> TableStateStream:
+    """Get the process-wide table state stream."""
+    global _table_state_stream
+    if _table_state_stream is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _table_state_stream = TableStateStream(await get_redis_client())
+    return _table_state_stream
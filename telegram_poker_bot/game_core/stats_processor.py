@@ -4,21 +4,36 @@ This service calculates and updates UserPokerStats after each hand completion.
 It runs asynchronously as a background task to avoid blocking the main game flow.
 """
 
-from typing import Dict, Any, List
-from sqlalchemy import select
+from typing import Dict, Any, Iterable, List
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.models import (
     UserPokerStats,
     Hand,
-    Action,
-    ActionType,
     Seat,
 )
 
 logger = get_logger(__name__)
 
+# Hand ranks from best to worst
+HAND_RANK_ORDER = {
+    "Royal Flush": 10,
+    "Straight Flush": 9,
+    "Four of a Kind": 8,
+    "Full House": 7,
+    "Flush": 6,
+    "Straight": 5,
+    "Three of a Kind": 4,
+    "Two Pair": 3,
+    "Two Pairs": 3,  # Alternative naming
+    "Pair": 2,
+    "One Pair": 2,  # Alternative naming
+    "High Card": 1,
+}
+
 
 class StatsProcessor:
     """
@@ -53,88 +68,33 @@ class StatsProcessor:
 
         return stats
 
-    @staticmethod
-    async def calculate_vpip(db: AsyncSession, hand: Hand, user_id: int) -> bool:
-        """
-        Calculate if user voluntarily put money in pot (VPIP).
-
-        VPIP = True if user made any of: bet, call, or raise actions.
-        Excludes forced actions (blinds, antes).
-
-        Args:
-            db: Database session
-            hand: Hand record
-            user_id: User ID
-
-        Returns:
-            True if user had VPIP in this hand
-        """
-        result = await db.execute(
-            select(Action)
-            .where(
-                Action.hand_id == hand.id,
-                Action.user_id == user_id,
-                Action.type.in_([ActionType.BET, ActionType.CALL, ActionType.RAISE]),
-            )
-            .limit(1)
-        )
-        action = result.scalar_one_or_none()
-        return action is not None
-
-    @staticmethod
-    async def calculate_pfr(db: AsyncSession, hand: Hand, user_id: int) -> bool:
-        """
-        Calculate if user raised pre-flop (PFR).
-
-        PFR = True if user raised during pre-flop phase.
-
-        NOTE: Current implementation is simplified and counts ANY raise as PFR.
-        This is an approximation that will be improved when we add street tracking
-        to the Action table. For accurate PFR, we need to know which betting round
-        (street) each action occurred on.
-
-        TODO: Add street field to Action table for accurate PFR calculation.
-
-        Args:
-            db: Database session
-            hand: Hand record
-            user_id: User ID
-
-        Returns:
-            True if user has any RAISE action (simplified approximation)
-        """
-        # Simplified: check if user has ANY raise action in this hand
-        # In production, you'd track street in Action table or use HandHistoryEvent
-        result = await db.execute(
-            select(Action)
-            .where(
-                Action.hand_id == hand.id,
-                Action.user_id == user_id,
-                Action.type == ActionType.RAISE,
-            )
-            .limit(1)
-        )
-        action = result.scalar_one_or_none()
-
-        return action is not None
-
     @staticmethod
     async def update_stats(
         db: AsyncSession,
         hand: Hand,
         hand_result: Dict[str, Any],
         seats: List[Seat],
+        vpip_user_ids: Iterable[int] = (),
+        pfr_user_ids: Iterable[int] = (),
     ) -> None:
         """
         Update UserPokerStats for all players in a completed hand.
 
-        This is called immediately after hand completion in pokerkit_runtime.py.
+        All participants are written with one ``INSERT ... ON CONFLICT DO
+        UPDATE`` that adds the hand to existing rows (or creates them), keeps
+        the better best hand rank and biggest pot, and extends or flips each
+        player's win/loss streak. VPIP/PFR come from the engine's
+        in-memory record of the hand's actions
+        (``PokerEngineAdapter.get_voluntary_actions``). Called from the
+        hand-completion pipeline after the financial commit.
 
         Args:
             db: Database session
             hand: Completed hand record
             hand_result: Hand result dictionary with winners info
             seats: List of seats involved in the hand
+            vpip_user_ids: Users who voluntarily put chips in the pot
+            pfr_user_ids: Users who raised preflop
         """
         if not hand_result:
             logger.warning(
@@ -144,78 +104,101 @@ class StatsProcessor:
             return
 
         winners = hand_result.get("winners", [])
-        winner_user_ids = {w["user_id"] for w in winners}
-
-        # Process each player who participated
-        for seat in seats:
-            if seat.left_at is not None:
-                # Skip players who left during the hand
-                continue
-
-            user_id = seat.user_id
-
-            try:
-                # Ensure stats record exists
-                stats = await StatsProcessor.ensure_user_stats(db, user_id)
-
-                # Increment total hands
-                stats.total_hands += 1
-
-                # Calculate VPIP (Voluntarily Put $ In Pot)
-                has_vpip = await StatsProcessor.calculate_vpip(db, hand, user_id)
-                if has_vpip:
-                    stats.vpip_count += 1
-
-                # Calculate PFR (Pre-Flop Raise)
-                has_pfr = await StatsProcessor.calculate_pfr(db, hand, user_id)
-                if has_pfr:
-                    stats.pfr_count += 1
+        winner_by_user_id = {w["user_id"]: w for w in winners}
 
-                # Update wins and winnings
-                if user_id in winner_user_ids:
-                    stats.wins += 1
+        # Skip players who left during the hand
+        user_ids = [seat.user_id for seat in seats if seat.left_at is None]
+        if not user_ids:
+            return
 
-                    # Find winning amount for this user
-                    for winner in winners:
-                        if winner["user_id"] == user_id:
-                            amount = winner.get("amount", 0)
-                            stats.total_winnings += amount
+        vpip_user_ids = set(vpip_user_ids)
+        pfr_user_ids = set(pfr_user_ids)
+
+        # Sorted so concurrent upserts lock rows in the same order
+        rows = []
+        for user_id in sorted(user_ids):
+            winner = winner_by_user_id.get(user_id)
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "total_hands": 1,
+                    "wins": 1 if winner is not None else 0,
+                    "vpip_count": 1 if user_id in vpip_user_ids else 0,
+                    "pfr_count": 1 if user_id in pfr_user_ids else 0,
+                    "total_winnings": winner.get("amount", 0) if winner else 0,
+                    "best_hand_rank": (winner.get("hand_rank") or None) if winner else None,
+                    "biggest_pot": winner.get("amount", 0) if winner else 0,
+                    "current_streak": 1 if winner is not None else -1,
+                }
+            )
 
-                            # Update best hand rank if better
-                            hand_rank = winner.get("hand_rank", "")
-                            if hand_rank:
-                                if (
-                                    not stats.best_hand_rank
-                                    or StatsProcessor._is_better_hand(
-                                        hand_rank, stats.best_hand_rank
-                                    )
-                                ):
-                                    stats.best_hand_rank = hand_rank
+        stmt = pg_insert(UserPokerStats).values(rows)
+        current = UserPokerStats.__table__.c
+        new_rank = stmt.excluded.best_hand_rank
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "total_hands": current.total_hands + stmt.excluded.total_hands,
+                "wins": current.wins + stmt.excluded.wins,
+                "vpip_count": current.vpip_count + stmt.excluded.vpip_count,
+                "pfr_count": current.pfr_count + stmt.excluded.pfr_count,
+                "total_winnings": current.total_winnings + stmt.excluded.total_winnings,
+                # Same rule as _is_better_hand
+                "best_hand_rank": case(
+                    (
+                        and_(
+                            func.coalesce(new_rank, "") != "",
+                            or_(
+                                func.coalesce(current.best_hand_rank, "") == "",
+                                StatsProcessor._hand_rank_score(new_rank)
+                                > StatsProcessor._hand_rank_score(current.best_hand_rank),
+                            ),
+                        ),
+                        new_rank,
+                    ),
+                    else_=current.best_hand_rank,
+                ),
+                "biggest_pot": func.greatest(
+                    current.biggest_pot, stmt.excluded.biggest_pot
+                ),
+                "current_streak": case(
+                    (
+                        stmt.excluded.wins > 0,
+                        case(
+                            (current.current_streak >= 0, current.current_streak + 1),
+                            else_=1,
+                        ),
+                    ),
+                    (current.current_streak <= 0, current.current_streak - 1),
+                    else_=-1,
+                ),
+                # onupdate is not applied to ON CONFLICT updates
+                "updated_at": func.now(),
+            },
+        )
 
-                await db.flush()
+        try:
+            await db.execute(stmt)
 
-                logger.info(
-                    "Updated user poker stats",
-                    user_id=user_id,
-                    hand_id=hand.id,
-                    total_hands=stats.total_hands,
-                    wins=stats.wins,
-                    vpip_pct=(
-                        stats.vpip_count / stats.total_hands * 100
-                        if stats.total_hands > 0
-                        else 0
-                    ),
-                )
+            logger.info(
+                "Updated user poker stats",
+                hand_id=hand.id,
+                user_count=len(user_ids),
+                winners=len(winner_by_user_id),
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to update stats for hand",
+                hand_id=hand.id,
+                user_ids=user_ids,
+                error=str(e),
+            )
+            raise
 
-            except Exception as e:
-                logger.error(
-                    "Failed to update stats for user",
-                    user_id=user_id,
-                    hand_id=hand.id,
-                    error=str(e),
-                )
-                # Don't fail the entire hand completion if stats update fails
-                continue
+    @staticmethod
+    def _hand_rank_score(rank):
+        """SQL expression scoring a hand rank column like ``_is_better_hand``."""
+        return case(HAND_RANK_ORDER, value=rank, else_=0)
 
     @staticmethod
     def _is_better_hand(new_rank: str, old_rank: str) -> bool:
@@ -241,22 +224,7 @@ class StatsProcessor:
         Returns:
             True if new rank is better than old rank
         """
-        rank_order = {
-            "Royal Flush": 10,
-            "Straight Flush": 9,
-            "Four of a Kind": 8,
-            "Full House": 7,
-            "Flush": 6,
-            "Straight": 5,
-            "Three of a Kind": 4,
-            "Two Pair": 3,
-            "Two Pairs": 3,  # Alternative naming
-            "Pair": 2,
-            "One Pair": 2,  # Alternative naming
-            "High Card": 1,
-        }
-
-        new_score = rank_order.get(new_rank, 0)
-        old_score = rank_order.get(old_rank, 0)
+        new_score = HAND_RANK_ORDER.get(new_rank, 0)
+        old_score = HAND_RANK_ORDER.get(old_rank, 0)
 
         return new_score > old_score
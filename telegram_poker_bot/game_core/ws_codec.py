@@ -0,0 +1,190 @@
+"""Wire protocols for WebSocket clients: JSON (default) or MessagePack.
+
+A client opts into the binary protocol at connect time, either with the
+``poker.msgpack`` WebSocket subprotocol or a ``?protocol=msgpack`` query
+param. Binary clients get MessagePack frames in which numbers stay native
+integers and card lists (``board``, ``hole_cards``, ``cards``,
+``best_hand_cards``) are packed as ``bin`` values with one byte per card:
+``rank * 4 + suit`` over ``RANKS`` and ``SUITS``, ``0xFF`` for a hidden card.
+
+Broadcasts are still serialized once as JSON (that is what the Redis fan-out
+and the state stream carry). ``FrameSet`` transcodes a broadcast frame to
+MessagePack at most once per worker, and only when a binary client is
+attached, so adding binary clients costs one transcode per message rather
+than one per socket. Clients may send either text (JSON) or binary
+(MessagePack) frames regardless of the negotiated protocol.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import msgpack
+from fastapi import WebSocket, WebSocketDisconnect
+
+from telegram_poker_bot.game_core.ws_sender import Frame, encode_message
+
+PROTOCOL_JSON = "json"
+PROTOCOL_MSGPACK = "msgpack"
+
+# WebSocket subprotocol name -> wire protocol
+SUBPROTOCOLS = {
+    "poker.json": PROTOCOL_JSON,
+    "poker.msgpack": PROTOCOL_MSGPACK,
+}
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+HIDDEN_CARD = 0xFF
+
+# Keys whose values are lists of card strings
+CARD_FIELDS = frozenset({"board", "hole_cards", "cards", "best_hand_cards"})
+
+
+def negotiate_protocol(websocket: WebSocket) -> Tuple[str, Optional[str]]:
+    """Pick the wire protocol for a connecting socket.
+
+    Returns the protocol and the subprotocol to echo in ``accept`` (None
+    when the client did not offer a known one).
+    """
+    for offered in websocket.scope.get("subprotocols") or []:
+        protocol = SUBPROTOCOLS.get(offered)
+        if protocol is not None:
+            return protocol, offered
+    requested = (websocket.query_params.get("protocol") or "").lower()
+    if requested == PROTOCOL_MSGPACK:
+        return PROTOCOL_MSGPACK, None
+    return PROTOCOL_JSON, None
+
+
+def pack_cards(cards: List[Any]) -> Optional[bytes]:
+    """Pack card strings (``"Ah"``, ``"??"``) into one byte each.
+
+    Returns None when any item is not a card, so the list is sent as-is.
+    """
+    packed = bytearray()
+    for card in cards:
+        if not isinstance(card, str) or len(card) != 2:
+            return None
+        if card == "??":
+            packed.append(HIDDEN_CARD)
+            continue
+        rank = RANKS.find(card[0].upper())
+        suit = SUITS.find(card[1].lower())
+        if rank < 0 or suit < 0:
+            return None
+        packed.append(rank * 4 + suit)
+    return bytes(packed)
+
+
+def unpack_cards(packed: bytes) -> List[str]:
+    """Inverse of ``pack_cards``."""
+    return [
+        "??" if code == HIDDEN_CARD else RANKS[code // 4] + SUITS[code % 4]
+        for code in packed
+    ]
+
+
+def _to_wire(value: Any, key: Optional[str] = None) -> Any:
+    if isinstance(value, dict):
+        return {k: _to_wire(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        if key in CARD_FIELDS:
+            packed = pack_cards(value)
+            if packed is not None:
+                return packed
+        return [_to_wire(item) for item in value]
+    return value
+
+
+def _op_to_wire(op: Dict[str, Any]) -> Dict[str, Any]:
+    """Pack cards inside a ``table_state_delta`` operation value."""
+    if "value" not in op:
+        return op
+    tokens = op.get("path", "").split("/")[1:]
+    field = next((token for token in reversed(tokens) if not token.isdigit()), None)
+    value = op["value"]
+    if field in CARD_FIELDS and isinstance(value, str):
+        # A single card replaced within a card list (e.g. /board/3)
+        packed = pack_cards([value])
+        if packed is not None:
+            return dict(op, value=packed)
+    return dict(op, value=_to_wire(value, field))
+
+
+def to_wire(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JSON-shaped message to its MessagePack form."""
+    if message.get("type") == "table_state_delta":
+        return dict(message, ops=[_op_to_wire(op) for op in message.get("ops", [])])
+    return _to_wire(message)
+
+
+def pack_message(message: Dict[str, Any]) -> bytes:
+    """Serialize a message as a MessagePack frame."""
+    return msgpack.packb(to_wire(message), use_bin_type=True)
+
+
+def transcode(payload: str) -> bytes:
+    """Convert an encoded JSON frame to a MessagePack frame."""
+    return pack_message(json.loads(payload))
+
+
+def encode_frame(message: Dict[str, Any], protocol: str) -> Frame:
+    """Serialize a message for one protocol."""
+    if protocol == PROTOCOL_MSGPACK:
+        return pack_message(message)
+    return encode_message(message)
+
+
+class FrameSet:
+    """Encoded JSON frames of one broadcast, transcoded lazily per protocol."""
+
+    def __init__(self, frames: Dict[str, str]):
+        self.frames = frames
+        self._binary: Dict[str, bytes] = {}
+
+    def get(self, label: str, protocol: str = PROTOCOL_JSON) -> Optional[Frame]:
+        payload = self.frames.get(label)
+        if payload is None or protocol != PROTOCOL_MSGPACK:
+            return payload
+        packed = self._binary.get(label)
+        if packed is None:
+            packed = self._binary[label] = transcode(payload)
+        return packed
+
+
+async def send_message(
+    websocket: WebSocket, message: Dict[str, Any], protocol: str = PROTOCOL_JSON
+) -> None:
+    """Send one message directly (outside a ``WebSocketSender`` queue)."""
+    frame = encode_frame(message, protocol)
+    if isinstance(frame, bytes):
+        await websocket.send_bytes(frame)
+    else:
+        await websocket.send_text(frame)
+
+
+async def receive_frame(websocket: WebSocket) -> Frame:
+    """Receive one text or binary frame; raises ``WebSocketDisconnect``."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("bytes") is not None:
+        return message["bytes"]
+    return message.get("text") or ""
+
+
+def decode_frame(frame: Frame) -> Any:
+    """Decode a client frame (JSON text or MessagePack bytes).
+
+    Raises ValueError when the frame cannot be decoded.
+    """
+    if not frame:
+        return {}
+    if isinstance(frame, bytes):
+        try:
+            return msgpack.unpackb(frame, raw=False)
+        except Exception as exc:
+            raise ValueError(f"Invalid MessagePack frame: {exc}") from exc
+    return json.loads(frame)
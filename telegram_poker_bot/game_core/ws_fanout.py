@@ -0,0 +1,290 @@
+"""Cross-worker WebSocket fan-out over Redis pub/sub.
+
+Each API worker only holds its own sockets. Broadcasts are published once to
+a Redis channel (``ws:table:{table_id}`` or ``ws:lobby``) and every worker
+relays them to the sockets attached to it, so any number of workers can run
+behind a plain load balancer. Workers subscribe to a table channel only while
+they hold at least one socket for that table.
+
+The publishing worker delivers to its own sockets directly and ignores its
+own messages coming back from Redis. Every subscribed channel is drained by
+its own relay task through a queue. Table channels use a bounded queue: when
+local sockets cannot keep up, the oldest pending messages are dropped instead
+of letting the pub/sub connection buffer grow without bound. Table messages
+are sequenced (see ``state_stream``), so a client that misses one sees a gap
+in ``seq`` and resyncs. Lobby batches are diffs without a sequence, and a
+dropped ``TABLE_REMOVED`` would never be repaired, so the lobby channel is
+subscribed ``lossless``; its volume is already bounded by the coalescing
+window (see ``lobby_stream``).
+
+Messages travel already serialized: a header line (origin worker, kind and
+frame labels) followed by one encoded WebSocket frame per line, so relaying
+never re-encodes JSON. A table state update carries its full frame, its
+delta frame and the per-seat private frames in a single message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as redis
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+LOBBY_CHANNEL = "ws:lobby"
+TABLE_CHANNEL_PREFIX = "ws:table:"
+# Pending messages per channel before the oldest ones are dropped (except
+# lossless channels)
+RELAY_QUEUE_SIZE = 256
+
+# Envelope kinds
+KIND_BROADCAST = "broadcast"
+KIND_CLOSE = "close"
+
+# Frame labels
+FRAME_FULL = "full"
+FRAME_DELTA = "delta"
+
+# handler(kind, frames) where frames maps labels ("full", "delta", ...) to text
+RelayHandler = Callable[[str, Dict[str, str]], Awaitable[None]]
+
+
+def table_channel(table_id: int) -> str:
+    """Return the pub/sub channel for a table."""
+    return f"{TABLE_CHANNEL_PREFIX}{table_id}"
+
+
+def private_frame_label(user_id: int) -> str:
+    """Label of a seated player's private frame within a table message."""
+    return f"user:{user_id}"
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+@dataclass
+class ChannelMetrics:
+    """Counters for one pub/sub channel (or the worker-wide totals)."""
+
+    published: int = 0
+    publish_errors: int = 0
+    received: int = 0
+    relayed: int = 0
+    relay_errors: int = 0
+    dropped: int = 0
+    max_queue_depth: int = 0
+
+
+class WebSocketFanout:
+    """Publish WebSocket broadcasts to Redis and relay them to local sockets."""
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self.worker_id = uuid.uuid4().hex
+        self.totals = ChannelMetrics()
+        self._metrics: Dict[str, ChannelMetrics] = {}
+        self._handlers: Dict[str, RelayHandler] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._relay_tasks: Dict[str, asyncio.Task] = {}
+        self._pubsub = redis_client.pubsub()
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start reading subscribed channels."""
+        if self._reader_task is None:
+            self._reader_task = asyncio.create_task(self._read_loop())
+            logger.info("WebSocket fan-out started", worker_id=self.worker_id)
+
+    async def stop(self) -> None:
+        """Stop the reader and relay tasks and close the pub/sub connection."""
+        tasks = list(self._relay_tasks.values())
+        if self._reader_task is not None:
+            tasks.append(self._reader_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reader_task = None
+        self._relay_tasks.clear()
+        self._queues.clear()
+        self._handlers.clear()
+        try:
+            await self._pubsub.reset()
+        except Exception as exc:
+            logger.warning("Failed to close fan-out pubsub", error=str(exc))
+
+    def is_subscribed(self, channel: str) -> bool:
+        return channel in self._handlers
+
+    async def subscribe(
+        self, channel: str, handler: RelayHandler, lossless: bool = False
+    ) -> None:
+        """Relay messages published on ``channel`` to ``handler``.
+
+        ``lossless`` channels never drop pending messages; use it only for
+        channels whose publish rate is bounded.
+        """
+        if channel in self._handlers:
+            return
+        self._handlers[channel] = handler
+        self._queues[channel] = asyncio.Queue(
+            maxsize=0 if lossless else RELAY_QUEUE_SIZE
+        )
+        self._metrics.setdefault(channel, ChannelMetrics())
+        self._relay_tasks[channel] = asyncio.create_task(self._relay(channel))
+        await self._pubsub.subscribe(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        """Stop relaying a channel; pending messages are discarded."""
+        if self._handlers.pop(channel, None) is None:
+            return
+        self._queues.pop(channel, None)
+        self._metrics.pop(channel, None)
+        task = self._relay_tasks.pop(channel, None)
+        if task is not None:
+            task.cancel()
+        await self._pubsub.unsubscribe(channel)
+
+    async def publish(
+        self,
+        channel: str,
+        frames: Optional[Dict[str, str]] = None,
+        kind: str = KIND_BROADCAST,
+    ) -> bool:
+        """Publish encoded frames to all workers; returns False if Redis failed."""
+        metrics = self._metrics.get(channel)
+        frames = frames or {}
+        try:
+            header = json.dumps(
+                {"origin": self.worker_id, "kind": kind, "labels": list(frames)}
+            )
+            # Encoded JSON never contains a raw newline
+            await self.redis.publish(channel, "\n".join([header, *frames.values()]))
+        except Exception as exc:
+            self.totals.publish_errors += 1
+            if metrics is not None:
+                metrics.publish_errors += 1
+            logger.warning(
+                "Fan-out publish failed",
+                channel=channel,
+                kind=kind,
+                error=str(exc),
+            )
+            return False
+
+        self.totals.published += 1
+        if metrics is not None:
+            metrics.published += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of worker-wide and per-channel counters."""
+        return {
+            "worker_id": self.worker_id,
+            "totals": asdict(self.totals),
+            "channels": {
+                channel: dict(
+                    asdict(metrics),
+                    queue_depth=(
+                        self._queues[channel].qsize()
+                        if channel in self._queues
+                        else 0
+                    ),
+                )
+                for channel, metrics in self._metrics.items()
+            },
+        }
+
+    async def _read_loop(self) -> None:
+        while True:
+            try:
+                if not self._pubsub.channels:
+                    await asyncio.sleep(0.5)
+                    continue
+                raw = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # redis-py reconnects and re-subscribes on the next read
+                logger.warning("Fan-out read failed", error=str(exc))
+                await asyncio.sleep(1)
+                continue
+
+            if raw is None or raw.get("type") != "message":
+                continue
+            self._enqueue(_decode(raw["channel"]), raw["data"])
+
+    def _enqueue(self, channel: str, data: Any) -> None:
+        queue = self._queues.get(channel)
+        metrics = self._metrics.get(channel)
+        if queue is None or metrics is None:
+            return
+
+        try:
+            header, *payloads = _decode(data).split("\n")
+            envelope = json.loads(header)
+            labels = envelope.get("labels", [])
+            if len(labels) != len(payloads):
+                raise ValueError("frame count mismatch")
+            envelope["frames"] = dict(zip(labels, payloads))
+        except ValueError:
+            logger.warning("Dropping malformed fan-out message", channel=channel)
+            return
+        if envelope.get("origin") == self.worker_id:
+            # Already delivered locally by the publishing call
+            return
+
+        metrics.received += 1
+        self.totals.received += 1
+        if queue.full():
+            queue.get_nowait()
+            metrics.dropped += 1
+            self.totals.dropped += 1
+            logger.warning(
+                "Fan-out relay queue full, dropped oldest message",
+                channel=channel,
+                dropped=metrics.dropped,
+            )
+        queue.put_nowait(envelope)
+        depth = queue.qsize()
+        metrics.max_queue_depth = max(metrics.max_queue_depth, depth)
+        self.totals.max_queue_depth = max(self.totals.max_queue_depth, depth)
+
+    async def _relay(self, channel: str) -> None:
+        queue = self._queues[channel]
+        handler = self._handlers[channel]
+        metrics = self._metrics[channel]
+        while True:
+            envelope = await queue.get()
+            try:
+                await handler(envelope.get("kind", KIND_BROADCAST), envelope["frames"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                metrics.relay_errors += 1
+                self.totals.relay_errors += 1
+                logger.error("Fan-out relay failed", channel=channel, error=str(exc))
+            else:
+                metrics.relayed += 1
+                self.totals.relayed += 1
+
+
+_ws_fanout: Optional[WebSocketFanout] = None
+
+
+async def get_ws_fanout() -> WebSocketFanout:
+    """Get the process-wide WebSocket fan-out."""
+    global _ws_fanout
+    if _ws_fanout is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _ws_fanout = WebSocketFanout(await get_redis_client())
+    return _ws_fanout
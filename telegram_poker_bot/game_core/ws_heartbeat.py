@@ -0,0 +1,195 @@
+"""Central heartbeat for WebSocket connections.
+
+One task per worker pings every registered socket each
+``HEARTBEAT_INTERVAL_SECONDS`` instead of one sleeping task per socket. The
+ping frame is encoded once per protocol per round, sockets are pinged in
+batches of ``HEARTBEAT_BATCH_SIZE`` (yielding to the event loop between
+batches), and any frame received from a client counts as a sign of life.
+Sockets silent for longer than ``HEARTBEAT_TIMEOUT_SECONDS`` (clients answer
+pings with ``pong``) are closed together at the end of the round.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import WebSocket
+
+from telegram_poker_bot.game_core.ws_codec import PROTOCOL_JSON, encode_frame
+from telegram_poker_bot.game_core.ws_sender import Frame
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+HEARTBEAT_INTERVAL_SECONDS = 30
+# Three missed rounds
+HEARTBEAT_TIMEOUT_SECONDS = 90
+HEARTBEAT_BATCH_SIZE = 500
+# Close code for sockets that stopped answering (1001: going away)
+HEARTBEAT_CLOSE_CODE = 1001
+
+
+@dataclass
+class _Peer:
+    # Queues or sends a frame; may return an awaitable
+    send: Callable[[Frame], Any]
+    close: Callable[[int], Awaitable[None]]
+    protocol: str
+    last_seen: float
+
+
+@dataclass
+class HeartbeatMetrics:
+    rounds: int = 0
+    pings_sent: int = 0
+    ping_errors: int = 0
+    reaped: int = 0
+    last_round_ms: float = 0.0
+
+
+class HeartbeatManager:
+    """Ping registered sockets in batches and reap the silent ones."""
+
+    def __init__(
+        self,
+        interval: float = HEARTBEAT_INTERVAL_SECONDS,
+        timeout: float = HEARTBEAT_TIMEOUT_SECONDS,
+        batch_size: int = HEARTBEAT_BATCH_SIZE,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.metrics = HeartbeatMetrics()
+        self._peers: Dict[WebSocket, _Peer] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        websocket: WebSocket,
+        send: Callable[[Frame], Any],
+        close: Callable[[int], Awaitable[None]],
+        protocol: str = PROTOCOL_JSON,
+    ) -> None:
+        """Start heartbeating a socket; starts the heartbeat task if needed."""
+        self._peers[websocket] = _Peer(
+            send=send, close=close, protocol=protocol, last_seen=time.monotonic()
+        )
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def unregister(self, websocket: WebSocket) -> None:
+        self._peers.pop(websocket, None)
+
+    def touch(self, websocket: WebSocket) -> None:
+        """Record that a frame arrived from the client."""
+        peer = self._peers.get(websocket)
+        if peer is not None:
+            peer.last_seen = time.monotonic()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._peers.clear()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_round()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("Heartbeat round failed", error=str(exc))
+
+    async def run_round(self) -> None:
+        """Ping live sockets and close the ones past the timeout."""
+        started = time.monotonic()
+        frames: Dict[str, Frame] = {}
+        dead: List[Tuple[WebSocket, _Peer]] = []
+        pending: List[Tuple[WebSocket, _Peer, Awaitable]] = []
+
+        for index, (websocket, peer) in enumerate(list(self._peers.items()), 1):
+            if started - peer.last_seen > self.timeout:
+                dead.append((websocket, peer))
+                continue
+            frame = frames.get(peer.protocol)
+            if frame is None:
+                frame = frames[peer.protocol] = encode_frame(
+                    {"type": "ping"}, peer.protocol
+                )
+            try:
+                result = peer.send(frame)
+            except Exception:
+                dead.append((websocket, peer))
+                continue
+            if inspect.isawaitable(result):
+                pending.append((websocket, peer, result))
+            else:
+                self.metrics.pings_sent += 1
+            if index % self.batch_size == 0:
+                dead.extend(await self._await_sends(pending))
+                pending = []
+                await asyncio.sleep(0)
+        dead.extend(await self._await_sends(pending))
+
+        if dead:
+            for websocket, _ in dead:
+                self._peers.pop(websocket, None)
+            await asyncio.gather(
+                *(peer.close(HEARTBEAT_CLOSE_CODE) for _, peer in dead),
+                return_exceptions=True,
+            )
+            self.metrics.reaped += len(dead)
+            logger.info("Reaped unresponsive WebSockets", count=len(dead))
+
+        self.metrics.rounds += 1
+        self.metrics.last_round_ms = round((time.monotonic() - started) * 1000, 2)
+
+    async def _await_sends(
+        self, pending: List[Tuple[WebSocket, _Peer, Awaitable]]
+    ) -> List[Tuple[WebSocket, _Peer]]:
+        if not pending:
+            return []
+        results = await asyncio.gather(
+            *(send for _, _, send in pending), return_exceptions=True
+        )
+        failed = []
+        for (websocket, peer, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self.metrics.ping_errors += 1
+                failed.append((websocket, peer))
+            else:
+                self.metrics.pings_sent += 1
+        return failed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "registered": len(self._peers),
+            "interval_seconds": self.interval,
+            "timeout_seconds": self.timeout,
+            "rounds": self.metrics.rounds,
+            "pings_sent": self.metrics.pings_sent,
+            "ping_errors": self.metrics.ping_errors,
+            "reaped": self.metrics.reaped,
+            "last_round_ms": self.metrics.last_round_ms,
+        }
+
+
+_heartbeat_manager: Optional[HeartbeatManager] = None
+
+
+def get_heartbeat_manager() -> HeartbeatManager:
+    """Get the process-wide WebSocket heartbeat manager."""
+    global _heartbeat_manager
+    if _heartbeat_manager is None:
+        _heartbeat_manager = HeartbeatManager()
+    return _heartbeat_manager
@@ -0,0 +1,195 @@
+"""Per-socket send queues for WebSocket broadcasts.
+
+A broadcast is serialized once and handed to every recipient's
+``WebSocketSender``. Each sender owns a bounded queue drained by its own
+writer task, so sockets are written concurrently and a slow client only
+delays itself. A client whose queue overflows is a slow consumer: its
+sender stops and the socket is closed, and the client reconnects and
+resyncs from a fresh snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from fastapi import WebSocket
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Frames buffered per socket before it is treated as a slow consumer
+SEND_QUEUE_SIZE = 64
+# Close code sent to slow consumers (1013: try again later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+Frame = Union[str, bytes]
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a message exactly like ``WebSocket.send_json`` does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass
+class LatencyStats:
+    """Running latency aggregate in milliseconds."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data["avg_ms"] = self.total_ms / self.count if self.count else 0.0
+        return data
+
+
+@dataclass
+class BroadcastMetrics:
+    """Worker-wide WebSocket broadcast counters."""
+
+    # Serialize + enqueue to every local recipient
+    fanout: LatencyStats
+    # Enqueue to socket write completion, per frame
+    delivery: LatencyStats
+    frames_sent: int = 0
+    send_errors: int = 0
+    slow_consumers_dropped: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "fanout": self.fanout.as_dict(),
+            "delivery": self.delivery.as_dict(),
+            "frames_sent": self.frames_sent,
+            "send_errors": self.send_errors,
+            "slow_consumers_dropped": self.slow_consumers_dropped,
+        }
+
+
+broadcast_metrics = BroadcastMetrics(fanout=LatencyStats(), delivery=LatencyStats())
+
+
+class WebSocketSender:
+    """Bounded send queue and writer task for one socket.
+
+    ``deltas`` marks clients that opted into ``table_state_delta`` frames;
+    ``user_id`` is the authenticated player bound to the socket, if any;
+    ``protocol`` is the negotiated wire protocol (see ``game_core.ws_codec``).
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_closed: Optional[Callable[[WebSocketSender], None]] = None,
+        maxsize: int = SEND_QUEUE_SIZE,
+        deltas: bool = False,
+        user_id: Optional[int] = None,
+        protocol: str = "json",
+    ):
+        self.websocket = websocket
+        self.deltas = deltas
+        self.user_id = user_id
+        self.protocol = protocol
+        self._on_closed = on_closed
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        # Frames parked by ``hold`` until ``release``
+        self._held: Optional[List[Frame]] = None
+        self.closed = False
+
+    def start(self) -> WebSocketSender:
+        self._task = asyncio.create_task(self._writer())
+        return self
+
+    def send(self, frame: Frame) -> bool:
+        """Queue a frame without waiting; returns False if the socket was dropped."""
+        if self.closed:
+            return False
+        if self._held is not None:
+            if len(self._held) >= self._queue.maxsize:
+                return self._drop_slow_consumer()
+            self._held.append(frame)
+            return True
+        try:
+            self._queue.put_nowait((frame, time.perf_counter()))
+        except asyncio.QueueFull:
+            return self._drop_slow_consumer()
+        return True
+
+    def hold(self) -> None:
+        """Park outgoing frames until ``release`` (e.g. while replaying)."""
+        if self._held is None:
+            self._held = []
+
+    def release(self, frames: Sequence[Frame] = ()) -> None:
+        """Send ``frames`` first, then everything parked since ``hold``."""
+        held, self._held = self._held or [], None
+        for frame in [*frames, *held]:
+            if not self.send(frame):
+                break
+
+    def _drop_slow_consumer(self) -> bool:
+        broadcast_metrics.slow_consumers_dropped += 1
+        logger.warning(
+            "Dropping slow WebSocket consumer",
+            queued=self._queue.qsize(),
+        )
+        self._shutdown()
+        asyncio.create_task(self._close_socket(SLOW_CONSUMER_CLOSE_CODE))
+        return False
+
+    async def close(self, code: int = 1000) -> None:
+        """Stop the writer and close the socket."""
+        if self.closed:
+            return
+        self._shutdown()
+        await self._close_socket(code)
+
+    def stop(self) -> None:
+        """Stop the writer without closing the socket (it is already gone)."""
+        if not self.closed:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        self.closed = True
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if self._on_closed is not None:
+            self._on_closed(self)
+
+    async def _close_socket(self, code: int = 1000) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception as exc:
+            logger.debug("WebSocket already closed", error=str(exc))
+
+    async def _writer(self) -> None:
+        while True:
+            frame, queued_at = await self._queue.get()
+            try:
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_text(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                broadcast_metrics.send_errors += 1
+                logger.warning("WebSocket send failed", error=str(exc))
+                self._shutdown()
+                return
+            broadcast_metrics.frames_sent += 1
+            broadcast_metrics.delivery.record(time.perf_counter() - queued_at)
@@ -0,0 +1,27 @@
+"""Add version counter to tables.
+
+Revision ID: 031_add_table_version
+Revises: 030_add_user_preferences
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "031_add_table_version"
+down_revision = "030_add_user_preferences"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tables",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tables", "version")
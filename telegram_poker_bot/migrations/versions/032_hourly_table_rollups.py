@@ -0,0 +1,54 @@
+"""Add incremental hand counters to hourly table stats.
+
+Revision ID: 032_hourly_table_rollups
+Revises: 031_add_table_version
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "032_hourly_table_rollups"
+down_revision = "031_add_table_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("pot_sum", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("max_pot", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("rake_sum", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("showdown_hands", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("multiway_hands", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "hourly_table_stats",
+        sa.Column("sealed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Rows written before this revision are complete hours
+    op.execute("UPDATE hourly_table_stats SET sealed_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("hourly_table_stats", "sealed_at")
+    op.drop_column("hourly_table_stats", "multiway_hands")
+    op.drop_column("hourly_table_stats", "showdown_hands")
+    op.drop_column("hourly_table_stats", "rake_sum")
+    op.drop_column("hourly_table_stats", "max_pot")
+    op.drop_column("hourly_table_stats", "pot_sum")
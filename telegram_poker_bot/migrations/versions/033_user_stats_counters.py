@@ -0,0 +1,74 @@
+"""Move per-user streak and biggest pot into user_poker_stats.
+
+Revision ID: 033_user_stats_counters
+Revises: 032_hourly_table_rollups
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "033_user_stats_counters"
+down_revision = "032_hourly_table_rollups"
+branch_labels = None
+depends_on = None
+
+# Keys the hand pipeline used to maintain in users.stats_blob
+LEGACY_STATS_KEYS = (
+    "hands_played",
+    "hands_won",
+    "total_profit",
+    "biggest_pot",
+    "current_streak",
+    "win_rate",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user_poker_stats",
+        sa.Column("biggest_pot", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "user_poker_stats",
+        sa.Column("current_streak", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    removed_keys = ", ".join(f"'{key}'" for key in LEGACY_STATS_KEYS)
+
+    # Carry the blob stats over before dropping them from it. Users without
+    # a user_poker_stats row get one seeded from the blob counters; existing
+    # rows keep their counters and only take the new columns.
+    op.execute(
+        f"""
+        INSERT INTO user_poker_stats (
+            user_id, total_hands, wins, total_winnings, biggest_pot, current_streak
+        )
+        SELECT
+            id,
+            COALESCE((stats_blob->>'hands_played')::numeric, 0)::integer,
+            COALESCE((stats_blob->>'hands_won')::numeric, 0)::integer,
+            COALESCE((stats_blob->>'total_profit')::numeric, 0)::bigint,
+            COALESCE((stats_blob->>'biggest_pot')::numeric, 0)::bigint,
+            COALESCE((stats_blob->>'current_streak')::numeric, 0)::integer
+        FROM users
+        WHERE stats_blob ?| ARRAY[{removed_keys}]
+        ON CONFLICT (user_id) DO UPDATE
+        SET biggest_pot = EXCLUDED.biggest_pot,
+            current_streak = EXCLUDED.current_streak
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE users
+        SET stats_blob = stats_blob - ARRAY[{removed_keys}]
+        WHERE stats_blob ?| ARRAY[{removed_keys}]
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user_poker_stats", "current_streak")
+    op.drop_column("user_poker_stats", "biggest_pot")
@@ -0,0 +1,34 @@
+"""Make hand_analytics unique per hand.
+
+Revision ID: 034_hand_analytics_unique_hand
+Revises: 033_user_stats_counters
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "034_hand_analytics_unique_hand"
+down_revision = "033_user_stats_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the first row of hands analysed more than once
+    op.execute(
+        """
+        DELETE FROM hand_analytics AS dup
+        USING hand_analytics AS kept
+        WHERE dup.hand_id = kept.hand_id
+          AND dup.id > kept.id
+        """
+    )
+    op.create_index(
+        "idx_hand_analytics_hand", "hand_analytics", ["hand_id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_hand_analytics_hand", table_name="hand_analytics")
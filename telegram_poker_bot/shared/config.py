@@ -80,6 +80,9 @@ class Settings(BaseSettings):
 
     # Feature Flags
     feature_wallet: bool = False
+    # Env: ANALYTICS_EVENT_CONSUMER. Consume analytics events in API workers;
+    # disable when running dedicated analytics_event_bus consumers instead
+    analytics_event_consumer: bool = True
 
     # Game Configuration
     matchmaking_pool_ttl: int = 120
@@ -15,10 +15,13 @@ from sqlalchemy import (
     String,
     Index,
     event,
+    inspect,
+    or_,
+    update,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -313,6 +316,9 @@ class Table(Base):
         default=False,
         index=True,
     )
+    # Bumped whenever seats, table columns or the template change so cached
+    # runtimes can skip reloading them (see _bump_table_versions).
+    version = Column(Integer, nullable=False, server_default="0", default=0)
 
     # Relationships
     group = relationship("Group", back_populates="tables")
@@ -621,6 +627,49 @@ def _normalize_group_invite_status(target, value, oldvalue, initiator):
     )  # pragma: no cover - defensive branch
 
 
+# Table columns that change on every action and do not affect cached runtime state.
+_TABLE_VERSION_IGNORED_ATTRS = frozenset({"version", "updated_at", "last_action_at"})
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_table_versions(session, flush_context, instances):
+    """Increment ``Table.version`` for tables whose seats or config changed."""
+    table_ids = set()
+    template_ids = set()
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Seat):
+            table_id = obj.table_id
+            if table_id is None and obj.table is not None:
+                table_id = obj.table.id
+            if table_id is not None:
+                table_ids.add(table_id)
+        elif isinstance(obj, Table) and obj not in session.new:
+            state = inspect(obj)
+            for attr in state.mapper.column_attrs:
+                if attr.key in _TABLE_VERSION_IGNORED_ATTRS:
+                    continue
+                if state.attrs[attr.key].history.has_changes():
+                    table_ids.add(obj.id)
+                    break
+        elif isinstance(obj, TableTemplate) and obj not in session.new:
+            if session.is_modified(obj, include_collections=False):
+                template_ids.add(obj.id)
+
+    if not table_ids and not template_ids:
+        return
+
+    tables = Table.__table__
+    criteria = []
+    if table_ids:
+        criteria.append(tables.c.id.in_(table_ids))
+    if template_ids:
+        criteria.append(tables.c.template_id.in_(template_ids))
+    session.connection().execute(
+        update(tables).where(or_(*criteria)).values(version=tables.c.version + 1)
+    )
+
+
 # Wallet placeholder models (feature flagged)
 class Wallet(Base):
     """Wallet model for user balance management."""
@@ -816,7 +865,13 @@ class GlobalWaitlistEntry(Base):
 
 
 class UserPokerStats(Base):
-    """User poker statistics model for aggregated stats."""
+    """User poker statistics model for aggregated stats.
+
+    The single per-user stats store: every column is a counter or running
+    value advanced in place by ``StatsProcessor.update_stats``.
+    ``current_streak`` is positive for consecutive wins and negative for
+    consecutive losses.
+    """
 
     __tablename__ = "user_poker_stats"
 
@@ -834,6 +889,8 @@ class UserPokerStats(Base):
         BigInteger, nullable=False, default=0
     )  # Changed to BigInteger for precision
     best_hand_rank = Column(String(50), nullable=True)  # Best hand achieved
+    biggest_pot = Column(BigInteger, nullable=False, default=0)
+    current_streak = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -872,7 +929,8 @@ class HourlyTableStats(Base):
     """Hourly aggregated statistics for tables.
     
     Stores aggregated analytics computed from tables and snapshots
-    on an hourly basis for historical tracking.
+    on an hourly basis for historical tracking. Hand counters are
+    updated live; snapshot averages are filled in when the hour is sealed.
     """
 
     __tablename__ = "hourly_table_stats"
@@ -888,6 +946,14 @@ class HourlyTableStats(Base):
     max_players = Column(Integer, nullable=False, default=0)
     total_hands = Column(Integer, nullable=False, default=0)
     activity_minutes = Column(Integer, nullable=False, default=0)
+    # Per-hand counters, bumped as each hand completes
+    pot_sum = Column(BigInteger, nullable=False, default=0)
+    max_pot = Column(BigInteger, nullable=False, default=0)
+    rake_sum = Column(BigInteger, nullable=False, default=0)
+    showdown_hands = Column(Integer, nullable=False, default=0)
+    multiway_hands = Column(Integer, nullable=False, default=0)
+    # Set when the hour is over and snapshot averages are final
+    sealed_at = Column(DateTime(timezone=True), nullable=True)
     metadata_json = Column(JSONB, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -911,7 +977,7 @@ class HandAnalytics(Base):
         Integer, ForeignKey("tables.id", ondelete="CASCADE"), nullable=False, index=True
     )
     hand_id = Column(
-        Integer, ForeignKey("hands.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("hands.id", ondelete="CASCADE"), nullable=False
     )
     template_id = Column(
         UUID(as_uuid=True),
@@ -960,6 +1026,7 @@ class HandAnalytics(Base):
 
     __table_args__ = (
         Index("idx_hand_analytics_table_hand", "table_id", "hand_no", unique=True),
+        Index("idx_hand_analytics_hand", "hand_id", unique=True),
         Index("idx_hand_analytics_template", "template_id"),
         Index("idx_hand_analytics_variant", "variant"),
         Index("idx_hand_analytics_created", "created_at"),
@@ -5,19 +5,30 @@ Provides live updates for:
 - Player indicators
 - Anomaly alerts
 - System events
+
+Table metrics are pushed by a periodic publisher: every
+``METRICS_PUSH_INTERVAL_SECONDS`` it reads the metrics of all subscribed
+tables in one pipelined Redis round-trip and sends each table's subscribers
+only the top-level metrics that changed since the previous push
+(``table_metrics_update`` with ``"partial": true``). A newly subscribed
+socket first receives the last pushed metrics in full.
 """
 
-from typing import Dict, Set, Optional, Any
+from typing import Dict, Set, Optional, Any, Iterable
 from datetime import datetime, timezone
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
 import json
+import time
 
+from telegram_poker_bot.game_core.ws_codec import PROTOCOL_JSON, encode_frame
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.models import AnomalyAlert
 
 logger = get_logger(__name__)
 
+METRICS_PUSH_INTERVAL_SECONDS = 5
+
 
 class AdminAnalyticsWebSocketManager:
     """Manages WebSocket connections for admin analytics feed.
@@ -33,21 +44,35 @@ class AdminAnalyticsWebSocketManager:
         # Active WebSocket connections
         self.active_connections: Set[WebSocket] = set()
         
+        # Negotiated wire protocol per connection (json or msgpack)
+        self.protocols: Dict[WebSocket, str] = {}
+        
         # Table subscriptions: {table_id: Set[WebSocket]}
         self.table_subscriptions: Dict[int, Set[WebSocket]] = {}
         
         # User subscriptions: {user_id: Set[WebSocket]}
         self.user_subscriptions: Dict[int, Set[WebSocket]] = {}
         
-        # Broadcast task
+        # Periodic metrics publisher task
         self._broadcast_task: Optional[asyncio.Task] = None
+        self.metrics_interval = METRICS_PUSH_INTERVAL_SECONDS
+        
+        # Last pushed metrics per subscribed table (the diff baseline)
+        self._last_metrics: Dict[int, Dict[str, Any]] = {}
+        self.publisher_stats: Dict[str, Any] = {
+            "rounds": 0,
+            "tables_read": 0,
+            "updates_sent": 0,
+            "errors": 0,
+            "last_round_ms": 0.0,
+        }
     
     # ==================== Connection Management ====================
     
-    async def connect(self, websocket: WebSocket):
-        """Accept new WebSocket connection."""
-        await websocket.accept()
+    async def connect(self, websocket: WebSocket, protocol: str = PROTOCOL_JSON):
+        """Register an accepted WebSocket connection."""
         self.active_connections.add(websocket)
+        self.protocols[websocket] = protocol
         logger.info("Admin analytics WebSocket connected", total=len(self.active_connections))
         
         # Send welcome message
@@ -60,12 +85,14 @@ class AdminAnalyticsWebSocketManager:
     def disconnect(self, websocket: WebSocket):
         """Handle WebSocket disconnection."""
         self.active_connections.discard(websocket)
+        self.protocols.pop(websocket, None)
         
         # Remove from all subscriptions
         for table_id in list(self.table_subscriptions.keys()):
             self.table_subscriptions[table_id].discard(websocket)
             if not self.table_subscriptions[table_id]:
                 del self.table_subscriptions[table_id]
+                self._last_metrics.pop(table_id, None)
         
         for user_id in list(self.user_subscriptions.keys()):
             self.user_subscriptions[user_id].discard(websocket)
@@ -90,6 +117,12 @@ class AdminAnalyticsWebSocketManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         })
         
+        # Later pushes are diffs against the last push, so start from it
+        last = self._last_metrics.get(table_id)
+        if last is not None:
+            await self.send_message(websocket, self._metrics_message(table_id, last))
+        self.start_metrics_publisher()
+        
         logger.debug("Subscribed to table", table_id=table_id, ws=id(websocket))
     
     async def unsubscribe_table(self, websocket: WebSocket, table_id: int):
@@ -98,6 +131,7 @@ class AdminAnalyticsWebSocketManager:
             self.table_subscriptions[table_id].discard(websocket)
             if not self.table_subscriptions[table_id]:
                 del self.table_subscriptions[table_id]
+                self._last_metrics.pop(table_id, None)
         
         await self.send_message(websocket, {
             "type": "unsubscribed",
@@ -145,30 +179,47 @@ class AdminAnalyticsWebSocketManager:
     async def send_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send message to specific WebSocket."""
         try:
-            await websocket.send_json(message)
+            await self._send_frame(
+                websocket, encode_frame(message, self.protocols.get(websocket, PROTOCOL_JSON))
+            )
         except Exception as e:
             logger.error("Failed to send WebSocket message", error=str(e), ws=id(websocket))
             self.disconnect(websocket)
     
-    async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected WebSockets."""
-        if not self.active_connections:
-            return
-        
-        logger.debug("Broadcasting message", type=message.get("type"), count=len(self.active_connections))
-        
+    @staticmethod
+    async def _send_frame(websocket: WebSocket, frame) -> None:
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+    
+    async def _send_to_all(self, websockets: Iterable[WebSocket], message: Dict[str, Any]):
+        """Send one message to several sockets, encoding it once per protocol."""
+        frames: Dict[str, Any] = {}
         disconnected = set()
-        for websocket in self.active_connections:
+        for websocket in websockets:
+            protocol = self.protocols.get(websocket, PROTOCOL_JSON)
+            if protocol not in frames:
+                frames[protocol] = encode_frame(message, protocol)
             try:
-                await websocket.send_json(message)
+                await self._send_frame(websocket, frames[protocol])
             except Exception as e:
-                logger.error("Failed to broadcast", error=str(e), ws=id(websocket))
+                logger.error("Failed to send to subscriber", error=str(e), ws=id(websocket))
                 disconnected.add(websocket)
         
         # Clean up disconnected
         for websocket in disconnected:
             self.disconnect(websocket)
     
+    async def broadcast(self, message: Dict[str, Any]):
+        """Broadcast message to all connected WebSockets."""
+        if not self.active_connections:
+            return
+        
+        logger.debug("Broadcasting message", type=message.get("type"), count=len(self.active_connections))
+        
+        await self._send_to_all(list(self.active_connections), message)
+    
     async def broadcast_to_table_subscribers(self, table_id: int, message: Dict[str, Any]):
         """Broadcast message to WebSockets subscribed to a table."""
         if table_id not in self.table_subscriptions:
@@ -177,17 +228,7 @@ class AdminAnalyticsWebSocketManager:
         subscribers = self.table_subscriptions[table_id].copy()
         logger.debug("Broadcasting to table subscribers", table_id=table_id, count=len(subscribers))
         
-        disconnected = set()
-        for websocket in subscribers:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error("Failed to send to subscriber", error=str(e), ws=id(websocket))
-                disconnected.add(websocket)
-        
-        # Clean up disconnected
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        await self._send_to_all(subscribers, message)
     
     async def broadcast_to_user_subscribers(self, user_id: int, message: Dict[str, Any]):
         """Broadcast message to WebSockets subscribed to a user."""
@@ -197,30 +238,116 @@ class AdminAnalyticsWebSocketManager:
         subscribers = self.user_subscriptions[user_id].copy()
         logger.debug("Broadcasting to user subscribers", user_id=user_id, count=len(subscribers))
         
-        disconnected = set()
-        for websocket in subscribers:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error("Failed to send to subscriber", error=str(e), ws=id(websocket))
-                disconnected.add(websocket)
-        
-        # Clean up disconnected
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        await self._send_to_all(subscribers, message)
     
     # ==================== Event Broadcasting ====================
     
-    async def broadcast_table_metrics(self, table_id: int, metrics: Dict[str, Any]):
-        """Broadcast table metrics update."""
-        message = {
+    @staticmethod
+    def _metrics_message(
+        table_id: int, metrics: Dict[str, Any], partial: bool = False
+    ) -> Dict[str, Any]:
+        return {
             "type": "table_metrics_update",
             "table_id": table_id,
             "metrics": metrics,
+            "partial": partial,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-        
-        await self.broadcast_to_table_subscribers(table_id, message)
+    
+    async def broadcast_table_metrics(self, table_id: int, metrics: Dict[str, Any]):
+        """Broadcast table metrics update."""
+        if table_id in self.table_subscriptions:
+            self._last_metrics[table_id] = metrics
+        await self.broadcast_to_table_subscribers(
+            table_id, self._metrics_message(table_id, metrics)
+        )
+    
+    # ==================== Metrics Publisher ====================
+    
+    def start_metrics_publisher(self):
+        """Start the periodic metrics publisher if it is not running."""
+        if self._broadcast_task is None:
+            self._broadcast_task = asyncio.create_task(self._run_metrics_publisher())
+    
+    async def stop_metrics_publisher(self):
+        """Stop the periodic metrics publisher."""
+        if self._broadcast_task is not None:
+            self._broadcast_task.cancel()
+            try:
+                await self._broadcast_task
+            except asyncio.CancelledError:
+                pass
+            self._broadcast_task = None
+        self._last_metrics.clear()
+    
+    async def _run_metrics_publisher(self):
+        from telegram_poker_bot.game_core.manager import get_redis_client
+        from telegram_poker_bot.shared.services.redis_analytics import get_redis_analytics
+        
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            if not self.table_subscriptions:
+                continue
+            try:
+                analytics = await get_redis_analytics(await get_redis_client())
+                await self.publish_table_metrics(analytics)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.publisher_stats["errors"] += 1
+                logger.error("Failed to publish table metrics", error=str(e))
+    
+    async def publish_table_metrics(self, analytics) -> int:
+        """Push changed metrics of every subscribed table.
+        
+        Args:
+            analytics: ``RedisAnalytics`` used for the batched read
+            
+        Returns:
+            Number of tables whose subscribers received an update
+        """
+        started = time.monotonic()
+        table_ids = list(self.table_subscriptions)
+        current = await analytics.get_tables_metrics(table_ids)
+        
+        sends = []
+        for table_id, metrics in current.items():
+            subscribers = self.table_subscriptions.get(table_id)
+            if not subscribers:
+                # Unsubscribed while the read was in flight
+                continue
+            last = self._last_metrics.get(table_id)
+            if last is None:
+                message = self._metrics_message(table_id, metrics)
+            else:
+                changed = {
+                    name: value
+                    for name, value in metrics.items()
+                    if last.get(name) != value
+                }
+                if not changed:
+                    continue
+                message = self._metrics_message(table_id, changed, partial=True)
+            self._last_metrics[table_id] = metrics
+            sends.append(self._send_to_all(subscribers.copy(), message))
+        
+        if sends:
+            await asyncio.gather(*sends)
+        
+        stats = self.publisher_stats
+        stats["rounds"] += 1
+        stats["tables_read"] += len(table_ids)
+        stats["updates_sent"] += len(sends)
+        stats["last_round_ms"] = round((time.monotonic() - started) * 1000, 2)
+        return len(sends)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "connections": len(self.active_connections),
+            "subscribed_tables": len(self.table_subscriptions),
+            "interval_seconds": self.metrics_interval,
+            **self.publisher_stats,
+        }
     
     async def broadcast_anomaly_alert(self, alert: AnomalyAlert):
         """Broadcast anomaly alert."""
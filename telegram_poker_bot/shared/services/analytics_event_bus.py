@@ -0,0 +1,518 @@
+"""Redis Streams event bus feeding analytics off the game hot path.
+
+Gameplay code queues small events (hand finished, player action, turn
+timeout, seat join/leave) on its database session with
+``queue_analytics_events``; once that transaction commits they are appended
+to ``ANALYTICS_STREAM_KEY`` in one pipelined ``XADD`` round-trip from a
+background task, so consumers only ever see committed hands and the request
+never waits on Redis. A rolled-back transaction drops its events.
+``AnalyticsEventConsumer`` workers read them through the
+``ANALYTICS_CONSUMER_GROUP`` consumer group in batches and run the matching
+``AnalyticsEventHooks`` handler, so hand analytics, Redis counters, anomaly
+checks and player sessions never add latency to an action.
+
+Delivery is at-least-once: an entry is acknowledged only after its handler
+succeeded, and entries left pending by a crashed or failing consumer are
+reclaimed with ``XAUTOCLAIM`` once idle for ``EVENT_CLAIM_IDLE_MS``. An
+entry that fails ``EVENT_MAX_ATTEMPTS`` times is moved to
+``ANALYTICS_DEAD_LETTER_KEY`` and acknowledged. Handled entry ids are
+remembered for ``EVENT_DONE_TTL_SECONDS`` so a redelivered entry is skipped,
+and the hand handler itself skips hands that already have analytics (the
+Redis live metrics and leaderboards deduplicate each hand with their own
+markers).
+
+Consumers run inside API workers (``ANALYTICS_EVENT_CONSUMER``) or on their
+own with ``python -m telegram_poker_bot.shared.services.analytics_event_bus``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+ANALYTICS_STREAM_KEY = "analytics:events"
+ANALYTICS_CONSUMER_GROUP = "analytics"
+# Approximate cap; trimmed entries were consumed long ago unless consumers are down
+ANALYTICS_STREAM_MAXLEN = 100_000
+EVENT_DONE_KEY = "analytics:events:done:{entry_id}"
+EVENT_DONE_TTL_SECONDS = 86400
+EVENT_ATTEMPTS_KEY = "analytics:events:attempts:{entry_id}"
+EVENT_MAX_ATTEMPTS = 5
+ANALYTICS_DEAD_LETTER_KEY = "analytics:events:dead"
+ANALYTICS_DEAD_LETTER_MAXLEN = 10_000
+
+EVENT_BATCH_SIZE = 100
+EVENT_BLOCK_MS = 1000
+# Pending entries idle this long belong to a dead or failing consumer
+EVENT_CLAIM_IDLE_MS = 60_000
+
+EVENT_HAND_FINISHED = "hand_finished"
+EVENT_ACTION = "action"
+EVENT_TIMEOUT = "timeout"
+EVENT_SEAT_JOIN = "seat_join"
+EVENT_SEAT_LEAVE = "seat_leave"
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+@dataclass
+class AnalyticsEvent:
+    """One gameplay event for the analytics consumers."""
+
+    type: str
+    table_id: int
+    data: Dict[str, Any] = field(default_factory=dict)
+    # Publish time (UNIX seconds)
+    ts: float = field(default_factory=time.time)
+    # Stream entry id, set on consumed events
+    entry_id: Optional[str] = None
+
+    def to_fields(self) -> Dict[str, str]:
+        return {
+            "type": self.type,
+            "table_id": str(self.table_id),
+            "data": json.dumps(self.data, separators=(",", ":"), default=str),
+            "ts": repr(self.ts),
+        }
+
+    @classmethod
+    def from_entry(cls, entry_id: Any, fields: Dict[Any, Any]) -> AnalyticsEvent:
+        values = {_decode(k): _decode(v) for k, v in fields.items()}
+        return cls(
+            type=values["type"],
+            table_id=int(values["table_id"]),
+            data=json.loads(values.get("data") or "{}"),
+            ts=float(values.get("ts") or 0),
+            entry_id=_decode(entry_id),
+        )
+
+
+class AnalyticsEventBus:
+    """Publisher side of the analytics stream."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        stream: str = ANALYTICS_STREAM_KEY,
+        maxlen: int = ANALYTICS_STREAM_MAXLEN,
+    ):
+        self.redis = redis_client
+        self.stream = stream
+        self.maxlen = maxlen
+        self.published = 0
+
+    async def publish(self, *events: AnalyticsEvent) -> None:
+        """Append events to the stream in one round-trip."""
+        if not events:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(
+                self.stream,
+                event.to_fields(),
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        await pipe.execute()
+        self.published += len(events)
+
+
+_event_bus: Optional[AnalyticsEventBus] = None
+
+
+async def get_analytics_event_bus() -> AnalyticsEventBus:
+    """Get the process-wide analytics event publisher."""
+    global _event_bus
+    if _event_bus is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _event_bus = AnalyticsEventBus(await get_redis_client())
+    return _event_bus
+
+
+async def publish_analytics_events(*events: AnalyticsEvent) -> None:
+    """Publish now; failures are logged, never raised."""
+    try:
+        bus = await get_analytics_event_bus()
+        await bus.publish(*events)
+    except Exception as exc:
+        logger.warning(
+            "Failed to publish analytics events",
+            types=[event.type for event in events],
+            error=str(exc),
+        )
+
+
+# Session.info key holding events waiting for the transaction to commit
+_PENDING_EVENTS_KEY = "analytics_events"
+_publish_tasks: Set[asyncio.Task] = set()
+
+
+def queue_analytics_events(db: AsyncSession, *events: AnalyticsEvent) -> None:
+    """Publish events after ``db``'s current transaction commits."""
+    db.sync_session.info.setdefault(_PENDING_EVENTS_KEY, []).extend(events)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed_events(session: Session) -> None:
+    events = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if not events:
+        return
+    task = asyncio.get_running_loop().create_task(publish_analytics_events(*events))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+@dataclass
+class ConsumerMetrics:
+    batches: int = 0
+    processed: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+    duplicates: int = 0
+    reclaimed: int = 0
+    last_batch_ms: float = 0.0
+    # Publish -> handled, for the last handled event
+    last_delay_ms: float = 0.0
+
+
+class AnalyticsEventConsumer:
+    """Consumer-group worker applying analytics events in batches."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        consumer_name: Optional[str] = None,
+        stream: str = ANALYTICS_STREAM_KEY,
+        group: str = ANALYTICS_CONSUMER_GROUP,
+        batch_size: int = EVENT_BATCH_SIZE,
+        block_ms: int = EVENT_BLOCK_MS,
+        claim_idle_ms: int = EVENT_CLAIM_IDLE_MS,
+    ):
+        self.redis = redis_client
+        self.consumer_name = consumer_name or f"{socket.gethostname()}:{os.getpid()}"
+        self.stream = stream
+        self.group = group
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.metrics = ConsumerMetrics()
+        self._task: Optional[asyncio.Task] = None
+        self._claim_cursor = "0-0"
+        self._last_claim = 0.0
+
+    async def start(self) -> None:
+        if self._task is None:
+            await self._ensure_group()
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                "Analytics event consumer started", consumer=self.consumer_name
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                entries = await self._claim_stale()
+                if not entries:
+                    response = await self.redis.xreadgroup(
+                        self.group,
+                        self.consumer_name,
+                        {self.stream: ">"},
+                        count=self.batch_size,
+                        block=self.block_ms,
+                    )
+                    entries = response[0][1] if response else []
+                if entries:
+                    await self.process_batch(entries)
+            except asyncio.CancelledError:
+                raise
+            except ResponseError as exc:
+                if "NOGROUP" in str(exc):
+                    # Stream or group deleted (e.g. Redis flushed)
+                    await self._ensure_group()
+                else:
+                    logger.error("Analytics event read failed", error=str(exc))
+                    await asyncio.sleep(1)
+            except Exception as exc:
+                logger.error("Analytics event consumer error", error=str(exc))
+                await asyncio.sleep(1)
+
+    async def _claim_stale(self) -> List[Tuple[Any, Dict[Any, Any]]]:
+        """Take over entries other consumers left pending for too long."""
+        now = time.monotonic()
+        if now - self._last_claim < self.claim_idle_ms / 1000 / 2:
+            return []
+        self._last_claim = now
+        result = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer_name,
+            min_idle_time=self.claim_idle_ms,
+            start_id=self._claim_cursor,
+            count=self.batch_size,
+        )
+        self._claim_cursor = _decode(result[0])
+        # Entries deleted by trimming come back as None
+        entries = [entry for entry in result[1] if entry and entry[1]]
+        self.metrics.reclaimed += len(entries)
+        return entries
+
+    async def process_batch(self, entries: Iterable[Tuple[Any, Dict[Any, Any]]]) -> int:
+        """Handle a batch of stream entries; returns how many were acknowledged."""
+        started = time.monotonic()
+        events = [AnalyticsEvent.from_entry(entry_id, fields) for entry_id, fields in entries]
+        if not events:
+            return 0
+
+        pipe = self.redis.pipeline(transaction=False)
+        for event in events:
+            pipe.exists(EVENT_DONE_KEY.format(entry_id=event.entry_id))
+        done_flags = await pipe.execute()
+
+        handled: List[str] = []
+        duplicates: List[str] = []
+        pending = []
+        for event, done in zip(events, done_flags):
+            if done:
+                duplicates.append(event.entry_id)
+            else:
+                pending.append(event)
+
+        if pending:
+            handled = await self._handle(pending)
+        succeeded = set(handled)
+        failed = [event for event in pending if event.entry_id not in succeeded]
+        dead = await self._record_failures(failed) if failed else []
+
+        acked = handled + duplicates + dead
+        if acked:
+            pipe = self.redis.pipeline(transaction=False)
+            for entry_id in handled:
+                pipe.set(
+                    EVENT_DONE_KEY.format(entry_id=entry_id),
+                    1,
+                    ex=EVENT_DONE_TTL_SECONDS,
+                )
+            pipe.xack(self.stream, self.group, *acked)
+            await pipe.execute()
+
+        self.metrics.batches += 1
+        self.metrics.processed += len(handled)
+        self.metrics.duplicates += len(duplicates)
+        self.metrics.failed += len(failed)
+        self.metrics.last_batch_ms = round((time.monotonic() - started) * 1000, 2)
+        return len(acked)
+
+    async def _record_failures(self, events: List[AnalyticsEvent]) -> List[str]:
+        """Count failed attempts; dead-letter and return entries out of retries."""
+        pipe = self.redis.pipeline(transaction=False)
+        for event in events:
+            key = EVENT_ATTEMPTS_KEY.format(entry_id=event.entry_id)
+            pipe.incr(key)
+            pipe.expire(key, EVENT_DONE_TTL_SECONDS)
+        attempts = (await pipe.execute())[::2]
+
+        dead = [
+            event
+            for event, count in zip(events, attempts)
+            if int(count) >= EVENT_MAX_ATTEMPTS
+        ]
+        if not dead:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        for event in dead:
+            fields = event.to_fields()
+            fields["entry_id"] = event.entry_id
+            pipe.xadd(
+                ANALYTICS_DEAD_LETTER_KEY,
+                fields,
+                maxlen=ANALYTICS_DEAD_LETTER_MAXLEN,
+                approximate=True,
+            )
+        await pipe.execute()
+        self.metrics.dead_lettered += len(dead)
+        logger.error(
+            "Dead-lettered analytics events",
+            entry_ids=[event.entry_id for event in dead],
+        )
+        return [event.entry_id for event in dead]
+
+    async def _handle(self, events: List[AnalyticsEvent]) -> List[str]:
+        """Run the hooks for the events; returns the entry ids that succeeded.
+
+        Consecutive ``hand_finished`` events are handled as one batch (one
+        ``process_hands`` call and one commit). If the batch fails, its
+        events are retried one by one so a bad hand only fails itself.
+        """
+        from telegram_poker_bot.shared.database import get_db_session
+        from telegram_poker_bot.shared.services.analytics_event_hooks import (
+            AnalyticsEventHooks,
+        )
+        from telegram_poker_bot.shared.services.outlier_detector import OutlierDetector
+        from telegram_poker_bot.shared.services.redis_analytics import (
+            get_redis_analytics,
+        )
+
+        redis_analytics = await get_redis_analytics(self.redis)
+        handled: List[str] = []
+        async with get_db_session() as db:
+            hooks = AnalyticsEventHooks(
+                db, redis_analytics, OutlierDetector(db, redis_analytics)
+            )
+
+            async def handle_one(event: AnalyticsEvent) -> None:
+                try:
+                    await hooks.handle_event(event)
+                    await db.commit()
+                except Exception as exc:
+                    await db.rollback()
+                    hooks.discard_uncommitted()
+                    logger.error(
+                        "Failed to handle analytics event",
+                        entry_id=event.entry_id,
+                        type=event.type,
+                        table_id=event.table_id,
+                        error=str(exc),
+                    )
+                    return
+                handled.append(event.entry_id)
+                self.metrics.last_delay_ms = round((time.time() - event.ts) * 1000, 2)
+
+            index = 0
+            while index < len(events):
+                if events[index].type != EVENT_HAND_FINISHED:
+                    await handle_one(events[index])
+                    index += 1
+                    continue
+
+                run = []
+                while index < len(events) and events[index].type == EVENT_HAND_FINISHED:
+                    run.append(events[index])
+                    index += 1
+                if len(run) == 1:
+                    await handle_one(run[0])
+                    continue
+
+                try:
+                    await hooks.on_hands_finished(
+                        [(event.table_id, event.data["hand_id"], event.data) for event in run]
+                    )
+                    await db.commit()
+                except Exception as exc:
+                    await db.rollback()
+                    hooks.discard_uncommitted()
+                    logger.warning(
+                        "Hand batch failed, retrying hands one by one",
+                        hands=len(run),
+                        error=str(exc),
+                    )
+                    for event in run:
+                        await handle_one(event)
+                    continue
+                try:
+                    await hooks.apply_committed()
+                except Exception as exc:
+                    # Stored, but left unacknowledged: the redelivery
+                    # applies the Redis steps that have no per-hand marker
+                    # yet (see AnalyticsEventHooks.apply_committed)
+                    logger.error(
+                        "Failed to apply committed hands",
+                        hands=len(run),
+                        error=str(exc),
+                    )
+                    continue
+                handled.extend(event.entry_id for event in run)
+                self.metrics.last_delay_ms = round((time.time() - run[-1].ts) * 1000, 2)
+        return handled
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Local counters plus the group's pending count and lag."""
+        metrics: Dict[str, Any] = {
+            "consumer": self.consumer_name,
+            "batches": self.metrics.batches,
+            "processed": self.metrics.processed,
+            "failed": self.metrics.failed,
+            "dead_lettered": self.metrics.dead_lettered,
+            "duplicates": self.metrics.duplicates,
+            "reclaimed": self.metrics.reclaimed,
+            "last_batch_ms": self.metrics.last_batch_ms,
+            "last_delay_ms": self.metrics.last_delay_ms,
+        }
+        try:
+            for info in await self.redis.xinfo_groups(self.stream):
+                if _decode(info.get("name")) == self.group:
+                    metrics["pending"] = info.get("pending")
+                    # Entries not yet delivered to the group (Redis >= 7)
+                    metrics["lag"] = info.get("lag")
+        except Exception as exc:
+            metrics["error"] = str(exc)
+        return metrics
+
+
+_event_consumer: Optional[AnalyticsEventConsumer] = None
+
+
+async def get_analytics_event_consumer() -> AnalyticsEventConsumer:
+    """Get this process's analytics event consumer."""
+    global _event_consumer
+    if _event_consumer is None:
+        from telegram_poker_bot.game_core.manager import get_redis_client
+
+        _event_consumer = AnalyticsEventConsumer(await get_redis_client())
+    return _event_consumer
+
+
+async def _main() -> None:
+    from telegram_poker_bot.shared.logging import configure_logging
+
+    configure_logging()
+    consumer = await get_analytics_event_consumer()
+    await consumer.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await consumer.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
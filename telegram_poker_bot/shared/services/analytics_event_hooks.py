@@ -4,16 +4,27 @@ Hooks into PokerKit runtime events to capture analytics data.
 Integrates with Redis counters and hand analytics processor.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
+from uuid import UUID
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.services.redis_analytics import RedisAnalytics
 from telegram_poker_bot.shared.services.hand_analytics_processor import HandAnalyticsProcessor
+from telegram_poker_bot.shared.services.leaderboard_service import get_leaderboard_service
 from telegram_poker_bot.shared.services.outlier_detector import OutlierDetector
 from telegram_poker_bot.shared.services.admin_analytics_ws import get_admin_analytics_ws_manager
-from telegram_poker_bot.shared.models import Hand, Table, User
+from telegram_poker_bot.shared.services.analytics_event_bus import (
+    EVENT_ACTION,
+    EVENT_HAND_FINISHED,
+    EVENT_SEAT_JOIN,
+    EVENT_SEAT_LEAVE,
+    EVENT_TIMEOUT,
+    AnalyticsEvent,
+)
+from telegram_poker_bot.shared.models import Hand, HandAnalytics, Table, User
 
 logger = get_logger(__name__)
 
@@ -27,6 +38,9 @@ class AnalyticsEventHooks:
     - Timeout/autofold events
     - Pot evolution
     - Showdown resolution
+    
+    Gameplay events arrive through the analytics event bus
+    (``analytics_event_bus``) and are dispatched by ``handle_event``.
     """
     
     def __init__(
@@ -39,6 +53,38 @@ class AnalyticsEventHooks:
         self.redis = redis_analytics
         self.detector = outlier_detector
         self.ws_manager = get_admin_analytics_ws_manager()
+        # Finished hands written to the session, waiting for its commit
+        self._uncommitted_hands: List[
+            Tuple[int, int, Optional[HandAnalytics], Dict[str, Any]]
+        ] = []
+    
+    async def handle_event(self, event: AnalyticsEvent):
+        """Dispatch an event consumed from the analytics event bus."""
+        data = event.data
+        if event.type == EVENT_HAND_FINISHED:
+            await self.on_hand_finished(event.table_id, data["hand_id"], data)
+        elif event.type == EVENT_ACTION:
+            await self.on_player_action(
+                event.table_id,
+                data.get("hand_id"),
+                data["user_id"],
+                data["action_type"],
+                data,
+            )
+        elif event.type == EVENT_TIMEOUT:
+            await self.on_timeout(event.table_id, data.get("hand_id"), data["user_id"], data)
+        elif event.type == EVENT_SEAT_JOIN:
+            if data.get("template_id"):
+                data = dict(data, template_id=UUID(data["template_id"]))
+            await self.on_seat_join(
+                event.table_id, data["user_id"], data.get("seat_position"), data
+            )
+        elif event.type == EVENT_SEAT_LEAVE:
+            await self.on_seat_leave(
+                event.table_id, data["user_id"], data.get("seat_position"), data
+            )
+        else:
+            logger.warning("Unknown analytics event", type=event.type, table_id=event.table_id)
     
     # ==================== Table Events ====================
     
@@ -96,26 +142,36 @@ class AnalyticsEventHooks:
             hand_id: Hand ID
             metadata: Event metadata (includes pot, winners, etc.)
         """
-        logger.info("Hand finished", table_id=table_id, hand_id=hand_id)
+        await self.on_hands_finished([(table_id, hand_id, metadata)])
+        await self.db.commit()
+        await self.apply_committed()
+    
+    async def on_hands_finished(self, hands: List[Tuple[int, int, Dict[str, Any]]]):
+        """Handle a batch of hand finished events.
         
-        # Process hand analytics
-        hand_analytics = await HandAnalyticsProcessor.process_hand(self.db, hand_id)
+        The hands are processed with one ``HandAnalyticsProcessor.process_hands``
+        call. Hands that already have analytics are skipped, since events are
+        delivered at least once. The caller commits and then calls
+        ``apply_committed`` (or ``discard_uncommitted`` after a rollback), so
+        Redis never counts hands whose analytics were not stored.
         
-        if hand_analytics:
-            # Record pot size in rolling window
-            await self.redis.record_pot_size(table_id, hand_analytics.total_pot)
-            
-            # Record showdown
-            await self.redis.record_showdown(table_id, hand_analytics.went_to_showdown)
-            
-            # Add to pot sum
-            await self.redis.add_to_pot_sum(table_id, hand_analytics.total_pot)
-            
-            # Check for anomalies
-            await self._check_hand_anomalies(table_id, hand_id, hand_analytics, metadata)
-            
-            # Update player sessions
-            if hand_analytics.positions:
+        Args:
+            hands: ``(table_id, hand_id, metadata)`` per finished hand
+        """
+        logger.info("Hands finished", hand_ids=[hand_id for _, hand_id, _ in hands])
+        
+        created = await HandAnalyticsProcessor.process_hands(
+            self.db, [hand_id for _, hand_id, _ in hands]
+        )
+        
+        for table_id, hand_id, metadata in hands:
+            hand_analytics = created.get(hand_id)
+            if hand_analytics is None:
+                # Still queued: a redelivered hand may be missing from the
+                # leaderboards, whose per-hand marker makes it a no-op
+                logger.debug("Hand already processed", table_id=table_id, hand_id=hand_id)
+            elif hand_analytics.positions:
+                # Update player sessions
                 for user_id in hand_analytics.positions.keys():
                     await HandAnalyticsProcessor.update_player_session(
                         self.db,
@@ -123,8 +179,63 @@ class AnalyticsEventHooks:
                         table_id,
                         hand_analytics,
                     )
+            
+            self._uncommitted_hands.append((table_id, hand_id, hand_analytics, metadata))
+    
+    async def apply_committed(self):
+        """Apply committed finished hands to the live Redis metrics.
+        
+        Pot window, showdown flags and pot sum are updated (followed by the
+        anomaly checks) and the hands are added to the leaderboards. Both
+        steps keep a per-hand marker, so a redelivered event applies whatever
+        an earlier, failed attempt did not; the live metrics of a hand
+        analysed by that attempt are rebuilt from its stored analytics row.
+        """
+        hands, self._uncommitted_hands = self._uncommitted_hands, []
         
-        await self.db.commit()
+        # Stored by an earlier delivery but possibly never applied to Redis
+        unapplied = await self.redis.get_unapplied_hands(
+            hand_id for _, hand_id, hand_analytics, _ in hands if hand_analytics is None
+        )
+        stored: Dict[int, HandAnalytics] = {}
+        if unapplied:
+            result = await self.db.execute(
+                select(HandAnalytics).where(HandAnalytics.hand_id.in_(unapplied))
+            )
+            stored = {row.hand_id: row for row in result.scalars().all()}
+        
+        leaderboard_hands = []
+        for table_id, hand_id, hand_analytics, metadata in hands:
+            if hand_analytics is None:
+                hand_analytics = stored.get(hand_id)
+            if hand_analytics is not None and await self.redis.record_finished_hand(
+                table_id,
+                hand_id,
+                hand_analytics.total_pot,
+                hand_analytics.went_to_showdown,
+            ):
+                # Check for anomalies
+                await self._check_hand_anomalies(table_id, hand_id, hand_analytics, metadata)
+            
+            variant = metadata.get("variant")
+            if variant is None and hand_analytics is not None:
+                variant = hand_analytics.variant
+            ended_at = metadata.get("ended_at")
+            leaderboard_hands.append(
+                (
+                    hand_id,
+                    datetime.fromisoformat(ended_at) if ended_at else datetime.now(timezone.utc),
+                    variant,
+                    dict(metadata.get("player_deltas") or []),
+                )
+            )
+        
+        # Each hand is applied to the live leaderboards at most once
+        await get_leaderboard_service(self.redis.redis).record_hands(leaderboard_hands)
+    
+    def discard_uncommitted(self):
+        """Forget finished hands whose transaction was rolled back."""
+        self._uncommitted_hands = []
     
     async def _check_hand_anomalies(
         self,
@@ -261,8 +372,8 @@ class AnalyticsEventHooks:
         logger.info("Seat join", table_id=table_id, user_id=user_id, seat=seat_position)
         
         # Update active seats count
-        active_seats = metadata.get("active_seats", 0)
-        await self.redis.set_active_seats(table_id, active_seats)
+        if "active_seats" in metadata:
+            await self.redis.set_active_seats(table_id, metadata["active_seats"])
         
         # Create player session
         buy_in = metadata.get("buy_in", 0)
@@ -290,8 +401,8 @@ class AnalyticsEventHooks:
         logger.info("Seat leave", table_id=table_id, user_id=user_id, seat=seat_position)
         
         # Update active seats count
-        active_seats = metadata.get("active_seats", 0)
-        await self.redis.set_active_seats(table_id, active_seats)
+        if "active_seats" in metadata:
+            await self.redis.set_active_seats(table_id, metadata["active_seats"])
         
         # End player session
         cash_out = metadata.get("cash_out", 0)
@@ -339,8 +450,9 @@ class AnalyticsEventHooks:
     async def send_periodic_metrics_update(self, table_id: int):
         """Send periodic metrics update to admin WebSocket.
         
-        Should be called periodically (e.g., every 5 seconds) to push
-        live metrics to admin dashboard.
+        Pushes the full metrics of one table immediately. Subscribed tables
+        are also refreshed by the admin manager's periodic publisher, which
+        sends only changed metrics.
         """
         metrics = await self.redis.get_all_table_metrics(table_id)
         await self.ws_manager.broadcast_table_metrics(table_id, metrics)
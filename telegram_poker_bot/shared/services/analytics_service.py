@@ -1,8 +1,19 @@
 """Analytics service for periodic table snapshots and hourly stats."""
 
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
-from sqlalchemy import select, func, and_
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Integer,
+    and_,
+    cast,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,8 +23,7 @@ from telegram_poker_bot.shared.models import (
     TableSnapshot,
     HourlyTableStats,
     TableStatus,
-    Seat,
-    Hand,
+    HandAnalytics,
 )
 
 logger = get_logger(__name__)
@@ -22,6 +32,18 @@ logger = get_logger(__name__)
 SNAPSHOT_INTERVAL_MINUTES = 5  # How often snapshots are collected
 
 
+def hourly_counters(stats: HourlyTableStats) -> Dict[str, Any]:
+    """Live hand counters of an hourly stats row, for API responses."""
+    return {
+        "pot_sum": stats.pot_sum,
+        "max_pot": stats.max_pot,
+        "rake": stats.rake_sum,
+        "showdown_hands": stats.showdown_hands,
+        "multiway_hands": stats.multiway_hands,
+        "sealed": stats.sealed_at is not None,
+    }
+
+
 class AnalyticsService:
     """Service for collecting and aggregating table analytics."""
 
@@ -124,65 +146,175 @@ class AnalyticsService:
         return count
 
     @staticmethod
-    async def generate_hourly_stats(
+    async def record_hand_rollups(
+        db: AsyncSession,
+        hands: List[Tuple[datetime, HandAnalytics]],
+    ) -> int:
+        """Add completed hands to their tables' hourly counters.
+        
+        Hands are bucketed by table and the hour they started in, and every
+        bucket is bumped with one multi-row upsert, in the caller's
+        transaction. Call it once per new HandAnalytics row (see
+        ``HandAnalyticsProcessor.process_hands``) so hands are not counted
+        twice.
+        
+        Args:
+            db: Database session
+            hands: (hand start time, analytics record) per completed hand
+            
+        Returns:
+            Number of hourly buckets updated
+        """
+        buckets: Dict[Tuple[int, datetime], Dict[str, int]] = {}
+        for started_at, analytics in hands:
+            hour_start = (started_at or datetime.now(timezone.utc)).replace(
+                minute=0, second=0, microsecond=0
+            )
+            bucket = buckets.setdefault(
+                (analytics.table_id, hour_start),
+                {
+                    "total_hands": 0,
+                    "pot_sum": 0,
+                    "max_pot": 0,
+                    "rake_sum": 0,
+                    "showdown_hands": 0,
+                    "multiway_hands": 0,
+                },
+            )
+            bucket["total_hands"] += 1
+            bucket["pot_sum"] += analytics.total_pot or 0
+            bucket["max_pot"] = max(bucket["max_pot"], analytics.total_pot or 0)
+            bucket["rake_sum"] += analytics.rake or 0
+            bucket["showdown_hands"] += 1 if analytics.went_to_showdown else 0
+            bucket["multiway_hands"] += 1 if analytics.multiway else 0
+        
+        if not buckets:
+            return 0
+        
+        stmt = pg_insert(HourlyTableStats).values(
+            [
+                {"table_id": table_id, "hour_start": hour_start, **counters}
+                for (table_id, hour_start), counters in buckets.items()
+            ]
+        )
+        current = HourlyTableStats.__table__.c
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["table_id", "hour_start"],
+            set_={
+                "total_hands": current.total_hands + stmt.excluded.total_hands,
+                "pot_sum": current.pot_sum + stmt.excluded.pot_sum,
+                "max_pot": func.greatest(current.max_pot, stmt.excluded.max_pot),
+                "rake_sum": current.rake_sum + stmt.excluded.rake_sum,
+                "showdown_hands": current.showdown_hands + stmt.excluded.showdown_hands,
+                "multiway_hands": current.multiway_hands + stmt.excluded.multiway_hands,
+            },
+        )
+        await db.execute(stmt)
+        return len(buckets)
+
+    @staticmethod
+    async def seal_hourly_stats(
         db: AsyncSession,
-        table_id: int,
         hour_start: datetime,
-    ) -> Optional[HourlyTableStats]:
-        """Generate hourly aggregated stats for a table.
+        table_id: Optional[int] = None,
+    ) -> int:
+        """Finalize an hour's stats once it is over.
+        
+        Hand counters are already live (``record_hand_rollups``); sealing only
+        fills in the snapshot-derived player averages and activity minutes,
+        refreshes the summary metadata from the counters and stamps
+        ``sealed_at``. Two set-based statements cover every table of the
+        hour, and re-sealing an hour is harmless.
         
         Args:
             db: Database session
-            table_id: ID of the table
             hour_start: Start of the hour (rounded down)
+            table_id: Seal only this table
             
         Returns:
-            Created hourly stats or None if no data
+            Number of hourly stats rows sealed
         """
         hour_end = hour_start + timedelta(hours=1)
         
-        # Get snapshots for this hour
-        result = await db.execute(
-            select(TableSnapshot)
-            .where(
-                and_(
-                    TableSnapshot.table_id == table_id,
-                    TableSnapshot.snapshot_time >= hour_start,
-                    TableSnapshot.snapshot_time < hour_end,
-                )
+        snapshot_filter = [
+            TableSnapshot.snapshot_time >= hour_start,
+            TableSnapshot.snapshot_time < hour_end,
+        ]
+        if table_id is not None:
+            snapshot_filter.append(TableSnapshot.table_id == table_id)
+        
+        rows = (
+            select(
+                TableSnapshot.table_id,
+                literal(hour_start, DateTime(timezone=True)),
+                cast(func.round(func.avg(TableSnapshot.player_count)), Integer),
+                func.max(TableSnapshot.player_count),
+                func.count().filter(TableSnapshot.is_active) * SNAPSHOT_INTERVAL_MINUTES,
             )
+            .where(and_(*snapshot_filter))
+            .group_by(TableSnapshot.table_id)
         )
-        snapshots = result.scalars().all()
-        
-        if not snapshots:
-            logger.debug(
-                "No snapshots found for hourly stats",
-                table_id=table_id,
-                hour_start=hour_start,
+        columns = ["table_id", "hour_start", "avg_players", "max_players", "activity_minutes"]
+        stmt = pg_insert(HourlyTableStats).from_select(columns, rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["table_id", "hour_start"],
+            set_={column: stmt.excluded[column] for column in columns[2:]},
+        )
+        await db.execute(stmt)
+        
+        hands = cast(func.nullif(HourlyTableStats.total_hands, 0), Float)
+        seal = (
+            update(HourlyTableStats)
+            .where(HourlyTableStats.hour_start == hour_start)
+            .values(
+                sealed_at=func.now(),
+                metadata_json=func.coalesce(
+                    HourlyTableStats.metadata_json, cast({}, JSONB)
+                ).op("||")(
+                    func.jsonb_build_object(
+                        "avg_pot",
+                        func.coalesce(HourlyTableStats.pot_sum / hands, 0.0),
+                        "max_pot", HourlyTableStats.max_pot,
+                        "total_rake", HourlyTableStats.rake_sum,
+                        "multiway_frequency",
+                        func.coalesce(HourlyTableStats.multiway_hands / hands, 0.0),
+                        "showdown_frequency",
+                        func.coalesce(HourlyTableStats.showdown_hands / hands, 0.0),
+                    )
+                ),
             )
-            return None
-        
-        # Calculate aggregated metrics
-        total_players = sum(s.player_count for s in snapshots)
-        avg_players = round(total_players / len(snapshots)) if snapshots else 0
-        max_players = max((s.player_count for s in snapshots), default=0)
-        activity_minutes = sum(1 for s in snapshots if s.is_active) * SNAPSHOT_INTERVAL_MINUTES
+        )
+        if table_id is not None:
+            seal = seal.where(HourlyTableStats.table_id == table_id)
+        result = await db.execute(seal)
         
-        # Count hands completed in this hour
-        hands_result = await db.execute(
-            select(func.count(Hand.id))
-            .where(
-                and_(
-                    Hand.table_id == table_id,
-                    Hand.started_at >= hour_start,
-                    Hand.started_at < hour_end,
-                )
-            )
+        logger.info(
+            "Sealed hourly table stats",
+            hour_start=hour_start,
+            table_id=table_id,
+            count=result.rowcount,
         )
-        total_hands = hands_result.scalar() or 0
+        return result.rowcount
+
+    @staticmethod
+    async def generate_hourly_stats(
+        db: AsyncSession,
+        table_id: int,
+        hour_start: datetime,
+    ) -> Optional[HourlyTableStats]:
+        """Seal hourly stats for a table.
         
-        # Create or update hourly stats
-        existing_result = await db.execute(
+        Args:
+            db: Database session
+            table_id: ID of the table
+            hour_start: Start of the hour (rounded down)
+            
+        Returns:
+            Sealed hourly stats or None if the table had no data that hour
+        """
+        await AnalyticsService.seal_hourly_stats(db, hour_start, table_id)
+        
+        result = await db.execute(
             select(HourlyTableStats)
             .where(
                 and_(
@@ -190,91 +322,30 @@ class AnalyticsService:
                     HourlyTableStats.hour_start == hour_start,
                 )
             )
+            .execution_options(populate_existing=True)
         )
-        existing_stats = existing_result.scalar_one_or_none()
-        
-        if existing_stats:
-            # Update existing stats
-            existing_stats.avg_players = avg_players
-            existing_stats.max_players = max_players
-            existing_stats.total_hands = total_hands
-            existing_stats.activity_minutes = activity_minutes
-            stats = existing_stats
-        else:
-            # Create new stats
-            stats = HourlyTableStats(
-                table_id=table_id,
-                hour_start=hour_start,
-                avg_players=avg_players,
-                max_players=max_players,
-                total_hands=total_hands,
-                activity_minutes=activity_minutes,
-                metadata_json={},
-            )
-            db.add(stats)
-        
-        await db.flush()
-        
-        logger.info(
-            "Generated hourly table stats",
-            table_id=table_id,
-            hour_start=hour_start,
-            avg_players=avg_players,
-            total_hands=total_hands,
-        )
-        
-        return stats
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def generate_hourly_stats_for_all_tables(
         db: AsyncSession,
         hour_start: Optional[datetime] = None,
     ) -> int:
-        """Generate hourly stats for all tables.
+        """Seal hourly stats for all tables.
         
         Args:
             db: Database session
             hour_start: Hour to process (defaults to previous hour)
             
         Returns:
-            Number of hourly stats generated
+            Number of hourly stats sealed
         """
         if hour_start is None:
             # Default to previous hour
             now = datetime.now(timezone.utc)
             hour_start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
         
-        # Get all tables that had activity in this hour
-        hour_end = hour_start + timedelta(hours=1)
-        result = await db.execute(
-            select(TableSnapshot.table_id)
-            .where(
-                and_(
-                    TableSnapshot.snapshot_time >= hour_start,
-                    TableSnapshot.snapshot_time < hour_end,
-                )
-            )
-            .distinct()
-        )
-        table_ids = [row[0] for row in result.all()]
-        
-        count = 0
-        for table_id in table_ids:
-            try:
-                stats = await AnalyticsService.generate_hourly_stats(
-                    db, table_id, hour_start
-                )
-                if stats:
-                    count += 1
-            except Exception as e:
-                logger.error(
-                    "Failed to generate hourly stats",
-                    table_id=table_id,
-                    hour_start=hour_start,
-                    error=str(e),
-                )
-                continue
-        
+        count = await AnalyticsService.seal_hourly_stats(db, hour_start)
         await db.commit()
         
         logger.info(
@@ -8,13 +8,16 @@ from typing import Dict, List, Optional, Any
 from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from telegram_poker_bot.shared.logging import get_logger
+from telegram_poker_bot.shared.services.analytics_service import AnalyticsService
 from telegram_poker_bot.shared.models import (
     HandAnalytics,
     PlayerSession,
     Hand,
+    HandStatus,
     Action,
     ActionType,
     Seat,
@@ -42,103 +45,204 @@ class HandAnalyticsProcessor:
             hand_id: ID of the completed hand
             
         Returns:
-            Created HandAnalytics record or None if hand not found
+            Created HandAnalytics record or None if hand not found or
+            already processed
         """
-        # Get hand with related data
-        result = await db.execute(
-            select(Hand)
-            .where(Hand.id == hand_id)
-        )
-        hand = result.scalar_one_or_none()
+        created = await HandAnalyticsProcessor.process_hands(db, [hand_id])
+        return created.get(hand_id)
+    
+    @staticmethod
+    async def process_hands(
+        db: AsyncSession,
+        hand_ids: List[int],
+    ) -> Dict[int, HandAnalytics]:
+        """Process completed hands in bulk and create analytics records.
+        
+        Hands, tables with templates, actions and seats are each loaded with
+        one set-based query for the whole batch, the new rows are inserted
+        with a single ``INSERT ... ON CONFLICT (hand_id) DO NOTHING`` and
+        added to the hourly table rollups in the same transaction. Hands that
+        already have analytics (including ones inserted concurrently by
+        another consumer) are skipped and not returned, so the call is safe
+        to repeat (at-least-once event delivery, back-fills).
         
-        if not hand:
-            logger.warning("Hand not found for analytics", hand_id=hand_id)
-            return None
+        Args:
+            db: Database session
+            hand_ids: IDs of completed hands
+            
+        Returns:
+            Dict of hand ID to created HandAnalytics record
+        """
+        hand_ids = list(dict.fromkeys(hand_ids))
+        if not hand_ids:
+            return {}
         
-        # Get table and template
-        table_result = await db.execute(
-            select(Table, TableTemplate)
+        existing_result = await db.execute(
+            select(HandAnalytics.hand_id).where(HandAnalytics.hand_id.in_(hand_ids))
+        )
+        processed = set(existing_result.scalars().all())
+        pending_ids = [hand_id for hand_id in hand_ids if hand_id not in processed]
+        if not pending_ids:
+            return {}
+        
+        # Hands with their table and template
+        hands_result = await db.execute(
+            select(Hand, Table, TableTemplate)
+            .join(Table, Hand.table_id == Table.id)
             .join(TableTemplate, Table.template_id == TableTemplate.id)
-            .where(Table.id == hand.table_id)
+            .where(Hand.id.in_(pending_ids))
         )
-        table_row = table_result.one_or_none()
+        hand_rows = {hand.id: (hand, table, template) for hand, table, template in hands_result.all()}
         
-        if not table_row:
-            logger.warning("Table not found for hand", hand_id=hand_id, table_id=hand.table_id)
-            return None
+        missing = [hand_id for hand_id in pending_ids if hand_id not in hand_rows]
+        if missing:
+            logger.warning("Hands not found for analytics", hand_ids=missing)
+        if not hand_rows:
+            return {}
         
-        table, template = table_row
-        
-        # Get all actions for this hand
+        # All actions of the batch, grouped per hand in order
         actions_result = await db.execute(
             select(Action)
-            .where(Action.hand_id == hand_id)
-            .order_by(Action.created_at)
+            .where(Action.hand_id.in_(list(hand_rows)))
+            .order_by(Action.hand_id, Action.created_at, Action.id)
         )
-        actions = list(actions_result.scalars().all())
+        actions_by_hand: Dict[int, List[Action]] = {}
+        for action in actions_result.scalars().all():
+            actions_by_hand.setdefault(action.hand_id, []).append(action)
         
-        # Get seats at the time of this hand
+        # Seats of every table in the batch
+        table_ids = {hand.table_id for hand, _, _ in hand_rows.values()}
         seats_result = await db.execute(
-            select(Seat)
-            .where(Seat.table_id == hand.table_id)
+            select(Seat).where(Seat.table_id.in_(table_ids))
         )
-        seats = list(seats_result.scalars().all())
+        seats_by_table: Dict[int, List[Seat]] = {}
+        for seat in seats_result.scalars().all():
+            seats_by_table.setdefault(seat.table_id, []).append(seat)
+        
+        rows: Dict[int, Dict[str, Any]] = {}
+        for hand_id, (hand, table, template) in hand_rows.items():
+            analytics_data = HandAnalyticsProcessor._calculate_hand_metrics(
+                hand,
+                table,
+                template,
+                actions_by_hand.get(hand_id, []),
+                seats_by_table.get(hand.table_id, []),
+            )
+            rows[hand_id] = dict(
+                table_id=hand.table_id,
+                hand_id=hand_id,
+                template_id=template.id,
+                hand_no=hand.hand_no,
+                variant=analytics_data["variant"],
+                stakes=analytics_data["stakes"],
+                currency=analytics_data["currency"],
+                players_in_hand=analytics_data["players_in_hand"],
+                positions=analytics_data["positions"],
+                button_seat=analytics_data.get("button_seat"),
+                sb_seat=analytics_data.get("sb_seat"),
+                bb_seat=analytics_data.get("bb_seat"),
+                vpip_mask=analytics_data["vpip_mask"],
+                pfr_mask=analytics_data["pfr_mask"],
+                actions_count=analytics_data["actions_count"],
+                aggression_factor=analytics_data.get("aggression_factor"),
+                total_pot=analytics_data["total_pot"],
+                rake=analytics_data["rake"],
+                multiway=analytics_data["multiway"],
+                went_to_showdown=analytics_data["went_to_showdown"],
+                showdown_count=analytics_data["showdown_count"],
+                winners=analytics_data.get("winners"),
+                timeouts=analytics_data["timeouts"],
+                autofolds=analytics_data["autofolds"],
+                player_deltas=analytics_data.get("player_deltas"),
+            )
         
-        # Calculate analytics metrics
-        analytics_data = await HandAnalyticsProcessor._calculate_hand_metrics(
-            hand, table, template, actions, seats
+        # One multi-row insert; the unique hand_id index turns a concurrent
+        # or repeated insert into a no-op, and only inserted rows come back
+        inserted_result = await db.execute(
+            pg_insert(HandAnalytics)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=["hand_id"])
+            .returning(HandAnalytics.hand_id, HandAnalytics.id)
         )
+        created: Dict[int, HandAnalytics] = {
+            hand_id: HandAnalytics(id=analytics_id, **rows[hand_id])
+            for hand_id, analytics_id in inserted_result.all()
+        }
         
-        # Create analytics record
-        hand_analytics = HandAnalytics(
-            table_id=hand.table_id,
-            hand_id=hand_id,
-            template_id=template.id,
-            hand_no=hand.hand_no,
-            variant=analytics_data["variant"],
-            stakes=analytics_data["stakes"],
-            currency=analytics_data["currency"],
-            players_in_hand=analytics_data["players_in_hand"],
-            positions=analytics_data["positions"],
-            button_seat=analytics_data.get("button_seat"),
-            sb_seat=analytics_data.get("sb_seat"),
-            bb_seat=analytics_data.get("bb_seat"),
-            vpip_mask=analytics_data["vpip_mask"],
-            pfr_mask=analytics_data["pfr_mask"],
-            actions_count=analytics_data["actions_count"],
-            aggression_factor=analytics_data.get("aggression_factor"),
-            total_pot=analytics_data["total_pot"],
-            rake=analytics_data["rake"],
-            multiway=analytics_data["multiway"],
-            went_to_showdown=analytics_data["went_to_showdown"],
-            showdown_count=analytics_data["showdown_count"],
-            winners=analytics_data.get("winners"),
-            timeouts=analytics_data["timeouts"],
-            autofolds=analytics_data["autofolds"],
-            player_deltas=analytics_data.get("player_deltas"),
+        # Live hourly counters, committed together with the new rows
+        await AnalyticsService.record_hand_rollups(
+            db,
+            [(hand_rows[hand_id][0].started_at, analytics) for hand_id, analytics in created.items()],
         )
         
-        db.add(hand_analytics)
-        await db.flush()
-        
         logger.info(
             "Created hand analytics",
-            hand_id=hand_id,
-            table_id=hand.table_id,
-            players=analytics_data["players_in_hand"],
+            hands=len(created),
+            skipped=len(processed) + len(rows) - len(created),
+            missing=len(missing),
         )
         
-        return hand_analytics
+        return created
     
     @staticmethod
-    async def _calculate_hand_metrics(
+    async def backfill(
+        db: AsyncSession,
+        batch_size: int = 500,
+        table_id: Optional[int] = None,
+    ) -> int:
+        """Create analytics for finished hands that have none.
+        
+        Walks finished hands in ID order, ``batch_size`` at a time, and
+        commits after each batch so a long back-fill can be interrupted and
+        resumed. HandAnalytics rows and their hourly rollups are written;
+        live Redis windows and player sessions are left alone.
+        
+        Args:
+            db: Database session
+            batch_size: Hands processed per batch
+            table_id: Restrict the back-fill to one table
+            
+        Returns:
+            Number of HandAnalytics records created
+        """
+        total = 0
+        last_id = 0
+        while True:
+            query = (
+                select(Hand.id)
+                .outerjoin(HandAnalytics, HandAnalytics.hand_id == Hand.id)
+                .where(
+                    Hand.id > last_id,
+                    Hand.status.in_([HandStatus.ENDED, HandStatus.INTER_HAND_WAIT]),
+                    HandAnalytics.id.is_(None),
+                )
+                .order_by(Hand.id)
+                .limit(batch_size)
+            )
+            if table_id is not None:
+                query = query.where(Hand.table_id == table_id)
+            
+            hand_ids = list((await db.execute(query)).scalars().all())
+            if not hand_ids:
+                break
+            
+            created = await HandAnalyticsProcessor.process_hands(db, hand_ids)
+            await db.commit()
+            total += len(created)
+            last_id = hand_ids[-1]
+        
+        logger.info("Hand analytics back-fill complete", created=total, table_id=table_id)
+        return total
+    
+    @staticmethod
+    def _calculate_hand_metrics(
         hand: Hand,
         table: Table,
         template: TableTemplate,
         actions: List[Action],
         seats: List[Seat],
     ) -> Dict[str, Any]:
-        """Calculate all metrics for a hand.
+        """Calculate all metrics for a hand in one pass over its actions.
         
         Args:
             hand: Hand record
@@ -173,50 +277,49 @@ class HandAnalyticsProcessor:
         # Build positions map
         positions = {seat.user_id: seat.position for seat in active_seats}
         
-        # Calculate VPIP and PFR masks
-        vpip_mask = {}
-        pfr_mask = {}
-        
-        for seat in active_seats:
-            user_id = seat.user_id
-            
-            # VPIP: Did player voluntarily put money in pot?
-            vpip = any(
-                a.user_id == user_id and a.type in [ActionType.BET, ActionType.CALL, ActionType.RAISE]
-                for a in actions
-            )
-            vpip_mask[user_id] = vpip
-            
-            # PFR: Did player raise preflop?
-            # Note: Simplified - ideally we'd track street per action
-            pfr = any(
-                a.user_id == user_id and a.type == ActionType.RAISE
-                for a in actions
-            )
-            pfr_mask[user_id] = pfr
+        # Single pass over the actions
+        vpip_users = set()
+        pfr_users = set()  # Simplified - ideally we'd track street per action
+        active_players = set()
+        bets = raises = calls = 0
+        total_pot = 0
+        
+        for action in actions:
+            action_type = action.type
+            if action_type != ActionType.FOLD:
+                active_players.add(action.user_id)
+            if action_type == ActionType.BET:
+                bets += 1
+            elif action_type == ActionType.RAISE:
+                raises += 1
+                pfr_users.add(action.user_id)
+            elif action_type == ActionType.CALL:
+                calls += 1
+            else:
+                continue
+            # Voluntary money in the pot
+            vpip_users.add(action.user_id)
+            total_pot += action.amount
+        
+        # VPIP: Did player voluntarily put money in pot?
+        # PFR: Did player raise preflop?
+        vpip_mask = {seat.user_id: seat.user_id in vpip_users for seat in active_seats}
+        pfr_mask = {seat.user_id: seat.user_id in pfr_users for seat in active_seats}
         
         # Count actions
         actions_count = len(actions)
         
         # Calculate aggression factor
-        bets = sum(1 for a in actions if a.type == ActionType.BET)
-        raises = sum(1 for a in actions if a.type == ActionType.RAISE)
-        calls = sum(1 for a in actions if a.type == ActionType.CALL)
-        
         aggression_factor = None
         if calls > 0:
             aggression_factor = (bets + raises) / calls
         
-        # Calculate total pot (sum of all bets/raises/calls)
-        total_pot = sum(a.amount for a in actions if a.type in [ActionType.BET, ActionType.RAISE, ActionType.CALL])
-        
         # Estimate rake (typically 5% up to a cap)
         rake = min(int(total_pot * 0.05), big_blind * 3)
         
         # Multiway: Did 3+ players see the flop?
         # Simplified: Check if 3+ players took voluntary actions
-        active_players = len(set(a.user_id for a in actions if a.type != ActionType.FOLD))
-        multiway = active_players >= 3
+        multiway = len(active_players) >= 3
         
         # Showdown tracking (simplified - would need street tracking)
         went_to_showdown = hand.status.value == "showdown" if hand.status else False
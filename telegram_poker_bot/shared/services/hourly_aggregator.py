@@ -6,31 +6,41 @@ real-time counters and hand-level data into hourly summaries.
 
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
-from sqlalchemy import select, and_, func
+from sqlalchemy import DateTime, and_, distinct, func, literal, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 import asyncio
+import time
 
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.models import (
-    HourlyTableStats,
     HourlyPlayerStats,
     LeaderboardSnapshot,
     AnalyticsJob,
-    HandAnalytics,
     PlayerSession,
-    Table,
-    TableSnapshot,
+)
+from telegram_poker_bot.shared.services.analytics_service import AnalyticsService
+from telegram_poker_bot.shared.services.leaderboard_service import (
+    LEADERBOARD_TYPES,
+    get_leaderboard_service,
 )
 from telegram_poker_bot.shared.services.redis_analytics import RedisAnalytics
 
 logger = get_logger(__name__)
 
+# Time budget for one aggregation job; slower jobs are logged as warnings so
+# the budget can be checked against production volumes
+HOURLY_JOB_TARGET_SECONDS = 30
+
+# Players kept per leaderboard snapshot
+LEADERBOARD_SNAPSHOT_SIZE = 100
+
 
 class HourlyAggregator:
     """Aggregates analytics data on an hourly basis.
     
     Processes:
-    1. Table-level metrics from Redis + Postgres
+    1. Sealing the live table-level rollups of the hour
     2. Player-level metrics from hand analytics
     3. Leaderboard snapshots
     
@@ -125,6 +135,7 @@ class HourlyAggregator:
         job.status = "running"
         job.started_at = datetime.now(timezone.utc)
         await self.db.flush()
+        started = time.monotonic()
         
         try:
             if job.job_type == "hourly_table":
@@ -141,7 +152,15 @@ class HourlyAggregator:
             job.completed_at = datetime.now(timezone.utc)
             await self.db.flush()
             
-            logger.info("Completed job", job_id=job.id, job_type=job.job_type)
+            elapsed = time.monotonic() - started
+            log = logger.warning if elapsed > HOURLY_JOB_TARGET_SECONDS else logger.info
+            log(
+                "Completed job",
+                job_id=job.id,
+                job_type=job.job_type,
+                duration_ms=round(elapsed * 1000, 2),
+                target_seconds=HOURLY_JOB_TARGET_SECONDS,
+            )
             return True
             
         except Exception as e:
@@ -163,290 +182,127 @@ class HourlyAggregator:
     # ==================== Table Aggregation ====================
     
     async def _process_hourly_table_aggregation(self, job: AnalyticsJob):
-        """Aggregate table-level metrics for an hour.
+        """Seal table-level metrics for an hour.
         
-        Combines:
-        - Redis real-time counters
-        - Table snapshots from Postgres
-        - Hand analytics
+        Hand counters are rolled up live as hands complete
+        (``AnalyticsService.record_hand_rollups``), so this only adds the
+        snapshot averages and marks the hour sealed.
         """
         hour_start_str = job.params.get("hour_start")
         hour_start = datetime.fromisoformat(hour_start_str)
-        hour_end = hour_start + timedelta(hours=1)
         
         logger.info("Processing table aggregation", hour_start=hour_start.isoformat())
         
-        # Get all tables that were active during this hour
-        tables_result = await self.db.execute(
-            select(Table.id)
-            .distinct()
-            .join(TableSnapshot, Table.id == TableSnapshot.table_id)
-            .where(
-                and_(
-                    TableSnapshot.snapshot_time >= hour_start,
-                    TableSnapshot.snapshot_time < hour_end,
-                )
-            )
-        )
-        table_ids = [row[0] for row in tables_result.all()]
-        
-        for table_id in table_ids:
-            await self._aggregate_table_hour(table_id, hour_start, hour_end)
-    
-    async def _aggregate_table_hour(
-        self,
-        table_id: int,
-        hour_start: datetime,
-        hour_end: datetime,
-    ):
-        """Aggregate metrics for a single table for one hour."""
-        
-        # Get snapshots for this hour
-        snapshots_result = await self.db.execute(
-            select(TableSnapshot)
-            .where(
-                and_(
-                    TableSnapshot.table_id == table_id,
-                    TableSnapshot.snapshot_time >= hour_start,
-                    TableSnapshot.snapshot_time < hour_end,
-                )
-            )
-            .order_by(TableSnapshot.snapshot_time)
-        )
-        snapshots = list(snapshots_result.scalars().all())
-        
-        if not snapshots:
-            return
-        
-        # Calculate averages from snapshots
-        avg_players = sum(s.player_count for s in snapshots) / len(snapshots)
-        max_players = max(s.player_count for s in snapshots)
-        
-        # Count active minutes (snapshots where is_active=True)
-        active_snapshots = [s for s in snapshots if s.is_active]
-        activity_minutes = len(active_snapshots) * 5  # Assuming 5-min snapshot interval
-        
-        # Get hand count from hand analytics
-        hands_result = await self.db.execute(
-            select(func.count(HandAnalytics.id))
-            .where(
-                and_(
-                    HandAnalytics.table_id == table_id,
-                    HandAnalytics.created_at >= hour_start,
-                    HandAnalytics.created_at < hour_end,
-                )
-            )
-        )
-        total_hands = hands_result.scalar() or 0
-        
-        # Get aggregate metrics from hand analytics
-        hands_metrics_result = await self.db.execute(
-            select(
-                func.avg(HandAnalytics.total_pot).label("avg_pot"),
-                func.max(HandAnalytics.total_pot).label("max_pot"),
-                func.sum(HandAnalytics.rake).label("total_rake"),
-                func.avg(func.cast(HandAnalytics.multiway, type_=type(1))).label("multiway_freq"),
-                func.avg(func.cast(HandAnalytics.went_to_showdown, type_=type(1))).label("showdown_freq"),
-            )
-            .where(
-                and_(
-                    HandAnalytics.table_id == table_id,
-                    HandAnalytics.created_at >= hour_start,
-                    HandAnalytics.created_at < hour_end,
-                )
-            )
-        )
-        hands_metrics = hands_metrics_result.one_or_none()
-        
-        # Get Redis counters (current state)
-        redis_metrics = await self.redis.get_all_table_metrics(table_id)
-        
-        # Build metadata
-        metadata = {
-            "avg_pot": float(hands_metrics[0]) if hands_metrics and hands_metrics[0] else 0.0,
-            "max_pot": int(hands_metrics[1]) if hands_metrics and hands_metrics[1] else 0,
-            "total_rake": int(hands_metrics[2]) if hands_metrics and hands_metrics[2] else 0,
-            "multiway_frequency": float(hands_metrics[3]) if hands_metrics and hands_metrics[3] else 0.0,
-            "showdown_frequency": float(hands_metrics[4]) if hands_metrics and hands_metrics[4] else 0.0,
-            "redis_metrics": redis_metrics,
-        }
-        
-        # Create or update hourly stats
-        stats = HourlyTableStats(
-            table_id=table_id,
-            hour_start=hour_start,
-            avg_players=int(avg_players),
-            max_players=max_players,
-            total_hands=total_hands,
-            activity_minutes=activity_minutes,
-            metadata_json=metadata,
-        )
-        
-        self.db.add(stats)
-        await self.db.flush()
-        
-        logger.debug(
-            "Aggregated table hour",
-            table_id=table_id,
-            hour_start=hour_start.isoformat(),
-            total_hands=total_hands,
-        )
+        await AnalyticsService.seal_hourly_stats(self.db, hour_start)
     
     # ==================== Player Aggregation ====================
     
     async def _process_hourly_player_aggregation(self, job: AnalyticsJob):
-        """Aggregate player-level metrics for an hour."""
+        """Aggregate player-level metrics for an hour.
+        
+        One upsert sums the sessions started in the hour per player.
+        Re-running the job overwrites the hour's rows.
+        """
         hour_start_str = job.params.get("hour_start")
         hour_start = datetime.fromisoformat(hour_start_str)
         hour_end = hour_start + timedelta(hours=1)
         
         logger.info("Processing player aggregation", hour_start=hour_start.isoformat())
         
-        # Get all users who played during this hour
-        users_result = await self.db.execute(
-            select(HandAnalytics.players_in_hand)
-            .where(
-                and_(
-                    HandAnalytics.created_at >= hour_start,
-                    HandAnalytics.created_at < hour_end,
-                )
+        rows = (
+            select(
+                PlayerSession.user_id,
+                literal(hour_start, DateTime(timezone=True)),
+                func.sum(PlayerSession.hands_played),
+                func.count(distinct(PlayerSession.table_id)),
+                func.sum(PlayerSession.vpip_count),
+                func.sum(PlayerSession.pfr_count),
+                func.sum(PlayerSession.af_numerator),
+                func.sum(PlayerSession.af_denominator),
+                # Open sessions have no net yet
+                func.coalesce(func.sum(PlayerSession.net), 0),
+                # bb/100 would need stakes info
+                null(),
             )
-        )
-        
-        # Extract unique user IDs from positions JSONB
-        all_user_ids = set()
-        for row in users_result.all():
-            # This is simplified - we'd need to parse the positions JSONB
-            pass
-        
-        # For now, aggregate based on player sessions
-        sessions_result = await self.db.execute(
-            select(PlayerSession.user_id)
-            .distinct()
             .where(
                 and_(
                     PlayerSession.session_start >= hour_start,
                     PlayerSession.session_start < hour_end,
                 )
             )
+            .group_by(PlayerSession.user_id)
         )
-        user_ids = [row[0] for row in sessions_result.all()]
         
-        for user_id in user_ids:
-            await self._aggregate_player_hour(user_id, hour_start, hour_end)
-    
-    async def _aggregate_player_hour(
-        self,
-        user_id: int,
-        hour_start: datetime,
-        hour_end: datetime,
-    ):
-        """Aggregate metrics for a single player for one hour."""
-        
-        # Get all sessions for this player during this hour
-        sessions_result = await self.db.execute(
-            select(PlayerSession)
-            .where(
-                and_(
-                    PlayerSession.user_id == user_id,
-                    PlayerSession.session_start >= hour_start,
-                    PlayerSession.session_start < hour_end,
-                )
-            )
-        )
-        sessions = list(sessions_result.scalars().all())
-        
-        if not sessions:
-            return
-        
-        # Aggregate session metrics
-        hands_played = sum(s.hands_played for s in sessions)
-        tables_played = len(set(s.table_id for s in sessions))
-        vpip_count = sum(s.vpip_count for s in sessions)
-        pfr_count = sum(s.pfr_count for s in sessions)
-        af_numerator = sum(s.af_numerator for s in sessions)
-        af_denominator = sum(s.af_denominator for s in sessions)
-        timeouts = sum(s.timeouts for s in sessions)
-        
-        # Calculate net profit
-        net_profit = sum(s.net for s in sessions if s.net is not None)
-        
-        # Calculate bb/100 (simplified - would need stakes info)
-        bb100 = None
-        
-        # Create hourly stats
-        stats = HourlyPlayerStats(
-            user_id=user_id,
-            hour_start=hour_start,
-            hands_played=hands_played,
-            tables_played=tables_played,
-            vpip_count=vpip_count,
-            pfr_count=pfr_count,
-            af_numerator=af_numerator,
-            af_denominator=af_denominator,
-            net_profit=net_profit,
-            bb100=bb100,
+        columns = [
+            "user_id",
+            "hour_start",
+            "hands_played",
+            "tables_played",
+            "vpip_count",
+            "pfr_count",
+            "af_numerator",
+            "af_denominator",
+            "net_profit",
+            "bb100",
+        ]
+        stmt = pg_insert(HourlyPlayerStats).from_select(columns, rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "hour_start"],
+            set_={column: stmt.excluded[column] for column in columns[2:]},
         )
+        result = await self.db.execute(stmt)
         
-        self.db.add(stats)
-        await self.db.flush()
-        
-        logger.debug(
+        logger.info(
             "Aggregated player hour",
-            user_id=user_id,
             hour_start=hour_start.isoformat(),
-            hands_played=hands_played,
+            players=result.rowcount,
         )
     
     # ==================== Leaderboard Snapshots ====================
     
     async def _process_leaderboard_snapshot(self, job: AnalyticsJob):
-        """Create leaderboard snapshots."""
+        """Create leaderboard snapshots.
+        
+        Copies the top of every daily and weekly board (all games and per
+        variant) from the sorted sets ``LeaderboardService`` keeps up to date
+        as hands finish; nothing is re-aggregated here.
+        """
         hour_start_str = job.params.get("hour_start")
         hour_start = datetime.fromisoformat(hour_start_str)
         
         logger.info("Processing leaderboard snapshot", hour_start=hour_start.isoformat())
         
-        # Get top players by net profit (last 24 hours)
-        cutoff = hour_start - timedelta(hours=24)
-        
-        top_players_result = await self.db.execute(
-            select(
-                HourlyPlayerStats.user_id,
-                func.sum(HourlyPlayerStats.net_profit).label("total_profit"),
-                func.sum(HourlyPlayerStats.hands_played).label("total_hands"),
-            )
-            .where(HourlyPlayerStats.hour_start >= cutoff)
-            .group_by(HourlyPlayerStats.user_id)
-            .order_by(func.sum(HourlyPlayerStats.net_profit).desc())
-            .limit(100)
-        )
-        
-        rankings = []
-        for rank, row in enumerate(top_players_result.all(), start=1):
-            rankings.append({
-                "rank": rank,
-                "user_id": row[0],
-                "score": int(row[1]),
-                "hands": int(row[2]),
-            })
-        
-        # Create snapshot
-        snapshot = LeaderboardSnapshot(
-            snapshot_time=hour_start,
-            leaderboard_type="daily",
-            variant=None,  # All variants
-            stakes=None,
-            rankings=rankings,
-        )
+        leaderboards = get_leaderboard_service(self.redis.redis)
+        variants = await leaderboards.get_variants()
+        
+        snapshots = []
+        for leaderboard_type in LEADERBOARD_TYPES:
+            for variant in [None, *variants]:
+                rankings = await leaderboards.get_top(
+                    leaderboard_type,
+                    variant,
+                    limit=LEADERBOARD_SNAPSHOT_SIZE,
+                    at=hour_start,
+                )
+                if variant and not rankings:
+                    continue
+                snapshots.append(
+                    LeaderboardSnapshot(
+                        snapshot_time=hour_start,
+                        leaderboard_type=leaderboard_type,
+                        variant=variant,  # None: all variants
+                        stakes=None,
+                        rankings=rankings,
+                    )
+                )
         
-        self.db.add(snapshot)
+        self.db.add_all(snapshots)
         await self.db.flush()
         
         logger.info(
-            "Created leaderboard snapshot",
+            "Created leaderboard snapshots",
             hour_start=hour_start.isoformat(),
-            top_players=len(rankings),
+            snapshots=len(snapshots),
         )
     
     # ==================== Scheduler ====================
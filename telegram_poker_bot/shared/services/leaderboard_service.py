@@ -0,0 +1,201 @@
+"""Live leaderboards kept in Redis sorted sets.
+
+Every board is a sorted set of user ids scored by net chips won, plus a hash
+counting each player's hands. Boards exist per period (UTC day, ISO week)
+for all games and per game variant:
+
+- leaderboard:{type}:{period}:all
+- leaderboard:{type}:{period}:variant:{variant}
+- ...and the same key with a ``:hands`` suffix for the hand counts
+
+Finished hands add their per-player net result with ``ZINCRBY``, so a rank
+or neighbourhood lookup is a ``ZREVRANK``/``ZREVRANGE`` (O(log N)) and
+snapshots copy the top of a board instead of re-aggregating history. A hand
+is applied at most once: the update script first sets a per-hand marker.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import redis.asyncio as redis
+
+from telegram_poker_bot.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+LEADERBOARD_TYPES = ("daily", "weekly")
+
+# Boards outlive their period so the snapshot of its last hour can read it
+LEADERBOARD_TTL_SECONDS = {
+    "daily": 3 * 86400,
+    "weekly": 15 * 86400,
+}
+# How long a hand is remembered as applied
+HAND_MARKER_TTL_SECONDS = 86400
+
+VARIANTS_KEY = "leaderboard:variants"
+
+# Apply one hand to every board unless its marker is already set.
+# KEYS: marker, then (board, board hands) pairs
+# ARGV: marker TTL, player count, (user, net) pairs, one TTL per board
+_RECORD_HAND_SCRIPT = """
+if not redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+local players = tonumber(ARGV[2])
+local ttl_base = 2 + players * 2
+for b = 2, #KEYS, 2 do
+    local ttl = ARGV[ttl_base + b / 2]
+    for p = 0, players - 1 do
+        local user = ARGV[3 + p * 2]
+        redis.call('ZINCRBY', KEYS[b], ARGV[4 + p * 2], user)
+        redis.call('HINCRBY', KEYS[b + 1], user, 1)
+    end
+    redis.call('EXPIRE', KEYS[b], ttl)
+    redis.call('EXPIRE', KEYS[b + 1], ttl)
+end
+return 1
+"""
+
+# (hand_id, ended_at, variant, {user_id: net chips})
+FinishedHand = Tuple[int, datetime, Optional[str], Mapping[int, int]]
+
+
+def period_key(leaderboard_type: str, at: datetime) -> str:
+    """Period a moment falls in: the UTC date, or the Monday of its ISO week."""
+    day = at.astimezone(timezone.utc).date()
+    if leaderboard_type == "daily":
+        return day.isoformat()
+    if leaderboard_type == "weekly":
+        return (day - timedelta(days=day.weekday())).isoformat()
+    raise ValueError(f"Unknown leaderboard type: {leaderboard_type}")
+
+
+def board_key(
+    leaderboard_type: str, at: datetime, variant: Optional[str] = None
+) -> str:
+    """Sorted-set key of a board."""
+    scope = f"variant:{variant}" if variant else "all"
+    return f"leaderboard:{leaderboard_type}:{period_key(leaderboard_type, at)}:{scope}"
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class LeaderboardService:
+    """Incrementally maintained daily/weekly leaderboards."""
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._record_hand_script = redis_client.register_script(_RECORD_HAND_SCRIPT)
+
+    async def record_hands(self, hands: Iterable[FinishedHand]) -> None:
+        """Add finished hands' net results to their boards in one round-trip.
+
+        Args:
+            hands: ``(hand_id, ended_at, variant, {user_id: net chips})``
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        variants = set()
+        queued = 0
+        for hand_id, ended_at, variant, deltas in hands:
+            if not deltas:
+                continue
+            keys = [f"leaderboard:hand:{hand_id}"]
+            ttls = []
+            for leaderboard_type in LEADERBOARD_TYPES:
+                for scope in (None, variant) if variant else (None,):
+                    key = board_key(leaderboard_type, ended_at, scope)
+                    keys.extend([key, f"{key}:hands"])
+                    ttls.append(LEADERBOARD_TTL_SECONDS[leaderboard_type])
+            args: List[Any] = [HAND_MARKER_TTL_SECONDS, len(deltas)]
+            for user_id, net in deltas.items():
+                args.extend([user_id, net])
+            args.extend(ttls)
+            await self._record_hand_script(keys=keys, args=args, client=pipe)
+            if variant:
+                variants.add(variant)
+            queued += 1
+        if not queued:
+            return
+        if variants:
+            pipe.sadd(VARIANTS_KEY, *variants)
+        await pipe.execute()
+
+    async def get_variants(self) -> List[str]:
+        """Variants that have per-variant boards."""
+        return sorted(_decode(v) for v in await self.redis.smembers(VARIANTS_KEY))
+
+    async def get_top(
+        self,
+        leaderboard_type: str,
+        variant: Optional[str] = None,
+        limit: int = 100,
+        at: Optional[datetime] = None,
+    ) -> List[Dict[str, int]]:
+        """Top of a board as ``{rank, user_id, score, hands}`` rows."""
+        key = board_key(leaderboard_type, at or datetime.now(timezone.utc), variant)
+        return await self._range(key, 0, limit - 1)
+
+    async def get_rank(
+        self,
+        leaderboard_type: str,
+        user_id: int,
+        variant: Optional[str] = None,
+        radius: int = 5,
+        at: Optional[datetime] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """A player's rank, score and the ``radius`` players around them.
+
+        Returns:
+            ``{rank, score, hands, nearby}`` or None if the player is not on
+            the board
+        """
+        key = board_key(leaderboard_type, at or datetime.now(timezone.utc), variant)
+        rank = await self.redis.zrevrank(key, user_id)
+        if rank is None:
+            return None
+
+        nearby = await self._range(key, max(rank - radius, 0), rank + radius)
+        me = next((row for row in nearby if row["user_id"] == user_id), None)
+        if me is None:
+            # Moved out of the range between the two reads
+            return None
+        return {
+            "rank": me["rank"],
+            "score": me["score"],
+            "hands": me["hands"],
+            "nearby": nearby,
+        }
+
+    async def _range(self, key: str, start: int, stop: int) -> List[Dict[str, int]]:
+        """Rows ``start..stop`` (0-based, best first) with their hand counts."""
+        members = await self.redis.zrevrange(key, start, stop, withscores=True)
+        if not members:
+            return []
+        user_ids = [int(_decode(member)) for member, _ in members]
+        hands = await self.redis.hmget(f"{key}:hands", user_ids)
+        return [
+            {
+                "rank": start + offset + 1,
+                "user_id": user_id,
+                "score": int(score),
+                "hands": int(count) if count else 0,
+            }
+            for offset, (user_id, (_, score), count) in enumerate(
+                zip(user_ids, members, hands)
+            )
+        ]
+
+
+# Global instance
+_leaderboard_service: Optional[LeaderboardService] = None
+
+
+def get_leaderboard_service(redis_client: redis.Redis) -> LeaderboardService:
+    """Get or create the leaderboard service instance."""
+    global _leaderboard_service
+    if _leaderboard_service is None:
+        _leaderboard_service = LeaderboardService(redis_client)
+    return _leaderboard_service
@@ -4,11 +4,14 @@ Detects suspicious patterns and unusual behavior for admin monitoring.
 PLUS Edition feature.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from datetime import datetime, timezone, timedelta
+from itertools import compress
+import time
+
+import numpy as np
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-import statistics
 
 from telegram_poker_bot.shared.logging import get_logger
 from telegram_poker_bot.shared.models import (
@@ -17,11 +20,16 @@ from telegram_poker_bot.shared.models import (
     PlayerSession,
     User,
     Table,
+    TableStatus,
 )
 from telegram_poker_bot.shared.services.redis_analytics import RedisAnalytics
 
 logger = get_logger(__name__)
 
+# (alert_type, table_id, user_id, hand_id); a scan raises each key once per window
+AlertKey = Tuple[str, Optional[int], Optional[int], Optional[int]]
+SCAN_ALERT_TYPES = ("big_pot", "timeout_surge", "vpip_mismatch", "rapid_action")
+
 
 class OutlierDetector:
     """Detects anomalies and suspicious patterns in poker gameplay.
@@ -42,6 +50,12 @@ class OutlierDetector:
         self.TIMEOUT_SURGE_THRESHOLD = 5  # timeouts per hour
         self.VPIP_MISMATCH_THRESHOLD = 0.5  # difference threshold
         self.RAPID_ACTION_MS = 500  # milliseconds
+        self.POT_SPIKE_MIN_SAMPLES = 5  # pots in the rolling window
+        self.RAPID_ACTION_MIN_SAMPLES = 20  # turns in the rolling window
+        
+        # Batch scans
+        self.SCAN_WINDOW = timedelta(hours=1)
+        self.SCAN_HANDS_PER_TABLE = 100
     
     # ==================== Detection Methods ====================
     
@@ -80,7 +94,7 @@ class OutlierDetector:
             table_id=table_id,
             hand_id=hand_id,
             message=f"Pot size {pot_size} is {self.POT_SPIKE_THRESHOLD}x std dev above average",
-            metadata={
+            alert_metadata={
                 "pot_size": pot_size,
                 "avg_pot": pot_stats.get("avg", 0),
                 "max_pot": pot_stats.get("max", 0),
@@ -140,7 +154,7 @@ class OutlierDetector:
                     table_id=table_id,
                     user_id=user_id,
                     message=f"Player has {total_timeouts} timeouts in the last hour",
-                    metadata={
+                    alert_metadata={
                         "timeouts": total_timeouts,
                         "threshold": self.TIMEOUT_SURGE_THRESHOLD,
                     },
@@ -228,7 +242,7 @@ class OutlierDetector:
                 table_id=table_id,
                 user_id=user_id,
                 message=f"Suspicious VPIP/PFR pattern: {reason}",
-                metadata={
+                alert_metadata={
                     "vpip_pct": vpip_pct,
                     "pfr_pct": pfr_pct,
                     "hands": total_hands,
@@ -275,7 +289,7 @@ class OutlierDetector:
                 table_id=table_id,
                 user_id=user_id,
                 message=f"Player consistently acts in <{self.RAPID_ACTION_MS}ms (P95: {p95_turn_time}ms)",
-                metadata={
+                alert_metadata={
                     "p95_turn_time": p95_turn_time,
                     "threshold": self.RAPID_ACTION_MS,
                 },
@@ -306,62 +320,297 @@ class OutlierDetector:
         Returns:
             List of detected alerts
         """
+        return await self.scan_tables([table_id])
+    
+    async def scan_all_active_tables(self) -> List[AnomalyAlert]:
+        """Scan all active tables for anomalies.
+        
+        Returns:
+            List of all detected alerts
+        """
+        tables_result = await self.db.execute(
+            select(Table.id).where(Table.status == TableStatus.ACTIVE)
+        )
+        return await self.scan_tables(tables_result.scalars().all())
+    
+    async def scan_tables(self, table_ids: Iterable[int]) -> List[AnomalyAlert]:
+        """Scan many tables at once.
+        
+        Features for every table and player come from a few set-based
+        queries and two pipelined Redis reads; the thresholds are applied
+        with NumPy over the whole set. Only alerts not already raised within
+        the scan window are written, with a single flush.
+        
+        Args:
+            table_ids: Tables to scan
+            
+        Returns:
+            List of newly created alerts
+        """
+        table_ids = list(dict.fromkeys(table_ids))
+        if not table_ids:
+            return []
+        
+        started = time.perf_counter()
+        since = datetime.now(timezone.utc) - self.SCAN_WINDOW
+        
+        candidates = await self._scan_pot_spikes(table_ids, since)
+        candidates += await self._scan_rapid_actions(table_ids)
+        candidates += await self._scan_player_sessions(table_ids, since)
+        
+        raised = await self._recent_alert_keys(since)
         alerts = []
+        for key, alert in candidates:
+            if key not in raised:
+                raised.add(key)
+                alerts.append(alert)
         
-        # Get recent hands for this table
-        hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        if alerts:
+            self.db.add_all(alerts)
+            await self.db.flush()
         
-        hands_result = await self.db.execute(
-            select(HandAnalytics)
+        logger.info(
+            "Scanned tables for anomalies",
+            tables=len(table_ids),
+            candidates=len(candidates),
+            alerts=len(alerts),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        
+        return alerts
+    
+    async def _recent_alert_keys(self, since: datetime) -> Set[AlertKey]:
+        """Keys of the alerts raised since ``since``, for deduplication."""
+        result = await self.db.execute(
+            select(
+                AnomalyAlert.alert_type,
+                AnomalyAlert.table_id,
+                AnomalyAlert.user_id,
+                AnomalyAlert.hand_id,
+            ).where(
+                and_(
+                    AnomalyAlert.created_at >= since,
+                    AnomalyAlert.alert_type.in_(SCAN_ALERT_TYPES),
+                )
+            )
+        )
+        return {tuple(row) for row in result.all()}
+    
+    async def _scan_pot_spikes(
+        self, table_ids: List[int], since: datetime
+    ) -> List[Tuple[AlertKey, AnomalyAlert]]:
+        """Z-score the recent pots of every table against its rolling window."""
+        recency = func.row_number().over(
+            partition_by=HandAnalytics.table_id,
+            order_by=HandAnalytics.created_at.desc(),
+        )
+        recent = (
+            select(
+                HandAnalytics.table_id,
+                HandAnalytics.hand_id,
+                HandAnalytics.total_pot,
+                recency.label("recency"),
+            )
             .where(
                 and_(
-                    HandAnalytics.table_id == table_id,
-                    HandAnalytics.created_at >= hour_ago,
+                    HandAnalytics.table_id.in_(table_ids),
+                    HandAnalytics.created_at >= since,
                 )
             )
-            .order_by(HandAnalytics.created_at.desc())
-            .limit(100)
+            .subquery()
         )
-        hands = list(hands_result.scalars().all())
-        
-        # Check for pot spikes
-        for hand in hands:
-            alert = await self.detect_pot_spike(
-                table_id,
-                hand.hand_id,
-                hand.total_pot,
+        result = await self.db.execute(
+            select(recent.c.table_id, recent.c.hand_id, recent.c.total_pot).where(
+                recent.c.recency <= self.SCAN_HANDS_PER_TABLE
             )
-            if alert:
-                alerts.append(alert)
+        )
+        rows = result.all()
+        if not rows:
+            return []
         
-        # Check for timeout surges
-        alert = await self.detect_timeout_surge(table_id)
-        if alert:
-            alerts.append(alert)
+        hands = np.array(rows, dtype=np.int64)
+        hand_tables = hands[:, 0]
+        pots = hands[:, 2].astype(np.float64)
         
-        return alerts
+        # Same window as RedisAnalytics.detect_pot_spike
+        summaries = await self.redis.get_tables_window_summaries(
+            np.unique(hand_tables).tolist(), "pot_sizes", 300
+        )
+        window_tables = np.fromiter(summaries, dtype=np.int64, count=len(summaries))
+        order = np.argsort(window_tables)
+        window_tables = window_tables[order]
+        stats = np.array(
+            [(s.count, s.mean, s.stddev, s.max or 0.0) for s in summaries.values()],
+            dtype=np.float64,
+        ).reshape(-1, 4)[order]
+        
+        index = np.searchsorted(window_tables, hand_tables)
+        count, mean, stddev, max_pot = stats[index].T
+        valid = (count >= self.POT_SPIKE_MIN_SAMPLES) & (stddev > 0)
+        z_scores = np.zeros_like(pots)
+        np.divide(pots - mean, stddev, out=z_scores, where=valid)
+        
+        candidates = []
+        for i in np.flatnonzero(valid & (z_scores > self.POT_SPIKE_THRESHOLD)):
+            table_id, hand_id, pot_size = (int(v) for v in hands[i])
+            candidates.append(
+                (
+                    ("big_pot", table_id, None, hand_id),
+                    AnomalyAlert(
+                        alert_type="big_pot",
+                        severity="high",
+                        table_id=table_id,
+                        hand_id=hand_id,
+                        message=f"Pot size {pot_size} is {self.POT_SPIKE_THRESHOLD}x std dev above average",
+                        alert_metadata={
+                            "pot_size": pot_size,
+                            "avg_pot": float(mean[i]),
+                            "max_pot": float(max_pot[i]),
+                            "z_score": round(float(z_scores[i]), 2),
+                            "threshold": self.POT_SPIKE_THRESHOLD,
+                        },
+                    ),
+                )
+            )
+        return candidates
     
-    async def scan_all_active_tables(self) -> List[AnomalyAlert]:
-        """Scan all active tables for anomalies.
+    async def _scan_rapid_actions(
+        self, table_ids: List[int]
+    ) -> List[Tuple[AlertKey, AnomalyAlert]]:
+        """Flag tables whose P95 turn time is below the rapid-action limit."""
+        # Same window as RedisAnalytics.get_turn_time_p95
+        summaries = await self.redis.get_tables_window_summaries(
+            table_ids, "turn_times", 1800
+        )
+        if not summaries:
+            return []
         
-        Returns:
-            List of all detected alerts
-        """
-        # Get active tables
-        tables_result = await self.db.execute(
-            select(Table.id)
-            .where(Table.status == "active")
+        window_tables = np.fromiter(summaries, dtype=np.int64, count=len(summaries))
+        count = np.fromiter(
+            (s.count for s in summaries.values()), dtype=np.int64, count=len(summaries)
+        )
+        # Quantiles only for tables with enough turns to judge
+        sampled = count >= self.RAPID_ACTION_MIN_SAMPLES
+        p95 = np.zeros(len(summaries), dtype=np.float64)
+        for i, summary in zip(
+            np.flatnonzero(sampled), compress(summaries.values(), sampled)
+        ):
+            p95[i] = summary.quantile(0.95)
+        
+        candidates = []
+        for i in np.flatnonzero(sampled & (p95 < self.RAPID_ACTION_MS)):
+            table_id = int(window_tables[i])
+            p95_turn_time = round(float(p95[i]), 1)
+            candidates.append(
+                (
+                    ("rapid_action", table_id, None, None),
+                    AnomalyAlert(
+                        alert_type="rapid_action",
+                        severity="low",
+                        table_id=table_id,
+                        message=f"Players consistently act in <{self.RAPID_ACTION_MS}ms (P95: {p95_turn_time}ms)",
+                        alert_metadata={
+                            "p95_turn_time": p95_turn_time,
+                            "turns": int(count[i]),
+                            "threshold": self.RAPID_ACTION_MS,
+                        },
+                    ),
+                )
+            )
+        return candidates
+    
+    async def _scan_player_sessions(
+        self, table_ids: List[int], since: datetime
+    ) -> List[Tuple[AlertKey, AnomalyAlert]]:
+        """Timeout surges per player and table, VPIP/PFR mismatches per player."""
+        result = await self.db.execute(
+            select(
+                PlayerSession.user_id,
+                PlayerSession.table_id,
+                func.sum(PlayerSession.timeouts),
+                func.sum(PlayerSession.hands_played),
+                func.sum(PlayerSession.vpip_count),
+                func.sum(PlayerSession.pfr_count),
+            )
+            .where(PlayerSession.session_start >= since)
+            .group_by(PlayerSession.user_id, PlayerSession.table_id)
         )
-        table_ids = [row[0] for row in tables_result.all()]
+        rows = result.all()
+        if not rows:
+            return []
+        
+        users, tables, timeouts, hands, vpip, pfr = np.array(rows, dtype=np.int64).T
+        scanned = np.isin(tables, table_ids)
+        
+        candidates = []
+        for i in np.flatnonzero(scanned & (timeouts >= self.TIMEOUT_SURGE_THRESHOLD)):
+            table_id, user_id, total_timeouts = int(tables[i]), int(users[i]), int(timeouts[i])
+            candidates.append(
+                (
+                    ("timeout_surge", table_id, user_id, None),
+                    AnomalyAlert(
+                        alert_type="timeout_surge",
+                        severity="medium",
+                        table_id=table_id,
+                        user_id=user_id,
+                        message=f"Player has {total_timeouts} timeouts in the last hour",
+                        alert_metadata={
+                            "timeouts": total_timeouts,
+                            "threshold": self.TIMEOUT_SURGE_THRESHOLD,
+                        },
+                    ),
+                )
+            )
         
-        all_alerts = []
-        for table_id in table_ids:
-            alerts = await self.scan_table_for_anomalies(table_id)
-            all_alerts.extend(alerts)
+        # VPIP/PFR over all of a player's tables, for players on scanned tables
+        player_ids, player_index = np.unique(users, return_inverse=True)
+        player_hands = np.bincount(player_index, weights=hands)
+        on_scanned = np.bincount(player_index, weights=scanned) > 0
+        played = player_hands > 0
+        vpip_pct = np.zeros_like(player_hands)
+        pfr_pct = np.zeros_like(player_hands)
+        np.divide(
+            np.bincount(player_index, weights=vpip), player_hands, out=vpip_pct, where=played
+        )
+        np.divide(
+            np.bincount(player_index, weights=pfr), player_hands, out=pfr_pct, where=played
+        )
         
-        logger.info("Scanned tables for anomalies", tables=len(table_ids), alerts=len(all_alerts))
+        # Same rules as detect_vpip_pfr_mismatch
+        sampled = on_scanned & (player_hands >= 10)
+        pfr_over_vpip = sampled & (pfr_pct > vpip_pct + 0.05)
+        loose = sampled & ~pfr_over_vpip & (vpip_pct > 0.9)
+        tight = sampled & ~pfr_over_vpip & ~loose & (vpip_pct < 0.05) & (player_hands > 50)
+        reasons = np.select(
+            [pfr_over_vpip, loose, tight],
+            [
+                "PFR exceeds VPIP (impossible)",
+                "Extremely loose play (>90% VPIP)",
+                "Extremely tight play (<5% VPIP)",
+            ],
+            default="",
+        )
         
-        return all_alerts
+        for i in np.flatnonzero(reasons != ""):
+            user_id, reason = int(player_ids[i]), str(reasons[i])
+            candidates.append(
+                (
+                    ("vpip_mismatch", None, user_id, None),
+                    AnomalyAlert(
+                        alert_type="vpip_mismatch",
+                        severity="medium",
+                        user_id=user_id,
+                        message=f"Suspicious VPIP/PFR pattern: {reason}",
+                        alert_metadata={
+                            "vpip_pct": float(vpip_pct[i]),
+                            "pfr_pct": float(pfr_pct[i]),
+                            "hands": int(player_hands[i]),
+                            "reason": reason,
+                        },
+                    ),
+                )
+            )
+        return candidates
     
     # ==================== Alert Management ====================
     
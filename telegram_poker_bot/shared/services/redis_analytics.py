@@ -2,18 +2,96 @@
 
 Provides non-blocking atomic operations for live counters, rolling windows,
 and real-time statistics used by the admin dashboard and analytics engine.
+
+Every write (update plus trim plus expiry) is a single Lua script call, so it
+costs one round-trip and is applied atomically. Bulk reads queue all keys of
+one or many tables on a single pipeline.
+
+Rolling windows (pot sizes, turn times) are kept as time-bucketed sketches
+(see ``rolling_sketch``) rather than raw values, so p95 and z-score reads are
+a fixed number of small hash reads.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 import json
 
 import redis.asyncio as redis
 
 from telegram_poker_bot.shared.logging import get_logger
+from telegram_poker_bot.shared.services.rolling_sketch import (
+    WindowSummary,
+    bin_field,
+    bucket_starts,
+    bucket_width,
+)
 
 logger = get_logger(__name__)
 
+# INCRBY + EXPIRE; returns the new value
+_INCR_SCRIPT = """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return value
+"""
+
+# HINCRBY + EXPIRE; returns the new field value
+_HINCR_SCRIPT = """
+local value = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return value
+"""
+
+# Welford update of a sketch bucket plus its histogram bin, refresh TTL
+_SKETCH_ADD_FUNCTION = """
+local function sketch_add(key, value, bin, ttl)
+    local x = tonumber(value)
+    local state = redis.call('HMGET', key, 'n', 'mean', 'm2', 'min', 'max')
+    local n = tonumber(state[1] or '0') + 1
+    local mean = tonumber(state[2] or '0')
+    local m2 = tonumber(state[3] or '0')
+    local delta = x - mean
+    mean = mean + delta / n
+    m2 = m2 + delta * (x - mean)
+    local low = math.min(tonumber(state[4] or value), x)
+    local high = math.max(tonumber(state[5] or value), x)
+    redis.call('HSET', key, 'n', n,
+        'mean', string.format('%.17g', mean), 'm2', string.format('%.17g', m2),
+        'min', string.format('%.17g', low), 'max', string.format('%.17g', high))
+    redis.call('HINCRBY', key, bin, 1)
+    redis.call('EXPIRE', key, ttl)
+    return n
+end
+"""
+
+_SKETCH_ADD_SCRIPT = _SKETCH_ADD_FUNCTION + """
+return sketch_add(KEYS[1], ARGV[1], ARGV[2], ARGV[3])
+"""
+
+# RPUSH keeping only the last ARGV[2] items, refresh TTL
+_CAPPED_PUSH_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('LTRIM', KEYS[1], -tonumber(ARGV[2]), -1)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# Apply a finished hand to the live metrics unless its marker is already set.
+# KEYS: marker, pot window bucket, showdown flags, pot sum
+# ARGV: TTL, pot, pot bin, bucket TTL, showdown flag, showdown history
+_FINISHED_HAND_SCRIPT = _SKETCH_ADD_FUNCTION + """
+if not redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+sketch_add(KEYS[2], ARGV[2], ARGV[3], ARGV[4])
+redis.call('RPUSH', KEYS[3], ARGV[5])
+redis.call('LTRIM', KEYS[3], -tonumber(ARGV[6]), -1)
+redis.call('EXPIRE', KEYS[3], ARGV[1])
+redis.call('INCRBY', KEYS[4], ARGV[2])
+redis.call('EXPIRE', KEYS[4], ARGV[1])
+return 1
+"""
+
 
 class RedisAnalytics:
     """Redis-based real-time analytics service.
@@ -25,12 +103,9 @@ class RedisAnalytics:
     - table:{id}:analytics:timeouts
     - table:{id}:analytics:autofolds
     - table:{id}:analytics:waitlist_count
-    - table:{id}:analytics:rolling:300s:{metric}
-    - table:{id}:analytics:rolling:30min:{metric}
+    - table:{id}:analytics:rolling:{window}s:{metric}:{bucket_start}
     - table:{id}:analytics:actions_histogram
-    - table:{id}:analytics:pot_sizes
     - table:{id}:analytics:showdown_flags
-    - table:{id}:analytics:turn_times_p95
     """
 
     def __init__(self, redis_client: redis.Redis):
@@ -40,14 +115,27 @@ class RedisAnalytics:
         self.SHORT_WINDOW_TTL = 300  # 5 minutes
         self.MEDIUM_WINDOW_TTL = 1800  # 30 minutes
         self.DEFAULT_TTL = 86400  # 24 hours
+        
+        # Showdown flags kept per table
+        self.SHOWDOWN_HISTORY = 100
+        
+        self._incr_script = redis_client.register_script(_INCR_SCRIPT)
+        self._hincr_script = redis_client.register_script(_HINCR_SCRIPT)
+        self._sketch_add_script = redis_client.register_script(_SKETCH_ADD_SCRIPT)
+        self._capped_push_script = redis_client.register_script(_CAPPED_PUSH_SCRIPT)
+        self._finished_hand_script = redis_client.register_script(_FINISHED_HAND_SCRIPT)
+    
+    async def _incr(self, key: str, amount: int = 1) -> int:
+        """Increment a counter and refresh its TTL in one round-trip."""
+        value = await self._incr_script(keys=[key], args=[amount, self.DEFAULT_TTL])
+        return int(value)
     
     # ==================== Core Counters ====================
     
     async def increment_hand_count(self, table_id: int) -> int:
         """Increment live hand counter for a table."""
         key = f"table:{table_id}:analytics:hand_count_live"
-        count = await self.redis.incr(key)
-        await self.redis.expire(key, self.DEFAULT_TTL)
+        count = await self._incr(key)
         logger.debug("Incremented hand count", table_id=table_id, count=count)
         return count
     
@@ -60,9 +148,7 @@ class RedisAnalytics:
     async def add_to_pot_sum(self, table_id: int, amount: int) -> int:
         """Add to rolling pot sum."""
         key = f"table:{table_id}:analytics:pot_sum_rolling"
-        total = await self.redis.incrby(key, amount)
-        await self.redis.expire(key, self.DEFAULT_TTL)
-        return total
+        return await self._incr(key, amount)
     
     async def get_pot_sum(self, table_id: int) -> int:
         """Get current rolling pot sum."""
@@ -84,16 +170,12 @@ class RedisAnalytics:
     async def increment_timeout(self, table_id: int) -> int:
         """Increment timeout counter."""
         key = f"table:{table_id}:analytics:timeouts"
-        count = await self.redis.incr(key)
-        await self.redis.expire(key, self.DEFAULT_TTL)
-        return count
+        return await self._incr(key)
     
     async def increment_autofold(self, table_id: int) -> int:
         """Increment autofold counter."""
         key = f"table:{table_id}:analytics:autofolds"
-        count = await self.redis.incr(key)
-        await self.redis.expire(key, self.DEFAULT_TTL)
-        return count
+        return await self._incr(key)
     
     async def set_waitlist_count(self, table_id: int, count: int):
         """Set waitlist count."""
@@ -115,7 +197,7 @@ class RedisAnalytics:
         value: float,
         window_seconds: int = 300
     ):
-        """Add value to rolling window using sorted set with timestamp scores.
+        """Add value to the current time bucket of a rolling window sketch.
         
         Args:
             table_id: Table ID
@@ -123,33 +205,37 @@ class RedisAnalytics:
             value: Value to add
             window_seconds: Window size in seconds (300 or 1800)
         """
-        window_label = f"{window_seconds}s"
-        key = f"table:{table_id}:analytics:rolling:{window_label}:{metric}"
+        now = datetime.now().timestamp()
+        key = self._window_keys(table_id, metric, window_seconds, now)[0]
         
-        score = datetime.now().timestamp()
-        await self.redis.zadd(key, {str(value): score})
-        
-        # Remove old entries
-        cutoff = score - window_seconds
-        await self.redis.zremrangebyscore(key, 0, cutoff)
-        
-        # Set expiration
-        ttl = window_seconds * 2  # Keep for double the window
-        await self.redis.expire(key, ttl)
+        # A bucket is read until it slides out of the window
+        ttl = window_seconds + bucket_width(window_seconds)
+        await self._sketch_add_script(keys=[key], args=[value, bin_field(value), ttl])
     
-    async def get_rolling_window_values(
+    @staticmethod
+    def _window_keys(
+        table_id: int,
+        metric: str,
+        window_seconds: int,
+        now: Optional[float] = None,
+    ) -> List[str]:
+        """Bucket keys covering a rolling window, newest first."""
+        if now is None:
+            now = datetime.now().timestamp()
+        prefix = f"table:{table_id}:analytics:rolling:{window_seconds}s:{metric}"
+        return [f"{prefix}:{start}" for start in bucket_starts(window_seconds, now)]
+    
+    async def get_rolling_window_summary(
         self,
         table_id: int,
         metric: str,
         window_seconds: int = 300
-    ) -> List[float]:
-        """Get all values in rolling window."""
-        window_label = f"{window_seconds}s"
-        key = f"table:{table_id}:analytics:rolling:{window_label}:{metric}"
-        
-        # Get all members
-        members = await self.redis.zrange(key, 0, -1)
-        return [float(m.decode()) for m in members]
+    ) -> WindowSummary:
+        """Merge the bucket sketches of a rolling window (one pipeline)."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key in self._window_keys(table_id, metric, window_seconds):
+            pipe.hgetall(key)
+        return WindowSummary.from_buckets(await pipe.execute())
     
     async def get_rolling_window_stats(
         self,
@@ -157,26 +243,16 @@ class RedisAnalytics:
         metric: str,
         window_seconds: int = 300
     ) -> Dict[str, float]:
-        """Get statistics for rolling window (avg, min, max, count)."""
-        values = await self.get_rolling_window_values(table_id, metric, window_seconds)
-        
-        if not values:
-            return {"count": 0, "avg": 0.0, "min": 0.0, "max": 0.0}
-        
-        return {
-            "count": len(values),
-            "avg": sum(values) / len(values),
-            "min": min(values),
-            "max": max(values),
-        }
+        """Get statistics for rolling window (count, avg, min, max, stddev)."""
+        summary = await self.get_rolling_window_summary(table_id, metric, window_seconds)
+        return summary.as_stats()
     
     # ==================== Actions Histogram ====================
     
     async def record_action(self, table_id: int, action_type: str):
         """Record an action in the histogram."""
         key = f"table:{table_id}:analytics:actions_histogram"
-        await self.redis.hincrby(key, action_type, 1)
-        await self.redis.expire(key, self.DEFAULT_TTL)
+        await self._hincr_script(keys=[key], args=[action_type, 1, self.DEFAULT_TTL])
     
     async def get_actions_histogram(self, table_id: int) -> Dict[str, int]:
         """Get actions histogram."""
@@ -191,7 +267,10 @@ class RedisAnalytics:
         AFq = (bets + raises) / (calls + folds)
         """
         histogram = await self.get_actions_histogram(table_id)
-        
+        return self._aggression_metrics(histogram)
+    
+    @staticmethod
+    def _aggression_metrics(histogram: Dict[str, int]) -> Dict[str, float]:
         bets = histogram.get("bet", 0)
         raises = histogram.get("raise", 0)
         calls = histogram.get("call", 0)
@@ -232,37 +311,90 @@ class RedisAnalytics:
         Returns True if pot is more than std_dev_threshold standard deviations
         above the rolling average.
         """
-        values = await self.get_rolling_window_values(table_id, "pot_sizes", 300)
+        summary = await self.get_rolling_window_summary(table_id, "pot_sizes", 300)
         
-        if len(values) < 5:  # Need enough data
+        if summary.count < 5:  # Need enough data
             return False
         
-        import statistics
-        avg = statistics.mean(values)
-        std_dev = statistics.stdev(values)
-        
+        std_dev = summary.stddev
         if std_dev == 0:
             return False
         
-        z_score = (current_pot - avg) / std_dev
+        z_score = (current_pot - summary.mean) / std_dev
         return z_score > std_dev_threshold
     
+    # ==================== Finished Hands ====================
+    
+    @staticmethod
+    def _finished_hand_marker(hand_id: int) -> str:
+        return f"analytics:hand:{hand_id}:live"
+    
+    async def record_finished_hand(
+        self,
+        table_id: int,
+        hand_id: int,
+        pot_size: int,
+        went_to_showdown: bool,
+    ) -> bool:
+        """Add a finished hand's pot and showdown to the live metrics once.
+        
+        Pot window, showdown flags and pot sum are updated in one script
+        together with a per-hand marker, so a redelivered hand is a no-op.
+        
+        Returns:
+            True if the hand was applied, False if it already had been
+        """
+        now = datetime.now().timestamp()
+        window_key = self._window_keys(table_id, "pot_sizes", 300, now)[0]
+        applied = await self._finished_hand_script(
+            keys=[
+                self._finished_hand_marker(hand_id),
+                window_key,
+                f"table:{table_id}:analytics:showdown_flags",
+                f"table:{table_id}:analytics:pot_sum_rolling",
+            ],
+            args=[
+                self.DEFAULT_TTL,
+                pot_size,
+                bin_field(float(pot_size)),
+                300 + bucket_width(300),
+                1 if went_to_showdown else 0,
+                self.SHOWDOWN_HISTORY,
+            ],
+        )
+        return bool(applied)
+    
+    async def get_unapplied_hands(self, hand_ids: Iterable[int]) -> List[int]:
+        """Hands not yet applied with ``record_finished_hand`` (one pipeline)."""
+        hand_ids = list(hand_ids)
+        if not hand_ids:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        for hand_id in hand_ids:
+            pipe.exists(self._finished_hand_marker(hand_id))
+        applied = await pipe.execute()
+        return [hand_id for hand_id, done in zip(hand_ids, applied) if not done]
+    
     # ==================== Showdown Tracking ====================
     
     async def record_showdown(self, table_id: int, went_to_showdown: bool):
         """Record whether hand went to showdown."""
         key = f"table:{table_id}:analytics:showdown_flags"
-        await self.redis.rpush(key, 1 if went_to_showdown else 0)
         
-        # Keep only recent 100 hands
-        await self.redis.ltrim(key, -100, -1)
-        await self.redis.expire(key, self.DEFAULT_TTL)
+        # Keep only the most recent hands
+        await self._capped_push_script(
+            keys=[key],
+            args=[1 if went_to_showdown else 0, self.SHOWDOWN_HISTORY, self.DEFAULT_TTL],
+        )
     
     async def get_showdown_frequency(self, table_id: int) -> float:
         """Get showdown frequency (percentage of hands going to showdown)."""
         key = f"table:{table_id}:analytics:showdown_flags"
         flags = await self.redis.lrange(key, 0, -1)
-        
+        return self._showdown_frequency(flags)
+    
+    @staticmethod
+    def _showdown_frequency(flags: List[Any]) -> float:
         if not flags:
             return 0.0
         
@@ -276,32 +408,104 @@ class RedisAnalytics:
         await self.add_to_rolling_window(table_id, "turn_times", float(turn_time_ms), 1800)
     
     async def get_turn_time_p95(self, table_id: int) -> float:
-        """Get 95th percentile turn time."""
-        values = await self.get_rolling_window_values(table_id, "turn_times", 1800)
-        
-        if not values:
-            return 0.0
-        
-        values.sort()
-        p95_index = int(len(values) * 0.95)
-        return values[p95_index] if p95_index < len(values) else values[-1]
+        """Get 95th percentile turn time (within the sketch accuracy)."""
+        summary = await self.get_rolling_window_summary(table_id, "turn_times", 1800)
+        return summary.quantile(0.95)
     
     # ==================== Bulk Operations ====================
     
     async def get_all_table_metrics(self, table_id: int) -> Dict[str, Any]:
-        """Get all metrics for a table at once (efficient bulk read)."""
+        """Get all metrics for a table at once (one pipelined round-trip)."""
+        metrics = await self.get_tables_metrics([table_id])
+        return metrics[table_id]
+    
+    async def get_tables_window_summaries(
+        self,
+        table_ids: Iterable[int],
+        metric: str,
+        window_seconds: int = 300,
+    ) -> Dict[int, WindowSummary]:
+        """Merge one rolling window for many tables in one round-trip."""
+        table_ids = list(dict.fromkeys(table_ids))
+        if not table_ids:
+            return {}
+        
+        now = datetime.now().timestamp()
+        pipe = self.redis.pipeline(transaction=False)
+        for table_id in table_ids:
+            for key in self._window_keys(table_id, metric, window_seconds, now):
+                pipe.hgetall(key)
+        results = await pipe.execute()
+        
+        buckets = len(bucket_starts(window_seconds, now))
         return {
-            "hand_count": await self.get_hand_count(table_id),
-            "pot_sum": await self.get_pot_sum(table_id),
-            "active_seats": await self.get_active_seats(table_id),
-            "waitlist_count": await self.get_waitlist_count(table_id),
-            "actions_histogram": await self.get_actions_histogram(table_id),
-            "aggression_metrics": await self.calculate_aggression_metrics(table_id),
-            "recent_pot_stats": await self.get_recent_pot_stats(table_id),
-            "showdown_frequency": await self.get_showdown_frequency(table_id),
-            "turn_time_p95": await self.get_turn_time_p95(table_id),
+            table_id: WindowSummary.from_buckets(
+                results[index * buckets:(index + 1) * buckets]
+            )
+            for index, table_id in enumerate(table_ids)
         }
     
+    async def get_tables_metrics(self, table_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get all metrics for many tables in one round-trip.
+        
+        All raw reads for every table are queued on a single non-transactional
+        pipeline; derived values (aggression, pot stats, p95) are computed
+        locally from the results.
+        
+        Returns:
+            Dict of table_id -> metrics (hand_count, pot_sum, active_seats,
+            waitlist_count, actions_histogram, aggression_metrics,
+            recent_pot_stats, showdown_frequency, turn_time_p95)
+        """
+        table_ids = list(dict.fromkeys(table_ids))
+        if not table_ids:
+            return {}
+        
+        now = datetime.now().timestamp()
+        pipe = self.redis.pipeline(transaction=False)
+        for table_id in table_ids:
+            prefix = f"table:{table_id}:analytics"
+            pipe.get(f"{prefix}:hand_count_live")
+            pipe.get(f"{prefix}:pot_sum_rolling")
+            pipe.get(f"{prefix}:active_seats")
+            pipe.get(f"{prefix}:waitlist_count")
+            pipe.hgetall(f"{prefix}:actions_histogram")
+            pipe.lrange(f"{prefix}:showdown_flags", 0, -1)
+            for key in self._window_keys(table_id, "pot_sizes", 300, now):
+                pipe.hgetall(key)
+            for key in self._window_keys(table_id, "turn_times", 1800, now):
+                pipe.hgetall(key)
+        results = await pipe.execute()
+        
+        buckets = len(bucket_starts(300, now))
+        per_table = 6 + 2 * buckets
+        metrics: Dict[int, Dict[str, Any]] = {}
+        for index, table_id in enumerate(table_ids):
+            row = results[index * per_table:(index + 1) * per_table]
+            (
+                hand_count,
+                pot_sum,
+                active_seats,
+                waitlist_count,
+                histogram,
+                showdown_flags,
+            ) = row[:6]
+            pot_sizes = WindowSummary.from_buckets(row[6:6 + buckets])
+            turn_times = WindowSummary.from_buckets(row[6 + buckets:])
+            histogram = {k.decode(): int(v) for k, v in histogram.items()}
+            metrics[table_id] = {
+                "hand_count": int(hand_count) if hand_count else 0,
+                "pot_sum": int(pot_sum) if pot_sum else 0,
+                "active_seats": int(active_seats) if active_seats else 0,
+                "waitlist_count": int(waitlist_count) if waitlist_count else 0,
+                "actions_histogram": histogram,
+                "aggression_metrics": self._aggression_metrics(histogram),
+                "recent_pot_stats": pot_sizes.as_stats(),
+                "showdown_frequency": self._showdown_frequency(showdown_flags),
+                "turn_time_p95": turn_times.quantile(0.95),
+            }
+        return metrics
+    
     async def flush_table_counters(self, table_id: int) -> Dict[str, Any]:
         """Flush all counters for a table and return their values.
         
@@ -0,0 +1,139 @@
+"""Mergeable rolling-window summaries for Redis analytics.
+
+A rolling window is split into ``SKETCH_BUCKETS`` time buckets, each a Redis
+hash holding:
+
+- Welford moments of the bucket: ``n``, ``mean``, ``m2``, plus ``min``/``max``
+- a DDSketch histogram: field ``b:{index}`` counts values whose logarithmic
+  bin is ``index`` (relative accuracy ``SKETCH_RELATIVE_ACCURACY``), field
+  ``z`` counts values <= 0
+
+Writes touch only the current bucket. Reads fetch the buckets covering the
+window and merge them here, so quantiles and z-scores cost a fixed number of
+hash reads however many values the window holds. Every sample is counted,
+including repeated values.
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional
+
+SKETCH_BUCKETS = 10
+SKETCH_RELATIVE_ACCURACY = 0.01
+
+_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+ZERO_BIN = "z"
+_BIN_PREFIX = "b:"
+
+
+def bin_field(value: float) -> str:
+    """Histogram field a value is counted in."""
+    if value <= 0:
+        return ZERO_BIN
+    return f"{_BIN_PREFIX}{math.ceil(math.log(value) / _LOG_GAMMA)}"
+
+
+def _bin_value(index: int) -> float:
+    """Representative value of a bin (within the relative accuracy)."""
+    return 2 * _GAMMA ** index / (_GAMMA + 1)
+
+
+def bucket_width(window_seconds: int) -> int:
+    return max(1, window_seconds // SKETCH_BUCKETS)
+
+
+def bucket_starts(window_seconds: int, now: float) -> List[int]:
+    """Start times of the buckets covering ``[now - window, now]``, newest first."""
+    width = bucket_width(window_seconds)
+    current = int(now // width) * width
+    return [current - i * width for i in range(SKETCH_BUCKETS + 1)]
+
+
+class WindowSummary:
+    """Moments and histogram of a window, merged from bucket hashes."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.zero_count = 0
+        self.bins: Dict[int, int] = {}
+
+    @classmethod
+    def from_buckets(cls, buckets: List[Mapping[Any, Any]]) -> "WindowSummary":
+        summary = cls()
+        for bucket in buckets:
+            if bucket:
+                summary.merge_bucket(bucket)
+        return summary
+
+    def merge_bucket(self, bucket: Mapping[Any, Any]) -> None:
+        """Merge one bucket hash (raw ``HGETALL`` result)."""
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): float(v)
+            for k, v in bucket.items()
+        }
+        count = int(fields.get("n", 0))
+        if count <= 0:
+            return
+
+        # Chan et al. parallel combination of Welford moments
+        total = self.count + count
+        delta = fields.get("mean", 0.0) - self.mean
+        self.mean += delta * count / total
+        self.m2 += fields.get("m2", 0.0) + delta * delta * self.count * count / total
+        self.count = total
+
+        low, high = fields.get("min"), fields.get("max")
+        if low is not None and (self.min is None or low < self.min):
+            self.min = low
+        if high is not None and (self.max is None or high > self.max):
+            self.max = high
+
+        for name, value in fields.items():
+            if name == ZERO_BIN:
+                self.zero_count += int(value)
+            elif name.startswith(_BIN_PREFIX):
+                index = int(name[len(_BIN_PREFIX):])
+                self.bins[index] = self.bins.get(index, 0) + int(value)
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation (like ``statistics.stdev``)."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(self.m2, 0.0) / (self.count - 1))
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile (0 when the window is empty)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        value = 0.0
+        if seen <= rank:
+            for index in sorted(self.bins):
+                value = _bin_value(index)
+                seen += self.bins[index]
+                if seen > rank:
+                    break
+        # The sketch is relative; the exact extremes are known
+        if self.min is not None:
+            value = max(value, self.min)
+        if self.max is not None:
+            value = min(value, self.max)
+        return value
+
+    def as_stats(self) -> Dict[str, float]:
+        if self.count == 0:
+            return {"count": 0, "avg": 0.0, "min": 0.0, "max": 0.0, "stddev": 0.0}
+        return {
+            "count": self.count,
+            "avg": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "stddev": self.stddev,
+        }
@@ -361,6 +361,18 @@ async def _refresh_table_runtime(db: AsyncSession, table_id: int) -> None:
     await game_runtime.refresh_table_runtime(db, table_id)
 
 
+async def _schedule_table_timers(table_id: int, *kind_names: str) -> None:
+    """Lazy import to avoid circular dependency with game_core timers."""
+
+    from telegram_poker_bot.game_core.deadline_scheduler import (
+        TableTimerKind,
+        schedule_table_timer,
+    )
+
+    for kind_name in kind_names:
+        await schedule_table_timer(table_id, TableTimerKind(kind_name))
+
+
 async def _load_table_with_template(db: AsyncSession, table_id: int) -> Table:
     """Helper to load a table with its template eager-loaded."""
 
@@ -825,6 +837,8 @@ async def create_table(
     )
 
     await _refresh_table_runtime(db, table.id)
+    # Pre-start expiry and empty-table checks
+    await _schedule_table_timers(table.id, "lifecycle")
 
     if auto_seat_creator and creator_user_id is not None:
         try:
@@ -1055,6 +1069,7 @@ async def seat_user_at_table(
 
     # Trigger SNG logic if applicable
     await sng_manager.on_player_seated(db, table)
+    await _schedule_table_timers(table_id, "autostart", "lifecycle")
 
     return seat
 
@@ -1172,6 +1187,7 @@ async def leave_table(
     )
 
     await _refresh_table_runtime(db, table_id)
+    await _schedule_table_timers(table_id, "lifecycle")
 
     return seat
 
@@ -12,7 +12,6 @@ from telegram_poker_bot.shared.models import (
     Seat,
     Table,
     Hand,
-    Action,
     TableStatus,
     UserPokerStats,
     TableTemplateType,
@@ -57,8 +56,8 @@ async def get_user_stats_from_aggregated(
         - best_hand_rank: Best hand achieved
         - tables_played: 0 (not tracked in aggregated stats)
         - total_profit: Same as total_winnings for now
-        - biggest_pot: 0 (not tracked in aggregated stats)
-        - current_streak: 0 (not tracked in aggregated stats)
+        - biggest_pot: Largest pot won
+        - current_streak: Current winning (positive) or losing (negative) streak
         - first_game_date: None (not tracked in aggregated stats)
     """
     result = await db.execute(
@@ -97,11 +96,11 @@ async def get_user_stats_from_aggregated(
         "pfr": round(pfr, 2),
         "total_winnings": stats.total_winnings,
         "best_hand_rank": stats.best_hand_rank,
+        "biggest_pot": stats.biggest_pot,
+        "current_streak": stats.current_streak,
         # Legacy fields - not tracked in aggregated stats
         "tables_played": 0,
         "total_profit": stats.total_winnings,  # Approximate with total_winnings
-        "biggest_pot": 0,
-        "current_streak": 0,
         "first_game_date": None,
     }
 
@@ -110,6 +109,9 @@ async def get_user_stats(db: AsyncSession, user_id: int) -> Dict[str, Any]:
     """
     Get comprehensive user statistics.
 
+    Hand counters come from the user's ``UserPokerStats`` row; table
+    participation comes from one aggregate over their seats.
+
     Returns:
         Dict containing:
         - hands_played: Total hands played
@@ -119,58 +121,37 @@ async def get_user_stats(db: AsyncSession, user_id: int) -> Dict[str, Any]:
         - win_rate: Percentage of hands won
         - current_streak: Current winning/losing streak
     """
-    # Get all seats for this user
-    result = await db.execute(select(Seat).where(Seat.user_id == user_id))
-    seats = result.scalars().all()
-
-    if not seats:
-        return {
-            "hands_played": 0,
-            "tables_played": 0,
-            "total_profit": 0,
-            "biggest_pot": 0,
-            "win_rate": 0.0,
-            "current_streak": 0,
-            "first_game_date": None,
-        }
-
-    # Count tables
-    table_ids = set(seat.table_id for seat in seats)
-    tables_played = len(table_ids)
+    # Starting chips are not recorded per seat yet
+    starting_chips = 10000  # TODO: Get from table config
+    result = await db.execute(
+        select(
+            func.count(func.distinct(Seat.table_id)),
+            func.coalesce(
+                func.sum(Seat.chips - starting_chips).filter(
+                    Seat.left_at.is_not(None)
+                ),
+                0,
+            ),
+            func.min(Seat.joined_at),
+        ).where(Seat.user_id == user_id)
+    )
+    tables_played, total_profit, first_game_date = result.one()
 
-    # Count hands played (actions taken)
     result = await db.execute(
-        select(func.count(Action.id)).where(Action.user_id == user_id)
+        select(UserPokerStats).where(UserPokerStats.user_id == user_id)
     )
-    hands_played = result.scalar() or 0
-
-    # Calculate profit/loss (difference between starting chips and final chips)
-    total_profit = 0
-    for seat in seats:
-        if seat.left_at:  # Only count completed sessions
-            # Starting chips from config
-            starting_chips = 10000  # TODO: Get from table config
-            final_chips = seat.chips
-            total_profit += final_chips - starting_chips
-
-    # Get user's custom stats blob if exists
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    stats_blob = (user.stats_blob or {}) if user else {}
+    stats = result.scalar_one_or_none()
 
-    # Get first game date (earliest seat join)
-    first_game_date = None
-    if seats:
-        first_seat = min(seats, key=lambda s: s.joined_at)
-        first_game_date = first_seat.joined_at
+    hands_played = stats.total_hands if stats else 0
+    win_rate = (stats.wins / hands_played * 100) if hands_played > 0 else 0.0
 
     return {
         "hands_played": hands_played,
         "tables_played": tables_played,
-        "total_profit": total_profit,
-        "biggest_pot": stats_blob.get("biggest_pot", 0),
-        "win_rate": stats_blob.get("win_rate", 0.0),
-        "current_streak": stats_blob.get("current_streak", 0),
+        "total_profit": int(total_profit),
+        "biggest_pot": stats.biggest_pot if stats else 0,
+        "win_rate": win_rate,
+        "current_streak": stats.current_streak if stats else 0,
         "first_game_date": first_game_date,
     }
 
@@ -348,14 +329,16 @@ async def apply_hand_result_to_wallets_and_stats(
     hand_result: Dict[str, Any],
 ) -> None:
     """
-    Apply hand result to user wallets and stats.
+    Apply hand result to user wallets.
 
     This function:
     1. Ensures all affected users have wallets
     2. Computes profit/loss for each user based on chip changes
     3. Updates wallet balances using wallet_service
     4. Creates transaction records
-    5. Updates user stats
+
+    Per-user stats live in ``UserPokerStats`` and are advanced with one bulk
+    upsert by ``StatsProcessor.update_stats`` in the hand-completion batch.
 
     Args:
         db: Database session
@@ -364,84 +347,28 @@ async def apply_hand_result_to_wallets_and_stats(
         seats: List of Seat records for players in the hand
         hand_result: Hand result dict with winners info (post-rake amounts)
     """
-    from telegram_poker_bot.shared.services.wallet_service import record_game_win
+    from telegram_poker_bot.shared.services.wallet_service import record_game_wins
 
     currency_type = get_table_currency_type(table)
 
     # Get all winners from hand_result
     winners = hand_result.get("winners", [])
-    winner_user_ids = {w["user_id"] for w in winners}
     winner_amounts = {w["user_id"]: w["amount"] for w in winners}
-
-    # For each seat, determine their profit/loss
-    for seat in seats:
-        user_id = seat.user_id
-
-        # Calculate profit/loss for this specific hand
-        # Winner amounts represent chips won in this hand (already post-rake)
-        hand_profit = winner_amounts.get(user_id, 0)
-
-        # Use wallet_service to record game wins
-        if hand_profit > 0:
-            await record_game_win(
-                db=db,
-                user_id=user_id,
-                amount=hand_profit,
-                hand_id=hand.id,
-                table_id=table.id,
-                currency_type=currency_type,
-                reference_id=f"hand_{hand.hand_no}",
-            )
-
-    # Update user stats for all participants
-    for seat in seats:
-        user_id = seat.user_id
-
-        # Get current stats
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-        if not user:
-            continue
-
-        stats_blob = user.stats_blob or {}
-
-        # Increment hands played
-        stats_blob["hands_played"] = stats_blob.get("hands_played", 0) + 1
-
-        # Update win count if user won
-        if user_id in winner_user_ids:
-            stats_blob["hands_won"] = stats_blob.get("hands_won", 0) + 1
-            hand_profit = winner_amounts.get(user_id, 0)
-
-            # Update total profit
-            stats_blob["total_profit"] = stats_blob.get("total_profit", 0) + hand_profit
-
-            # Update biggest pot
-            if hand_profit > stats_blob.get("biggest_pot", 0):
-                stats_blob["biggest_pot"] = hand_profit
-
-            # Update winning streak
-            current_streak = stats_blob.get("current_streak", 0)
-            if current_streak >= 0:
-                stats_blob["current_streak"] = current_streak + 1
-            else:
-                stats_blob["current_streak"] = 1
-        else:
-            # Lost hand - update losing streak
-            current_streak = stats_blob.get("current_streak", 0)
-            if current_streak <= 0:
-                stats_blob["current_streak"] = current_streak - 1
-            else:
-                stats_blob["current_streak"] = -1
-
-        # Calculate win rate
-        hands_played = stats_blob.get("hands_played", 1)
-        hands_won = stats_blob.get("hands_won", 0)
-        stats_blob["win_rate"] = (
-            (hands_won / hands_played * 100) if hands_played > 0 else 0.0
-        )
-
-        # Save updated stats
-        user.stats_blob = stats_blob
+    participant_ids = {seat.user_id for seat in seats}
+
+    # Record game wins for every seated winner in one locked batch.
+    # Winner amounts represent chips won in this hand (already post-rake)
+    await record_game_wins(
+        db=db,
+        amounts={
+            user_id: amount
+            for user_id, amount in winner_amounts.items()
+            if user_id in participant_ids
+        },
+        hand_id=hand.id,
+        table_id=table.id,
+        currency_type=currency_type,
+        reference_id=f"hand_{hand.hand_no}",
+    )
 
     await db.flush()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -283,6 +283,70 @@ async def record_game_win(
     )
 
 
+async def record_game_wins(
+    db: AsyncSession,
+    amounts: Dict[int, int],
+    hand_id: int,
+    table_id: int,
+    currency_type: CurrencyType,
+    reference_id: Optional[str] = None,
+) -> None:
+    """Record game wins for several users with a single locking query.
+
+    Equivalent to calling ``record_game_win`` per user, but locks all winner
+    rows in one ``SELECT ... FOR UPDATE`` (ordered by id to avoid deadlocks)
+    and adds every transaction in one batch.
+    """
+    amounts = {user_id: amount for user_id, amount in amounts.items() if amount > 0}
+    if not amounts:
+        return
+
+    result = await db.execute(
+        select(User)
+        .where(User.id.in_(amounts.keys()))
+        .order_by(User.id)
+        .with_for_update()
+    )
+    users = {user.id: user for user in result.scalars().all()}
+    missing = set(amounts) - set(users)
+    if missing:
+        raise ValueError(f"Users {sorted(missing)} not found")
+
+    balance_field = _get_balance_field(currency_type)
+    transactions = []
+    for user_id, amount in amounts.items():
+        user = users[user_id]
+        if user.balance_real is None:
+            user.balance_real = settings.initial_balance_cents
+        if user.balance_play is None:
+            user.balance_play = DEFAULT_PLAY_BALANCE
+        new_balance = getattr(user, balance_field) + amount
+        setattr(user, balance_field, new_balance)
+        transactions.append(
+            Transaction(
+                user_id=user_id,
+                amount=amount,
+                balance_after=new_balance,
+                type=TransactionType.GAME_WIN,
+                hand_id=hand_id,
+                table_id=table_id,
+                reference_id=reference_id or f"hand_{hand_id}",
+                metadata_json={"hand_id": hand_id, "table_id": table_id},
+                currency_type=currency_type,
+            )
+        )
+    db.add_all(transactions)
+
+    logger.info(
+        "Recorded game wins",
+        hand_id=hand_id,
+        table_id=table_id,
+        winners=len(transactions),
+        total_amount=sum(amounts.values()),
+        currency_type=currency_type.value,
+    )
+
+
 async def record_rake(
     db: AsyncSession,
     amount: int,
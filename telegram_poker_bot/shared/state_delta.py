@@ -0,0 +1,74 @@
+"""JSON-patch style diffs for table state payloads.
+
+Shared by the API (which sends deltas over the table WebSocket) and by
+WebSocket clients (which apply them). Operations follow RFC 6902 naming and
+JSON-pointer paths (``{"op": "replace", "path": "/players/2/stack",
+"value": 950}``). Lists are diffed element-wise when their length is
+unchanged and replaced wholesale otherwise, which keeps patches small for
+table state (fixed seat lists, growing boards) without a sequence diff.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List
+
+PatchOp = Dict[str, Any]
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_state(old: Any, new: Any, path: str = "") -> List[PatchOp]:
+    """Return the operations that turn ``old`` into ``new``."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[PatchOp] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_state(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            ops.extend(diff_state(old_item, new_item, f"{path}/{index}"))
+        return ops
+
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_delta(state: Any, ops: List[PatchOp]) -> Any:
+    """Apply operations from ``diff_state`` to a copy of ``state``."""
+    result = copy.deepcopy(state)
+    for op in ops:
+        path = op["path"]
+        if path == "":
+            result = copy.deepcopy(op.get("value"))
+            continue
+
+        tokens = [_unescape(token) for token in path.split("/")[1:]]
+        parent = result
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            last = int(last)
+
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op.get("value"))
+    return result